@@ -1,6 +1,7 @@
 """
 Enhanced collection logic with proper validation and retry
 """
+from collections import defaultdict
 from typing import List, Dict, Set, Tuple
 from datetime import date, datetime
 import logging
@@ -75,10 +76,8 @@ def collect_missing_strikes_only(breeze, db_manager, request_date: date, symbol:
     logger.info(f"Collecting {len(missing_strikes)} missing strike/type combinations")
     
     # Group by strike for efficient processing
-    strikes_to_collect = {}
+    strikes_to_collect = defaultdict(list)
     for strike, option_type in missing_strikes:
-        if strike not in strikes_to_collect:
-            strikes_to_collect[strike] = []
         strikes_to_collect[strike].append(option_type)
     
     # Use parallel processing for missing strikes only
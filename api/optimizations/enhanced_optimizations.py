@@ -3,6 +3,7 @@ Enhanced optimizations for options collection
 """
 import queue
 import threading
+from collections import defaultdict
 from typing import List, Dict, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
@@ -259,12 +260,9 @@ def bulk_insert_options(db_manager, records: List[dict]) -> int:
         return 0
     
     # Group by trading symbol for efficient duplicate checking
-    records_by_symbol = {}
+    records_by_symbol = defaultdict(list)
     for record in records:
-        symbol = record.get('trading_symbol')
-        if symbol not in records_by_symbol:
-            records_by_symbol[symbol] = []
-        records_by_symbol[symbol].append(record)
+        records_by_symbol[record.get('trading_symbol')].append(record)
     
     total_added = 0
     
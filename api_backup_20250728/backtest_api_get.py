@@ -2,18 +2,145 @@
 Fresh API server with working backtest endpoint
 Run this instead of the main API server
 """
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, Query, Depends
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, date
+from functools import lru_cache
 from typing import List, Dict
 import asyncio
+import hashlib
+import os
+import orjson
 import uvicorn
+from sqlalchemy.orm import selectinload
 
-app = FastAPI(title="Working Backtest API", version="1.0.0")
+from src.infrastructure.database.database_manager import get_db_manager
+from src.infrastructure.services.data_collection_service import DataCollectionService
+from src.infrastructure.services.breeze_service import BreezeService
+from src.infrastructure.services.option_pricing_service import OptionPricingService
+from src.application.use_cases.run_backtest import RunBacktestUseCase, BacktestParameters
+from src.infrastructure.database.models import BacktestRun, BacktestTrade
+from src.utils.market_hours import MARKET_OPEN, MARKET_CLOSE
+from src.infrastructure.cache.smart_cache import LRUCache
+
+app = FastAPI(title="Working Backtest API", version="1.0.0", default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Signal lists for every combination of the S1..S8 flags, indexed by bitmask
+SIGNAL_TABLE = [
+    tuple(f"S{i + 1}" for i in range(8) if mask & (1 << i))
+    for mask in range(256)
+]
+
+# Backtests currently running, and recently finished responses, keyed by parameters
+RESULT_CACHE_TTL_SECONDS = 60
+_inflight: Dict[str, asyncio.Future] = {}
+_recent_results = LRUCache(max_size=32)
+
+def _params_key(params: BacktestParameters) -> str:
+    """Stable hash of the backtest parameters"""
+    payload = orjson.dumps(vars(params), default=str, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+@lru_cache(maxsize=1)
+def get_breeze_service() -> BreezeService:
+    return BreezeService()
+
+@lru_cache(maxsize=1)
+def get_data_collection_service() -> DataCollectionService:
+    return DataCollectionService(get_breeze_service(), get_db_manager())
+
+@lru_cache(maxsize=1)
+def get_option_pricing_service() -> OptionPricingService:
+    return OptionPricingService(get_data_collection_service(), get_db_manager())
+
+@app.on_event("startup")
+def warm_services():
+    """Build shared services before the first request arrives"""
+    get_option_pricing_service()
 
 @app.get("/")
 async def root():
     return {"message": "Working Backtest API", "docs": "Visit /docs for Swagger UI"}
 
+def _to_float(value, default=0.0):
+    """Nullable DECIMAL column as a float, with a default in place of NULL"""
+    return float(value) if value is not None else default
+
+def _load_results(backtest_id: str, lot_size: int) -> Dict:
+    """Package a finished run; blocking ORM work kept off the event loop"""
+    db = get_db_manager()
+    with db.get_session() as session:
+        run = session.query(BacktestRun).options(
+            selectinload(BacktestRun.trades).selectinload(BacktestTrade.positions)
+        ).filter_by(id=backtest_id).first()
+        
+        trade_details = [
+            {
+                "signal": trade.signal_type,
+                "entry_time": str(trade.entry_time),
+                "outcome": trade.outcome.value,
+                "pnl": _to_float(trade.total_pnl),
+                "positions": [
+                    {
+                        "type": pos.position_type,
+                        "action": "SELL" if pos.quantity < 0 else "BUY",
+                        "lots": abs(pos.quantity) // lot_size,
+                        "quantity": abs(pos.quantity),
+                        "strike": pos.strike_price,
+                        "option_type": pos.option_type
+                    }
+                    for pos in trade.positions
+                ]
+            }
+            for trade in run.trades
+        ]
+        
+        return {
+            "results": {
+                "total_trades": run.total_trades,
+                "winning_trades": run.winning_trades,
+                "losing_trades": run.losing_trades,
+                "win_rate": _to_float(run.win_rate),
+                "initial_capital": float(run.initial_capital),
+                "final_capital": float(run.final_capital),
+                "total_pnl": _to_float(run.total_pnl)
+            },
+            "configuration": {
+                "lot_size": run.lot_size,
+                "lots_traded": run.lots_to_trade,
+                "total_quantity_per_trade": run.lot_size * run.lots_to_trade,
+                "hedge_offset": run.hedge_offset,
+                "commission_per_lot": float(run.commission_per_lot)
+            },
+            "trades": trade_details
+        }
+
+async def _execute_backtest(
+    key: str,
+    params: BacktestParameters,
+    request_params: Dict,
+    data_svc: DataCollectionService,
+    option_svc: OptionPricingService
+) -> Dict:
+    """Run one backtest and build its response"""
+    # The use case keeps per-run weekly context, so only the services are shared
+    backtest = RunBacktestUseCase(data_svc, option_svc)
+    backtest_id = await backtest.execute(params)
+    
+    # Get results
+    results = await asyncio.to_thread(_load_results, backtest_id, params.lot_size)
+    
+    response = {
+        "success": True,
+        "backtest_id": backtest_id,
+        "request_params": request_params,
+        **results
+    }
+    _recent_results.set(key, response, ttl=RESULT_CACHE_TTL_SECONDS)
+    return response
+
 @app.get("/backtest")
 async def run_backtest(
     from_date: date = Query(default=date(2025, 7, 14), description="Start date (YYYY-MM-DD)"),
@@ -31,7 +158,9 @@ async def run_backtest(
     signal_s5: bool = Query(default=True, description="Test signal S5"),
     signal_s6: bool = Query(default=True, description="Test signal S6"),
     signal_s7: bool = Query(default=True, description="Test signal S7"),
-    signal_s8: bool = Query(default=True, description="Test signal S8")
+    signal_s8: bool = Query(default=True, description="Test signal S8"),
+    data_svc: DataCollectionService = Depends(get_data_collection_service),
+    option_svc: OptionPricingService = Depends(get_option_pricing_service)
 ) -> Dict:
     """
     Run backtest with custom parameters
@@ -40,35 +169,14 @@ async def run_backtest(
     Default values are set for July 14, 2025 with 10 lots.
     """
     
-    # Import at runtime to avoid any caching
-    from src.infrastructure.database.database_manager import get_db_manager
-    from src.infrastructure.services.data_collection_service import DataCollectionService
-    from src.infrastructure.services.breeze_service import BreezeService
-    from src.infrastructure.services.option_pricing_service import OptionPricingService
-    from src.application.use_cases.run_backtest import RunBacktestUseCase, BacktestParameters
-    from src.infrastructure.database.models import BacktestRun, BacktestTrade, BacktestPosition
-    
     # Build signals list
-    signals_to_test = []
-    if signal_s1: signals_to_test.append("S1")
-    if signal_s2: signals_to_test.append("S2")
-    if signal_s3: signals_to_test.append("S3")
-    if signal_s4: signals_to_test.append("S4")
-    if signal_s5: signals_to_test.append("S5")
-    if signal_s6: signals_to_test.append("S6")
-    if signal_s7: signals_to_test.append("S7")
-    if signal_s8: signals_to_test.append("S8")
-    
-    # Create fresh instances
-    db = get_db_manager()
-    breeze = BreezeService()
-    data_svc = DataCollectionService(breeze, db)
-    option_svc = OptionPricingService(data_svc, db)
-    backtest = RunBacktestUseCase(data_svc, option_svc)
+    mask = (signal_s1 | signal_s2 << 1 | signal_s3 << 2 | signal_s4 << 3 |
+            signal_s5 << 4 | signal_s6 << 5 | signal_s7 << 6 | signal_s8 << 7)
+    signals_to_test = list(SIGNAL_TABLE[mask])
     
     # Convert dates to datetime
-    from_datetime = datetime.combine(from_date, datetime.strptime("09:15", "%H:%M").time())
-    to_datetime = datetime.combine(to_date, datetime.strptime("15:30", "%H:%M").time())
+    from_datetime = datetime.combine(from_date, MARKET_OPEN)
+    to_datetime = datetime.combine(to_date, MARKET_CLOSE)
     
     # Create parameters
     params = BacktestParameters(
@@ -84,64 +192,28 @@ async def run_backtest(
         slippage_percent=0.001
     )
     
-    # Run backtest
-    backtest_id = await backtest.execute(params)
+    # Identical requests share one execution and briefly reuse its response
+    key = _params_key(params)
+    cached = _recent_results.get(key)
+    if cached is not None:
+        return cached
     
-    # Get results
-    with db.get_session() as session:
-        run = session.query(BacktestRun).filter_by(id=backtest_id).first()
-        trades = session.query(BacktestTrade).filter_by(backtest_run_id=backtest_id).all()
-        
-        trade_details = []
-        for trade in trades:
-            positions = session.query(BacktestPosition).filter_by(trade_id=trade.id).all()
-            
-            pos_details = []
-            for pos in positions:
-                pos_details.append({
-                    "type": pos.position_type,
-                    "action": "SELL" if pos.quantity < 0 else "BUY",
-                    "lots": abs(pos.quantity) // lot_size,
-                    "quantity": abs(pos.quantity),
-                    "strike": pos.strike_price,
-                    "option_type": pos.option_type
-                })
-            
-            trade_details.append({
-                "signal": trade.signal_type,
-                "entry_time": str(trade.entry_time),
-                "outcome": trade.outcome.value,
-                "pnl": float(trade.total_pnl) if trade.total_pnl else 0,
-                "positions": pos_details
-            })
-        
-        return {
-            "success": True,
-            "backtest_id": backtest_id,
-            "request_params": {
-                "from_date": str(from_date),
-                "to_date": str(to_date),
-                "lots_to_trade": lots_to_trade,
-                "signals_tested": signals_to_test
-            },
-            "results": {
-                "total_trades": run.total_trades,
-                "winning_trades": run.winning_trades,
-                "losing_trades": run.losing_trades,
-                "win_rate": float(run.win_rate) if run.win_rate else 0,
-                "initial_capital": float(run.initial_capital),
-                "final_capital": float(run.final_capital),
-                "total_pnl": float(run.total_pnl) if run.total_pnl else 0
-            },
-            "configuration": {
-                "lot_size": run.lot_size,
-                "lots_traded": run.lots_to_trade,
-                "total_quantity_per_trade": run.lot_size * run.lots_to_trade,
-                "hedge_offset": run.hedge_offset,
-                "commission_per_lot": float(run.commission_per_lot)
-            },
-            "trades": trade_details
+    future = _inflight.get(key)
+    if future is None:
+        request_params = {
+            "from_date": str(from_date),
+            "to_date": str(to_date),
+            "lots_to_trade": lots_to_trade,
+            "signals_tested": signals_to_test
         }
+        future = asyncio.ensure_future(
+            _execute_backtest(key, params, request_params, data_svc, option_svc)
+        )
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    
+    # Shield so one client disconnecting does not cancel the run for the others
+    return await asyncio.shield(future)
 
 if __name__ == "__main__":
     print("Starting Fresh API Server with Working Backtest Endpoint")
@@ -151,4 +223,11 @@ if __name__ == "__main__":
     print("="*60)
     
     # Run on different port to avoid conflicts
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # An import string lets uvicorn spawn workers; uvloop/httptools are picked up when installed
+    uvicorn.run(
+        "backtest_api_get:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host="0.0.0.0",
+        port=8001,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    )
\ No newline at end of file
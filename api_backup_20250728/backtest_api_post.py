@@ -1,8 +1,14 @@
 """Simple API that works correctly with all fixes"""
-from fastapi import FastAPI, HTTPException
-from datetime import datetime
-from typing import List
+from fastapi import FastAPI, HTTPException, Depends
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from datetime import date, datetime, time
+import os
+from functools import lru_cache
+from typing import List, Literal
+import orjson
 import uvicorn
+from sqlalchemy import select
 
 from src.infrastructure.services.breeze_service import BreezeService
 from src.infrastructure.services.data_collection_service import DataCollectionService
@@ -11,31 +17,124 @@ from src.infrastructure.database.database_manager import get_db_manager
 from src.application.use_cases.run_backtest import RunBacktestUseCase, BacktestParameters
 from src.infrastructure.database.models import BacktestRun, BacktestTrade
 
-app = FastAPI(title="Simple Backtest API")
+app = FastAPI(title="Simple Backtest API", default_response_class=ORJSONResponse)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+@lru_cache(maxsize=1)
+def get_breeze_service() -> BreezeService:
+    return BreezeService()
+
+@lru_cache(maxsize=1)
+def get_data_collection_service() -> DataCollectionService:
+    return DataCollectionService(get_breeze_service(), get_db_manager())
+
+@lru_cache(maxsize=1)
+def get_option_pricing_service() -> OptionPricingService:
+    return OptionPricingService(get_data_collection_service(), get_db_manager())
+
+@app.on_event("startup")
+def warm_services():
+    """Build shared services before the first request arrives"""
+    get_option_pricing_service()
+
+@app.on_event("shutdown")
+async def close_pools():
+    """Release pooled async connections"""
+    await get_db_manager().close_async()
+
+def _to_float(value, default=0):
+    """Convert a nullable DECIMAL column for orjson, which cannot encode Decimal"""
+    return float(value) if value is not None else default
+
+TRADE_COLUMNS = (
+    "signal_type", "entry_time", "exit_time", "exit_reason",
+    "stop_loss", "index_at_entry", "index_at_exit", "total_pnl"
+)
+
+def _trade_statement(backtest_id: str):
+    """Trade columns only, so rows skip ORM instance hydration"""
+    return select(
+        BacktestTrade.signal_type,
+        BacktestTrade.entry_time,
+        BacktestTrade.exit_time,
+        BacktestTrade.exit_reason,
+        BacktestTrade.stop_loss_price,
+        BacktestTrade.index_price_at_entry,
+        BacktestTrade.index_price_at_exit,
+        BacktestTrade.total_pnl
+    ).where(
+        BacktestTrade.backtest_run_id == backtest_id
+    )
+
+def _trade_row(row) -> tuple:
+    """Convert a trade row to JSON-ready values"""
+    signal_type, entry_time, exit_time, exit_reason, stop_loss, \
+        index_at_entry, index_at_exit, total_pnl = row
+    return (signal_type, entry_time, exit_time, exit_reason, float(stop_loss),
+            float(index_at_entry), _to_float(index_at_exit, None), _to_float(total_pnl))
+
+def _run_summary(backtest_id: str, run) -> dict:
+    """Run-level totals shared by the JSON and NDJSON responses"""
+    return {
+        "success": True,
+        "backtest_id": backtest_id,
+        "total_trades": run.total_trades if run else 0,
+        "winning_trades": run.winning_trades if run else 0,
+        "losing_trades": run.losing_trades if run else 0,
+        "total_pnl": _to_float(run.total_pnl) if run else 0,
+        "final_capital": _to_float(run.final_capital, 500000) if run else 500000
+    }
+
+async def _load_results(backtest_id: str, columnar: bool = False) -> dict:
+    """Package a finished run over the pooled async engine"""
+    async with get_db_manager().get_async_session() as session:
+        run = await session.get(BacktestRun, backtest_id)
+        result = await session.execute(_trade_statement(backtest_id))
+        trades = [_trade_row(row) for row in result]
+    
+    if columnar:
+        columns = [list(column) for column in zip(*trades)] or [[] for _ in TRADE_COLUMNS]
+        trade_payload = {
+            "columns": list(TRADE_COLUMNS),
+            "data": dict(zip(TRADE_COLUMNS, columns))
+        }
+    else:
+        trade_payload = [dict(zip(TRADE_COLUMNS, trade)) for trade in trades]
+    
+    return {**_run_summary(backtest_id, run), "trades": trade_payload}
+
+async def _stream_results(backtest_id: str):
+    """NDJSON lines: the run summary first, then one trade per line"""
+    async with get_db_manager().get_async_session() as session:
+        run = await session.get(BacktestRun, backtest_id)
+        yield orjson.dumps(_run_summary(backtest_id, run)) + b"\n"
+        result = await session.stream(
+            _trade_statement(backtest_id).execution_options(yield_per=500)
+        )
+        async for row in result:
+            yield orjson.dumps(dict(zip(TRADE_COLUMNS, _trade_row(row)))) + b"\n"
 
 @app.post("/backtest")
 async def run_backtest(
-    from_date: str = "2025-07-14",
-    to_date: str = "2025-07-18",
+    from_date: date = date(2025, 7, 14),
+    to_date: date = date(2025, 7, 18),
     lot_size: int = 75,
     lots_to_trade: int = 10,
-    signals_to_test: List[str] = ["S1"]
+    signals_to_test: List[str] = ["S1"],
+    columnar: bool = False,
+    format: Literal["json", "ndjson"] = "json",
+    data_collection: DataCollectionService = Depends(get_data_collection_service),
+    option_pricing: OptionPricingService = Depends(get_option_pricing_service)
 ):
     """Run backtest with all fixes applied"""
     try:
-        # Create services directly
-        db_manager = get_db_manager()
-        breeze_service = BreezeService()
-        data_collection = DataCollectionService(breeze_service, db_manager)
-        option_pricing = OptionPricingService(data_collection, db_manager)
-        
-        # Create use case
+        # The use case keeps per-run weekly context, so only the services are shared
         backtest_uc = RunBacktestUseCase(data_collection, option_pricing)
         
         # Create parameters
         params = BacktestParameters(
-            from_date=datetime.strptime(from_date, "%Y-%m-%d").replace(hour=9, minute=0),
-            to_date=datetime.strptime(to_date, "%Y-%m-%d").replace(hour=16, minute=0),
+            from_date=datetime.combine(from_date, time(9, 0)),
+            to_date=datetime.combine(to_date, time(16, 0)),
             initial_capital=500000,
             lot_size=lot_size,
             lots_to_trade=lots_to_trade,
@@ -49,36 +148,11 @@ async def run_backtest(
         print(f"Running backtest from {params.from_date} to {params.to_date}")
         backtest_id = await backtest_uc.execute(params)
         
-        # Get results
-        with db_manager.get_session() as session:
-            run = session.query(BacktestRun).filter_by(id=backtest_id).first()
-            trades = session.query(BacktestTrade).filter_by(backtest_run_id=backtest_id).all()
-            
-            result = {
-                "success": True,
-                "backtest_id": backtest_id,
-                "total_trades": run.total_trades if run else 0,
-                "winning_trades": run.winning_trades if run else 0,
-                "losing_trades": run.losing_trades if run else 0,
-                "total_pnl": float(run.total_pnl) if run and run.total_pnl else 0,
-                "final_capital": float(run.final_capital) if run and run.final_capital else 500000,
-                "trades": []
-            }
-            
-            for trade in trades:
-                result["trades"].append({
-                    "signal_type": trade.signal_type,
-                    "entry_time": trade.entry_time.isoformat(),
-                    "exit_time": trade.exit_time.isoformat() if trade.exit_time else None,
-                    "exit_reason": trade.exit_reason,
-                    "stop_loss": float(trade.stop_loss_price),
-                    "index_at_entry": float(trade.index_price_at_entry),
-                    "index_at_exit": float(trade.index_price_at_exit) if trade.index_price_at_exit else None,
-                    "total_pnl": float(trade.total_pnl) if trade.total_pnl else 0
-                })
-            
-            return result
-            
+        if format == "ndjson":
+            return StreamingResponse(_stream_results(backtest_id), media_type="application/x-ndjson")
+        
+        return await _load_results(backtest_id, columnar)
+        
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -89,4 +163,11 @@ if __name__ == "__main__":
     print("===================================")
     print("Swagger UI: http://localhost:8002/docs")
     print("===================================\n")
-    uvicorn.run(app, host="0.0.0.0", port=8002)
\ No newline at end of file
+    # An import string lets uvicorn spawn workers; uvloop/httptools are picked up when installed
+    uvicorn.run(
+        "backtest_api_post:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host="0.0.0.0",
+        port=8002,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    )
\ No newline at end of file
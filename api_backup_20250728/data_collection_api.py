@@ -2,16 +2,31 @@
 Simplified API with both sync and async endpoints for NIFTY data collection
 """
 from fastapi import FastAPI, BackgroundTasks, Query, HTTPException
+import anyio
+import aiohttp
+import asyncio
 from pydantic import BaseModel
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date, datetime, timedelta
 import os
 from dotenv import load_dotenv
 from breeze_connect import BreezeConnect
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
 import time
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, FrozenSet, Optional, List, Tuple
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import repeat
+import pandas as pd
+from sqlalchemy import Date, cast, delete, func, select
 
 # Import enhanced optimizations
 try:
@@ -24,15 +39,44 @@ except ImportError:
 
 # Import database components
 from src.infrastructure.database.database_manager import get_db_manager
+from src.infrastructure.database.bulk_operations import bulk_insert, column_values
+from src.infrastructure.database.job_store import JobStore, ProgressReporter
 from src.infrastructure.database.models import NiftyIndexData, OptionsHistoricalData
+from src.infrastructure.database.models.options_data_model import parse_breeze_timestamp
 from src.infrastructure.services.hourly_aggregation_service import HourlyAggregationService
+from src.infrastructure.services.holiday_service import HolidayService
+from src.utils.market_hours import BREEZE_DATA_END_REGULAR, BREEZE_DATA_START_REGULAR, is_within_market_hours
 
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging; records are queued and written to stderr by a background thread
+# so collection loops never block on the console
+log_queue = queue.Queue(-1)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+log_stream_handler = logging.StreamHandler()
+log_stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+log_listener = QueueListener(log_queue, log_stream_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Concurrent Breeze fetches for options collection, throttled to the API's request rate
+BREEZE_WORKERS = int(os.getenv('BREEZE_WORKERS', '8'))
+BREEZE_REQUESTS_PER_SECOND = float(os.getenv('BREEZE_REQUESTS_PER_SECOND', '10'))
+
+# Set BREEZE_ASYNC_FETCH=1 to fetch option strikes on an aiohttp event loop instead of worker threads
+BREEZE_ASYNC_FETCH = os.getenv('BREEZE_ASYNC_FETCH', '0') == '1'
+BREEZE_HISTORICAL_URL = "https://breezeapi.icicidirect.com/api/v2/historicalcharts"
+
+# Bulk NIFTY ranges longer than this are collected across a process pool
+PROCESS_POOL_MIN_DAYS = 30
+
+# Offset from midnight to the last representable instant of the same day
+ONE_DAY_INCLUSIVE = timedelta(days=1) - timedelta(microseconds=1)
+
+# 5-minute candles in a full NIFTY session (9:15-15:30 or extended 9:20-15:35)
+EXPECTED_RECORDS_PER_DAY = 76
+
 # Optimization level configuration
 # 0 = Original (sequential), 1 = Optimized (5 workers), 2 = Ultra (all optimizations)
 OPTIMIZATION_LEVEL = int(os.getenv('OPTIONS_OPTIMIZATION_LEVEL', '2'))
@@ -66,8 +110,60 @@ app = FastAPI(
     ]
 )
 
-# Global status tracker for background jobs
-job_status: Dict[str, dict] = {}
+# Background job status, shared by all worker processes
+job_store = JobStore()
+
+class PooledRequests:
+    """Stands in for the requests module inside breeze_connect so its calls reuse keep-alive connections"""
+    
+    HTTP_METHODS = {'get', 'post', 'put', 'delete'}
+    
+    def __init__(self, session: requests.Session):
+        self.session = session
+    
+    def __getattr__(self, name):
+        if name in self.HTTP_METHODS:
+            return getattr(self.session, name)
+        return getattr(requests, name)
+
+def pool_breeze_http():
+    """Route the Breeze SDK's module-level requests calls through one pooled session"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=max(32, BREEZE_WORKERS),
+        # Retry only idempotent methods (urllib3's default), so order placement is never replayed
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    sys.modules[BreezeConnect.__module__].requests = PooledRequests(session)
+
+pool_breeze_http()
+
+# One authenticated Breeze client per process
+_breeze_lock = threading.Lock()
+_breeze: Optional[BreezeConnect] = None
+
+def create_breeze() -> BreezeConnect:
+    """Build a Breeze client and open its session"""
+    breeze = BreezeConnect(api_key=os.getenv('BREEZE_API_KEY'))
+    try:
+        breeze.generate_session(
+            api_secret=os.getenv('BREEZE_API_SECRET'),
+            session_token=os.getenv('BREEZE_API_SESSION')
+        )
+    except Exception as e:
+        logger.info(f"Session notice: {e}")
+    return breeze
+
+def get_breeze() -> BreezeConnect:
+    """Return the shared Breeze client, creating it on first use"""
+    global _breeze
+    if _breeze is None:
+        with _breeze_lock:
+            if _breeze is None:
+                _breeze = create_breeze()
+    return _breeze
 
 class CollectNiftyRequest(BaseModel):
     from_date: date
@@ -87,8 +183,19 @@ class DeleteDataRequest(BaseModel):
     to_date: date
     symbol: str = "NIFTY"
 
+@app.on_event("startup")
+def size_threadpool():
+    """Blocking routes and background jobs share AnyIO's threadpool; keep room for concurrent collections"""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, BREEZE_WORKERS * 2)
+
+@app.on_event("startup")
+def connect_breeze():
+    """Authenticate once before the first collection request"""
+    get_breeze()
+
 @app.get("/")
-def root():
+async def root():
     return {
         "message": "Market Data Collection API", 
         "version": "4.1.0",
@@ -115,185 +222,211 @@ def root():
         "docs": "Visit /docs for interactive API documentation"
     }
 
-def collect_nifty_data_sync(request: CollectNiftyRequest) -> dict:
-    """Synchronous data collection logic"""
-    # Initialize database
-    db_manager = get_db_manager()
-    hourly_service = HourlyAggregationService(db_manager)
-    
-    # Initialize Breeze once
-    breeze = BreezeConnect(api_key=os.getenv('BREEZE_API_KEY'))
+def load_trading_holidays(from_date: date, to_date: date) -> FrozenSet[date]:
+    """NSE trading holidays in the range; collection proceeds without them if the calendar is unavailable"""
     try:
-        breeze.generate_session(
-            api_secret=os.getenv('BREEZE_API_SECRET'),
-            session_token=os.getenv('BREEZE_API_SESSION')
-        )
+        return frozenset(HolidayService().get_holiday_dates_in_range(from_date, to_date, "NSE"))
     except Exception as e:
-        logger.info(f"Session notice: {e}")
+        logger.warning(f"Holiday calendar unavailable, only weekends will be skipped: {e}")
+        return frozenset()
+
+# 5-minute columns read by HourlyAggregationService.create_hourly_bars_from_5min
+HOURLY_SOURCE_COLUMNS = (
+    NiftyIndexData.symbol,
+    NiftyIndexData.timestamp,
+    NiftyIndexData.open,
+    NiftyIndexData.high,
+    NiftyIndexData.low,
+    NiftyIndexData.close,
+    NiftyIndexData.volume
+)
+
+def collect_nifty_day(current_date: date, request: CollectNiftyRequest, holidays: FrozenSet[date] = frozenset()) -> dict:
+    """Collect one day's 5-minute bars and hourly aggregates; safe to run in a worker process"""
+    # Skip weekends
+    if current_date.weekday() >= 5:  # 5=Saturday, 6=Sunday
+        logger.info(f"{current_date}: Weekend, skipping")
+        return {
+            "date": current_date.isoformat(),
+            "status": "skipped",
+            "reason": "weekend"
+        }
     
-    # Process date range
-    current_date = request.from_date
-    total_added_5min = 0
-    total_added_hourly = 0
-    total_skipped = 0
-    total_skipped_days = 0
-    total_weekend_days = 0
-    total_processed = 0
-    errors = []
-    daily_results = []
+    # Skip exchange holidays without calling Breeze
+    if current_date in holidays:
+        logger.info(f"{current_date}: Trading holiday, skipping")
+        return {
+            "date": current_date.isoformat(),
+            "status": "skipped",
+            "reason": "holiday"
+        }
     
-    while current_date <= request.to_date:
-        try:
-            # Skip weekends
-            if current_date.weekday() >= 5:  # 5=Saturday, 6=Sunday
-                logger.info(f"{current_date}: Weekend, skipping")
-                total_weekend_days += 1
-                daily_results.append({
-                    "date": current_date.isoformat(),
-                    "status": "skipped",
-                    "reason": "weekend"
-                })
-                current_date += timedelta(days=1)
-                continue
-            
-            # Check if data already exists for this date
-            from_datetime = datetime.combine(current_date, datetime.min.time())
-            to_datetime = datetime.combine(current_date, datetime.max.time())
-            
-            with db_manager.get_session() as session:
-                existing_5min = session.query(NiftyIndexData).filter(
+    try:
+        # Database and Breeze are per-process singletons
+        db_manager = get_db_manager()
+        hourly_service = HourlyAggregationService(db_manager)
+        breeze = get_breeze()
+        
+        # Check if data already exists for this date
+        from_datetime = datetime(current_date.year, current_date.month, current_date.day)
+        to_datetime = from_datetime + ONE_DAY_INCLUSIVE
+        day_iso = current_date.isoformat()
+        
+        with db_manager.get_session() as session:
+            interval_counts = dict(session.query(
+                NiftyIndexData.interval,
+                func.count()
+            ).filter(
+                NiftyIndexData.symbol == request.symbol,
+                NiftyIndexData.interval.in_(["5minute", "hourly"]),
+                NiftyIndexData.timestamp >= from_datetime,
+                NiftyIndexData.timestamp <= to_datetime
+            ).group_by(NiftyIndexData.interval).all())
+        
+        existing_5min = interval_counts.get("5minute", 0)
+        existing_hourly = interval_counts.get("hourly", 0)
+        
+        # Skip if data is complete and force_refresh is False
+        # Note: Breeze API sometimes only provides data up to 15:25
+        # Consider data complete if we have at least 73 records (minimum expected)
+        if existing_5min >= 73 and existing_hourly == 7 and not request.force_refresh:
+            logger.info(f"{current_date}: Data already complete, skipping")
+            return {
+                "date": current_date.isoformat(),
+                "status": "skipped",
+                "reason": "data_already_complete"
+            }
+        
+        logger.info(f"Processing {current_date}...")
+        
+        # Fetch data
+        breeze_rate_limiter.acquire()
+        result = breeze.get_historical_data_v2(
+            interval="5minute",
+            from_date=f"{day_iso}T00:00:00.000Z",
+            to_date=f"{day_iso}T23:59:59.000Z",
+            stock_code=request.symbol,
+            exchange_code="NSE",
+            product_type="cash"
+        )
+        
+        if not (result and 'Success' in result):
+            return {
+                "date": current_date.isoformat(),
+                "status": "no_data"
+            }
+        
+        records = result['Success']
+        day_added_5min = 0
+        
+        # Store 5-minute data
+        with db_manager.get_session() as session:
+            # One lookup of the day's stored timestamps instead of one per record
+            existing_timestamps = {
+                timestamp for (timestamp,) in session.query(NiftyIndexData.timestamp).filter(
                     NiftyIndexData.symbol == request.symbol,
                     NiftyIndexData.interval == "5minute",
                     NiftyIndexData.timestamp >= from_datetime,
                     NiftyIndexData.timestamp <= to_datetime
-                ).count()
-                
-                existing_hourly = session.query(NiftyIndexData).filter(
-                    NiftyIndexData.symbol == request.symbol,
-                    NiftyIndexData.interval == "hourly",
-                    NiftyIndexData.timestamp >= from_datetime,
-                    NiftyIndexData.timestamp <= to_datetime
-                ).count()
-            
-            # Skip if data is complete and force_refresh is False
-            # Note: Breeze API sometimes only provides data up to 15:25
-            # Consider data complete if we have at least 73 records (minimum expected)
-            if existing_5min >= 73 and existing_hourly == 7 and not request.force_refresh:
-                logger.info(f"{current_date}: Data already complete, skipping")
-                total_skipped_days += 1
-                daily_results.append({
-                    "date": current_date.isoformat(),
-                    "status": "skipped",
-                    "reason": "data_already_complete"
-                })
-                current_date += timedelta(days=1)
-                continue
+                )
+            }
             
-            logger.info(f"Processing {current_date}...")
+            rows = []
+            new_bars = []
+            for record in records:
+                try:
+                    nifty_data = NiftyIndexData.from_breeze_data(record, request.symbol, request.extended_hours)
+                    if nifty_data is None or nifty_data.timestamp in existing_timestamps:
+                        continue
+                    
+                    existing_timestamps.add(nifty_data.timestamp)
+                    rows.append(column_values(nifty_data))
+                    new_bars.append(nifty_data)
+                except Exception as e:
+                    logger.debug(f"Error processing record: {e}")
             
-            # Fetch data
-            result = breeze.get_historical_data_v2(
-                interval="5minute",
-                from_date=from_datetime.strftime("%Y-%m-%dT00:00:00.000Z"),
-                to_date=to_datetime.strftime("%Y-%m-%dT23:59:59.000Z"),
-                stock_code=request.symbol,
-                exchange_code="NSE",
-                product_type="cash"
-            )
+            bulk_insert(session, NiftyIndexData, rows)
+            day_added_5min = len(rows)
+        
+        # Create hourly aggregations
+        day_added_hourly = 0
+        if day_added_5min > 0 or existing_5min > 0:
+            logger.info(f"Creating hourly aggregations for {current_date}...")
             
-            if result and 'Success' in result:
-                records = result['Success']
-                day_added_5min = 0
-                day_skipped = 0
-                
-                # Store 5-minute data
+            if existing_5min == 0:
+                # The bars just inserted are the whole day
+                five_min_data = sorted(new_bars, key=lambda bar: bar.timestamp)
+            else:
+                # Only the columns the aggregator reads, as plain rows rather than ORM objects
                 with db_manager.get_session() as session:
-                    for record in records:
-                        try:
-                            nifty_data = NiftyIndexData.from_breeze_data(record, request.symbol, request.extended_hours)
-                            if nifty_data is None:
-                                day_skipped += 1
-                                continue
-                            
-                            exists = session.query(NiftyIndexData).filter(
-                                NiftyIndexData.symbol == request.symbol,
-                                NiftyIndexData.timestamp == nifty_data.timestamp,
-                                NiftyIndexData.interval == "5minute"
-                            ).first()
-                            
-                            if not exists:
-                                session.add(nifty_data)
-                                day_added_5min += 1
-                            else:
-                                day_skipped += 1
-                        except Exception as e:
-                            logger.error(f"Error processing record: {e}")
-                    
-                    session.commit()
-                
-                # Create hourly aggregations
-                day_added_hourly = 0
-                if day_added_5min > 0 or existing_5min > 0:
-                    logger.info(f"Creating hourly aggregations for {current_date}...")
-                    
-                    with db_manager.get_session() as session:
-                        five_min_data = session.query(NiftyIndexData).filter(
+                    five_min_data = session.execute(
+                        select(*HOURLY_SOURCE_COLUMNS).where(
                             NiftyIndexData.symbol == request.symbol,
                             NiftyIndexData.interval == "5minute",
                             NiftyIndexData.timestamp >= from_datetime,
                             NiftyIndexData.timestamp <= to_datetime
-                        ).order_by(NiftyIndexData.timestamp).all()
-                        
-                        if five_min_data:
-                            hourly_candles = hourly_service.create_hourly_bars_from_5min(five_min_data)
-                            
-                            for candle in hourly_candles:
-                                if hourly_service.store_hourly_candle(candle):
-                                    day_added_hourly += 1
-                
-                # Update totals
-                total_added_5min += day_added_5min
-                total_added_hourly += day_added_hourly
-                total_skipped += day_skipped
-                total_processed += len(records)
-                
-                daily_results.append({
-                    "date": current_date.isoformat(),
-                    "status": "processed",
-                    "added_5min": day_added_5min,
-                    "added_hourly": day_added_hourly
-                })
-                
-                logger.info(f"{current_date}: Added {day_added_5min} 5-min, {day_added_hourly} hourly")
-            else:
-                daily_results.append({
-                    "date": current_date.isoformat(),
-                    "status": "no_data"
-                })
-                
-        except Exception as e:
-            logger.error(f"{current_date}: {str(e)}")
-            errors.append(f"{current_date}: {str(e)}")
-            daily_results.append({
-                "date": current_date.isoformat(),
-                "status": "error",
-                "error": str(e)
-            })
+                        ).order_by(NiftyIndexData.timestamp)
+                    ).all()
+            
+            if five_min_data:
+                hourly_candles = hourly_service.create_hourly_bars_from_5min(five_min_data)
+                day_added_hourly = hourly_service.store_hourly_candles(hourly_candles)
         
-        current_date += timedelta(days=1)
+        logger.info(f"{current_date}: Added {day_added_5min} 5-min, {day_added_hourly} hourly")
+        return {
+            "date": current_date.isoformat(),
+            "status": "processed",
+            "added_5min": day_added_5min,
+            "added_hourly": day_added_hourly
+        }
+        
+    except Exception as e:
+        logger.error(f"{current_date}: {str(e)}")
+        return {
+            "date": current_date.isoformat(),
+            "status": "error",
+            "error": str(e)
+        }
+
+def collect_nifty_data_sync(request: CollectNiftyRequest, use_process_pool: bool = False) -> dict:
+    """
+    Synchronous data collection logic
     
-    # Calculate statistics
+    Days are independent, so long ranges can be spread over a process pool
+    when use_process_pool is set.
+    """
     total_days = (request.to_date - request.from_date).days + 1
+    days = [request.from_date + timedelta(days=offset) for offset in range(total_days)]
+    holidays = load_trading_holidays(request.from_date, request.to_date)
+    
+    # SQLite serializes writers, so extra processes would only contend for its lock
+    database_url = get_db_manager().settings.database.connection_string
+    if use_process_pool and total_days > PROCESS_POOL_MIN_DAYS and not database_url.startswith("sqlite"):
+        workers = min(8, os.cpu_count() or 1)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_collection_worker,
+            initargs=(workers,)
+        ) as executor:
+            daily_results = list(executor.map(collect_nifty_day, days, repeat(request), repeat(holidays), chunksize=4))
+    else:
+        daily_results = [collect_nifty_day(day, request, holidays) for day in days]
+    
+    total_skipped_days = sum(1 for day in daily_results if day.get("reason") == "data_already_complete")
+    total_weekend_days = sum(1 for day in daily_results if day.get("reason") == "weekend")
+    total_holidays = sum(1 for day in daily_results if day.get("reason") == "holiday")
+    errors = [f"{day['date']}: {day['error']}" for day in daily_results if day["status"] == "error"]
     
     return {
         "status": "success",
         "summary": {
             "total_days": total_days,
-            "days_processed": total_days - total_skipped_days - total_weekend_days,
+            "days_processed": total_days - total_skipped_days - total_weekend_days - total_holidays,
             "days_skipped_complete": total_skipped_days,
             "days_skipped_weekend": total_weekend_days,
-            "total_added_5min": total_added_5min,
-            "total_added_hourly": total_added_hourly
+            "days_skipped_holiday": total_holidays,
+            "total_added_5min": sum(day.get("added_5min", 0) for day in daily_results),
+            "total_added_hourly": sum(day.get("added_hourly", 0) for day in daily_results)
         },
         "daily_results": daily_results,
         "errors": errors if errors else None
@@ -313,12 +446,14 @@ def collect_nifty_direct(request: CollectNiftyRequest):
 def run_bulk_collection(request: CollectNiftyRequest, job_id: str):
     """Background task for bulk collection with optimization"""
     try:
-        job_status[job_id]["status"] = "running"
-        job_status[job_id]["start_time"] = datetime.now().isoformat()
-        
-        # Add progress tracking fields
-        job_status[job_id]["progress"] = 0
-        job_status[job_id]["current_batch"] = None
+        job_store.update(
+            job_id,
+            status="running",
+            start_time=datetime.now().isoformat(),
+            # Progress tracking fields
+            progress=0,
+            current_batch=None
+        )
         
         # Choose optimization level
         if OPTIMIZATION_LEVEL >= 2 and ULTRA_OPTIMIZED_AVAILABLE:
@@ -326,15 +461,17 @@ def run_bulk_collection(request: CollectNiftyRequest, job_id: str):
             result = collect_nifty_data_ultra_optimized(request, job_id)
         else:
             logger.info(f"Using original NIFTY collection for job {job_id}")
-            result = collect_nifty_data_sync(request)
+            result = collect_nifty_data_sync(request, use_process_pool=True)
         
-        job_status[job_id]["status"] = "completed"
-        job_status[job_id]["end_time"] = datetime.now().isoformat()
-        job_status[job_id]["result"] = result
+        job_store.update(
+            job_id,
+            status="completed",
+            end_time=datetime.now().isoformat(),
+            result=result
+        )
         
     except Exception as e:
-        job_status[job_id]["status"] = "failed"
-        job_status[job_id]["error"] = str(e)
+        job_store.update(job_id, status="failed", error=str(e))
         logger.error(f"Bulk collection failed: {e}")
 
 @app.post("/api/v1/collect/nifty-bulk", tags=["NIFTY Collection"])
@@ -349,11 +486,11 @@ async def collect_nifty_bulk(request: CollectNiftyRequest, background_tasks: Bac
     job_id = f"job_{int(time.time())}_{request.symbol}"
     
     # Initialize job status
-    job_status[job_id] = {
+    await anyio.to_thread.run_sync(job_store.create, job_id, {
         "status": "queued",
         "request": request.dict(),
         "created_at": datetime.now().isoformat()
-    }
+    })
     
     # Start background task
     background_tasks.add_task(run_bulk_collection, request, job_id)
@@ -367,8 +504,18 @@ async def collect_nifty_bulk(request: CollectNiftyRequest, background_tasks: Bac
         "check_status_at": f"/api/v1/status/{job_id}"
     }
 
+@app.post("/api/v1/breeze/refresh", tags=["System"])
+def refresh_breeze_session():
+    """Re-authenticate the shared Breeze client, e.g. after the session token rotates"""
+    global _breeze
+    load_dotenv(override=True)
+    breeze = create_breeze()
+    with _breeze_lock:
+        _breeze = breeze
+    return {"status": "refreshed"}
+
 @app.get("/api/v1/cache/stats", tags=["System"])
-def get_cache_statistics():
+async def get_cache_statistics():
     """Get cache statistics"""
     if ULTRA_OPTIMIZED_AVAILABLE:
         stats = get_cache_stats()
@@ -383,13 +530,14 @@ def get_cache_statistics():
         }
 
 @app.get("/api/v1/status/{job_id}", tags=["Job Management"])
-def get_job_status(job_id: str):
+async def get_job_status(job_id: str):
     """Get status of a bulk collection job"""
     
-    if job_id not in job_status:
+    job = await anyio.to_thread.run_sync(job_store.get, job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    return job_status[job_id]
+    return job
 
 @app.get("/api/v1/data/check", tags=["Data Check"])
 def check_data_availability(
@@ -407,39 +555,40 @@ def check_data_availability(
     """
     db_manager = get_db_manager()
     
+    # Bucket the whole range by day in one query
+    with db_manager.get_session() as session:
+        day = cast(NiftyIndexData.timestamp, Date)
+        counts = dict(session.query(day, func.count()).filter(
+            NiftyIndexData.symbol == symbol,
+            NiftyIndexData.interval == "5minute",
+            NiftyIndexData.timestamp >= datetime.combine(from_date, datetime.min.time()),
+            NiftyIndexData.timestamp <= datetime.combine(to_date, datetime.max.time())
+        ).group_by(day).all())
+    
     current_date = from_date
     complete_days = 0
     incomplete_days = 0
     weekend_days = 0
     missing_dates = []
     
-    with db_manager.get_session() as session:
-        while current_date <= to_date:
-            if current_date.weekday() >= 5:
-                weekend_days += 1
-            else:
-                from_datetime = datetime.combine(current_date, datetime.min.time())
-                to_datetime = datetime.combine(current_date, datetime.max.time())
-                
-                count = session.query(NiftyIndexData).filter(
-                    NiftyIndexData.symbol == symbol,
-                    NiftyIndexData.interval == "5minute",
-                    NiftyIndexData.timestamp >= from_datetime,
-                    NiftyIndexData.timestamp <= to_datetime
-                ).count()
-                
-                # Consider day complete if we have at least 73 records
-                if count >= 73:
-                    complete_days += 1
-                else:
-                    incomplete_days += 1
-                    missing_dates.append({
-                        "date": current_date.isoformat(),
-                        "records": count,
-                        "missing": expected_records - count
-                    })
+    while current_date <= to_date:
+        if current_date.weekday() >= 5:
+            weekend_days += 1
+        else:
+            count = counts.get(current_date, 0)
             
-            current_date += timedelta(days=1)
+            # Consider day complete if we have at least 73 records
+            if count >= 73:
+                complete_days += 1
+            else:
+                incomplete_days += 1
+                missing_dates.append({
+                    "date": current_date.isoformat(),
+                    "records": count,
+                    "missing": EXPECTED_RECORDS_PER_DAY - count
+                })
+        
+        current_date += timedelta(days=1)
     
     total_days = (to_date - from_date).days + 1
     trading_days = total_days - weekend_days
@@ -490,10 +639,66 @@ def get_first_trading_day_open_price(target_date: date, symbol: str, db_manager)
     logger.warning(f"No trading day found in the week starting {monday}")
     return None
 
+def load_week_open_prices(from_date: date, to_date: date, symbol: str, db_manager) -> Dict[date, float]:
+    """Map the Monday of every week in the range to its first trading day's 9:15 open, in one query"""
+    first_monday = from_date - timedelta(days=from_date.weekday())
+    last_monday = to_date - timedelta(days=to_date.weekday())
+    
+    candidate_915s = []
+    monday = first_monday
+    while monday <= last_monday:
+        for day_offset in range(5):  # Mon to Fri
+            candidate_915s.append(datetime.combine(monday + timedelta(days=day_offset), datetime.min.time()).replace(hour=9, minute=15))
+        monday += timedelta(days=7)
+    
+    with db_manager.get_session() as session:
+        first_candles = session.query(NiftyIndexData.timestamp, NiftyIndexData.open).filter(
+            NiftyIndexData.symbol == symbol,
+            NiftyIndexData.interval == "5minute",
+            NiftyIndexData.timestamp.in_(candidate_915s)
+        ).order_by(NiftyIndexData.timestamp).all()
+    
+    week_open_map = {}
+    for timestamp, open_price in first_candles:
+        week_start = timestamp.date() - timedelta(days=timestamp.weekday())
+        week_open_map.setdefault(week_start, float(open_price))
+    
+    return week_open_map
+
+@dataclass(frozen=True)
+class WeekPlan:
+    """Strike geometry shared by every trading day of a week"""
+    first_day_open: float
+    base_strike: int
+    min_strike: int
+    max_strike: int
+    tasks: Tuple[Tuple[int, str], ...]  # (strike, option_type) pairs to fetch
+
+def build_week_plans(week_open_map: Dict[date, float]) -> Dict[date, WeekPlan]:
+    """Derive each week's strike range (±500 points around the first trading day's open) once"""
+    plans = {}
+    for monday, first_day_open in week_open_map.items():
+        base_strike = int(round(first_day_open / 50) * 50)  # Round to nearest 50
+        min_strike = base_strike - 500
+        max_strike = base_strike + 500
+        plans[monday] = WeekPlan(
+            first_day_open=first_day_open,
+            base_strike=base_strike,
+            min_strike=min_strike,
+            max_strike=max_strike,
+            tasks=tuple(
+                (strike, option_type)
+                for strike in range(min_strike, max_strike + 50, 50)  # 50 point intervals
+                for option_type in ('CE', 'PE')
+            )
+        )
+    return plans
+
 # Apply caching if available
 if ULTRA_OPTIMIZED_AVAILABLE:
     get_first_trading_day_open_price = cache_strike_range(ttl=86400)(get_first_trading_day_open_price)
 
+@lru_cache(maxsize=1024)
 def get_weekly_expiry(target_date: date) -> date:
     """Get the weekly expiry date (Thursday) for the given date"""
     # Find the Thursday of the week
@@ -507,20 +712,254 @@ def get_weekly_expiry(target_date: date) -> date:
     
     return expiry
 
+class RateLimiter:
+    """Spaces calls shared across threads to at most `rate` per second"""
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+    
+    def reserve(self) -> float:
+        """Claim the next slot and return the seconds to wait for it"""
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + self.interval
+        return max(wait, 0.0)
+    
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+breeze_rate_limiter = RateLimiter(BREEZE_REQUESTS_PER_SECOND)
+
+def init_collection_worker(worker_count: int):
+    """Process pool initializer: fresh DB connections, HTTP pool and Breeze session, and this worker's share of the API rate"""
+    global _breeze, breeze_rate_limiter
+    # The queue listener thread only runs in the parent, so workers write their records to stderr directly
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(log_stream_handler)
+    # Forked workers inherit the parent's pooled connections; drop them without closing the parent's sockets
+    get_db_manager().engine.dispose(close=False)
+    _breeze = None
+    pool_breeze_http()
+    breeze_rate_limiter = RateLimiter(BREEZE_REQUESTS_PER_SECOND / worker_count)
+
+def fetch_option_series(breeze, symbol: str, strike: int, option_type: str,
+                        from_iso: str, to_iso: str, expiry_iso: str) -> List[dict]:
+    """Fetch one option's 5-minute series from Breeze (called in parallel)"""
+    # Convert CE/PE to call/put for Breeze API
+    right_type = "call" if option_type == "CE" else "put"
+    
+    breeze_rate_limiter.acquire()
+    result = breeze.get_historical_data_v2(
+        interval="5minute",
+        from_date=from_iso,
+        to_date=to_iso,
+        stock_code=symbol,  # Use NIFTY, not the full option symbol
+        exchange_code="NFO",
+        product_type="options",
+        expiry_date=expiry_iso,
+        right=right_type,
+        strike_price=str(strike)
+    )
+    
+    if result and 'Success' in result:
+        return result['Success']
+    return []
+
+def fetch_option_day(breeze, symbol: str, tasks: List[Tuple[int, str]],
+                     from_iso: str, to_iso: str, expiry_iso: str):
+    """Yield ((strike, option_type), records or the raised exception) as each thread's fetch completes"""
+    with ThreadPoolExecutor(max_workers=BREEZE_WORKERS) as executor:
+        future_to_option = {
+            executor.submit(
+                fetch_option_series,
+                breeze, symbol, strike, option_type,
+                from_iso, to_iso, expiry_iso
+            ): (strike, option_type)
+            for strike, option_type in tasks
+        }
+        
+        for future in as_completed(future_to_option):
+            error = future.exception()
+            yield future_to_option[future], error if error else future.result()
+
+async def fetch_option_series_async(http: aiohttp.ClientSession, semaphore: asyncio.Semaphore, breeze,
+                                    symbol: str, strike: int, option_type: str,
+                                    from_iso: str, to_iso: str, expiry_iso: str) -> List[dict]:
+    """Fetch one option's 5-minute series with the same request BreezeConnect.get_historical_data_v2 sends"""
+    params = {
+        "interval": "5minute",
+        "from_date": from_iso,
+        "to_date": to_iso,
+        "stock_code": symbol,
+        "exch_code": "NFO",
+        "product_type": "options",
+        "expiry_date": expiry_iso,
+        "strike_price": str(strike),
+        "right": "call" if option_type == "CE" else "put"
+    }
+    headers = {
+        "Content-Type": "application/json",
+        "X-SessionToken": breeze.api_handler.base64_session_token,
+        "apikey": breeze.api_key
+    }
+    
+    async with semaphore:
+        await asyncio.sleep(breeze_rate_limiter.reserve())
+        async with http.get(BREEZE_HISTORICAL_URL, params=params, headers=headers) as response:
+            result = await response.json(content_type=None)
+    
+    if result and result.get('Success'):
+        return result['Success']
+    return []
+
+async def fetch_option_day_async(breeze, symbol: str, tasks: List[Tuple[int, str]],
+                                 from_iso: str, to_iso: str, expiry_iso: str) -> list:
+    """Fetch a day's strikes on one event loop; returns ((strike, option_type), records or exception) pairs"""
+    semaphore = asyncio.Semaphore(BREEZE_WORKERS)
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=32)) as http:
+        results = await asyncio.gather(
+            *[
+                fetch_option_series_async(http, semaphore, breeze, symbol, strike, option_type,
+                                          from_iso, to_iso, expiry_iso)
+                for strike, option_type in tasks
+            ],
+            return_exceptions=True
+        )
+    return list(zip(tasks, results))
+
+def build_option_rows(records: List[dict], symbol: str, option_symbol: str, strike: int,
+                      option_type: str, expiry: datetime) -> List[dict]:
+    """Map Breeze option candles straight to OptionsHistoricalData column dicts, skipping off-hours candles"""
+    rows = []
+    for record in records:
+        try:
+            timestamp = parse_breeze_timestamp(record['datetime'])
+            if not is_within_market_hours(timestamp, include_pre_market=False, is_breeze_data=True, extended_hours=False):
+                continue
+            
+            close = float(record['close'])
+            bid = record.get('best_bid_price')
+            ask = record.get('best_offer_price')
+            rows.append({
+                'trading_symbol': option_symbol,
+                'timestamp': timestamp,
+                'exchange': record.get('exchange_code', 'NFO'),
+                'underlying': symbol,
+                'strike': strike,
+                'option_type': option_type,
+                'expiry_date': expiry,
+                'open': float(record['open']),
+                'high': float(record['high']),
+                'low': float(record['low']),
+                'close': close,
+                'last_price': close,
+                'volume': int(record['volume']) if record.get('volume') else 0,
+                'open_interest': int(record['open_interest']) if record.get('open_interest') else 0,
+                'bid_price': float(bid) if bid else None,
+                'ask_price': float(ask) if ask else None,
+                'bid_ask_spread': float(ask) - float(bid) if bid and ask else None,
+                'data_source': 'BreezeConnect'
+            })
+        except Exception as e:
+            logger.debug(f"Error processing record: {e}")
+    return rows
+
+def parse_breeze_timestamp_or_none(datetime_str) -> Optional[datetime]:
+    """parse_breeze_timestamp that yields None for values it cannot read"""
+    try:
+        return parse_breeze_timestamp(datetime_str)
+    except (TypeError, ValueError):
+        return None
+
+def seconds_of_day(t) -> int:
+    """Seconds since midnight for a time of day"""
+    return t.hour * 3600 + t.minute * 60 + t.second
+
+def build_option_day_rows(series: List[Tuple[Tuple[int, str], List[dict]]], symbol: str,
+                          expiry_str: str, expiry: datetime) -> List[dict]:
+    """
+    Map a day's Breeze candles for every strike to OptionsHistoricalData column dicts in one vectorized pass
+    
+    Same output as build_option_rows applied per series: off-hours candles and candles with an
+    unreadable timestamp or price are dropped.
+    """
+    frames = [
+        pd.DataFrame.from_records(records).assign(strike=strike, option_type=option_type)
+        for (strike, option_type), records in series if records
+    ]
+    if not frames:
+        return []
+    
+    df = pd.concat(frames, ignore_index=True).reindex(columns=[
+        'datetime', 'exchange_code', 'open', 'high', 'low', 'close', 'volume', 'open_interest',
+        'best_bid_price', 'best_offer_price', 'strike', 'option_type'
+    ])
+    
+    # Breeze sends 'YYYY-MM-DD HH:MM:SS' in IST; anything else goes through the scalar parser
+    timestamps = pd.to_datetime(df['datetime'], format='%Y-%m-%d %H:%M:%S', errors='coerce')
+    unparsed = timestamps.isna() & df['datetime'].notna()
+    if unparsed.any():
+        timestamps[unparsed] = pd.to_datetime(df.loc[unparsed, 'datetime'].map(parse_breeze_timestamp_or_none))
+    
+    prices = df[['open', 'high', 'low', 'close']].apply(pd.to_numeric, errors='coerce')
+    
+    day_seconds = (timestamps - timestamps.dt.normalize()).dt.total_seconds()
+    keep = (
+        timestamps.notna()
+        & (timestamps.dt.weekday < 5)
+        & day_seconds.between(seconds_of_day(BREEZE_DATA_START_REGULAR), seconds_of_day(BREEZE_DATA_END_REGULAR))
+        & prices.notna().all(axis=1)
+    )
+    df = df[keep]
+    prices = prices[keep]
+    
+    # Zero or missing quotes are stored as NULL, as build_option_rows does
+    bid = pd.to_numeric(df['best_bid_price'], errors='coerce').replace(0, float('nan'))
+    ask = pd.to_numeric(df['best_offer_price'], errors='coerce').replace(0, float('nan'))
+    
+    rows = pd.DataFrame({
+        'trading_symbol': symbol + expiry_str + df['strike'].astype(str) + df['option_type'],
+        'timestamp': pd.Series(list(timestamps[keep].dt.to_pydatetime()), index=df.index, dtype=object),
+        'exchange': df['exchange_code'].fillna('NFO'),
+        'underlying': symbol,
+        'strike': df['strike'],
+        'option_type': df['option_type'],
+        'expiry_date': pd.Series(expiry, index=df.index, dtype=object),
+        'open': prices['open'],
+        'high': prices['high'],
+        'low': prices['low'],
+        'close': prices['close'],
+        'last_price': prices['close'],
+        'volume': pd.to_numeric(df['volume'], errors='coerce').fillna(0).astype('int64'),
+        'open_interest': pd.to_numeric(df['open_interest'], errors='coerce').fillna(0).astype('int64'),
+        'bid_price': bid,
+        'ask_price': ask,
+        'bid_ask_spread': ask - bid,
+        'data_source': 'BreezeConnect'
+    })
+    
+    return rows.astype(object).where(rows.notna(), None).to_dict('records')
+
 def collect_options_data_sync(request: CollectOptionsRequest) -> dict:
     """Synchronous options data collection logic"""
     # Initialize database
     db_manager = get_db_manager()
     
-    # Initialize Breeze once
-    breeze = BreezeConnect(api_key=os.getenv('BREEZE_API_KEY'))
-    try:
-        breeze.generate_session(
-            api_secret=os.getenv('BREEZE_API_SECRET'),
-            session_token=os.getenv('BREEZE_API_SESSION')
-        )
-    except Exception as e:
-        logger.info(f"Session notice: {e}")
+    breeze = get_breeze()
+    
+    # First trading day's open and strike range for every week in the range
+    week_plans = build_week_plans(
+        load_week_open_prices(request.from_date, request.to_date, request.symbol, db_manager)
+    )
+    
+    holidays = load_trading_holidays(request.from_date, request.to_date)
     
     # Process date range
     current_date = request.from_date
@@ -542,9 +981,19 @@ def collect_options_data_sync(request: CollectOptionsRequest) -> dict:
                 current_date += timedelta(days=1)
                 continue
             
-            # Get first trading day's open price for this week
-            first_day_open = get_first_trading_day_open_price(current_date, request.symbol, db_manager)
-            if not first_day_open:
+            # Skip exchange holidays; every strike fetch would come back empty
+            if current_date in holidays:
+                daily_results.append({
+                    "date": current_date.isoformat(),
+                    "status": "skipped",
+                    "reason": "holiday"
+                })
+                current_date += timedelta(days=1)
+                continue
+            
+            # Get this week's plan, built from its first trading day's open price
+            plan = week_plans.get(current_date - timedelta(days=current_date.weekday()))
+            if plan is None:
                 logger.warning(f"Skipping {current_date}: No trading day found this week")
                 daily_results.append({
                     "date": current_date.isoformat(),
@@ -554,47 +1003,40 @@ def collect_options_data_sync(request: CollectOptionsRequest) -> dict:
                 current_date += timedelta(days=1)
                 continue
             
-            # Calculate strike range (±500 points from first trading day's open)
-            base_strike = int(round(first_day_open / 50) * 50)  # Round to nearest 50
-            min_strike = base_strike - 500
-            max_strike = base_strike + 500
+            first_day_open = plan.first_day_open
+            min_strike = plan.min_strike
+            max_strike = plan.max_strike
             
-            # Get weekly expiry
+            # Get weekly expiry; stays per day because Friday rolls to the next week's expiry
             expiry_date = get_weekly_expiry(current_date)
             
             logger.info(f"Processing {current_date}: First day open={first_day_open:.2f}, Strikes={min_strike}-{max_strike}, Expiry={expiry_date}")
             
             # Check if data already exists for this date
-            from_datetime = datetime.combine(current_date, datetime.min.time())
-            to_datetime = datetime.combine(current_date, datetime.max.time())
-            
-            with db_manager.get_session() as session:
-                existing_count = session.query(OptionsHistoricalData).filter(
-                    OptionsHistoricalData.underlying == request.symbol,
-                    OptionsHistoricalData.timestamp >= from_datetime,
-                    OptionsHistoricalData.timestamp <= to_datetime,
-                    OptionsHistoricalData.strike >= min_strike,
-                    OptionsHistoricalData.strike <= max_strike
-                ).count()
+            from_datetime = datetime(current_date.year, current_date.month, current_date.day)
+            to_datetime = from_datetime + ONE_DAY_INCLUSIVE
             
-            # Enhanced check: verify if all expected strikes are present
-            expected_strikes = list(range(min_strike, max_strike + 50, 50))
-            expected_combinations = len(expected_strikes) * 2  # CE and PE
-            
-            # Check which strikes actually exist
+            # One read of the day's stored rows feeds the completeness check and the per-record dedup
             with db_manager.get_session() as session:
-                existing_strikes = session.query(
+                existing_rows = session.query(
                     OptionsHistoricalData.strike,
-                    OptionsHistoricalData.option_type
+                    OptionsHistoricalData.option_type,
+                    OptionsHistoricalData.trading_symbol,
+                    OptionsHistoricalData.timestamp
                 ).filter(
                     OptionsHistoricalData.underlying == request.symbol,
                     OptionsHistoricalData.timestamp >= from_datetime,
                     OptionsHistoricalData.timestamp <= to_datetime,
                     OptionsHistoricalData.strike >= min_strike,
                     OptionsHistoricalData.strike <= max_strike
-                ).distinct().all()
-                
-                existing_combinations_count = len(existing_strikes)
+                ).all()
+            
+            existing_count = len(existing_rows)
+            existing_keys = {(trading_symbol, timestamp) for _, _, trading_symbol, timestamp in existing_rows}
+            
+            # Enhanced check: verify if all expected strikes are present
+            expected_combinations = len(plan.tasks)  # CE and PE per strike
+            existing_combinations_count = len({(strike, option_type) for strike, option_type, _, _ in existing_rows})
             
             # Skip only if ALL expected strikes are present
             if existing_combinations_count >= expected_combinations and not request.force_refresh:
@@ -617,76 +1059,60 @@ def collect_options_data_sync(request: CollectOptionsRequest) -> dict:
                     "expected_combinations": expected_combinations
                 })
             
-            # Collect data for each strike
-            day_added = 0
+            # Collect data for each strike; the day's new rows are inserted together
+            day_rows = []
             day_errors = []
             strikes_processed = []
             
-            for strike in range(min_strike, max_strike + 50, 50):  # 50 point intervals
-                for option_type in ['CE', 'PE']:
-                    try:
-                        # Construct option symbol
-                        expiry_str = expiry_date.strftime("%y%b%d").upper()
-                        option_symbol = f"{request.symbol}{expiry_str}{strike}{option_type}"
-                        
-                        # Fetch 5-minute data
-                        # Convert CE/PE to call/put for Breeze API
-                        right_type = "call" if option_type == "CE" else "put"
-                        
-                        result = breeze.get_historical_data_v2(
-                            interval="5minute",
-                            from_date=from_datetime.strftime("%Y-%m-%dT00:00:00.000Z"),
-                            to_date=to_datetime.strftime("%Y-%m-%dT23:59:59.000Z"),
-                            stock_code=request.symbol,  # Use NIFTY, not the full option symbol
-                            exchange_code="NFO",
-                            product_type="options",
-                            expiry_date=expiry_date.strftime("%Y-%m-%dT00:00:00.000Z"),
-                            right=right_type,
-                            strike_price=str(strike)
-                        )
-                        
-                        if result and 'Success' in result:
-                            records = result['Success']
-                            
-                            # Store data
-                            with db_manager.get_session() as session:
-                                for record in records:
-                                    try:
-                                        # Add required fields for OptionsHistoricalData
-                                        record['underlying'] = request.symbol
-                                        record['strike_price'] = strike
-                                        record['right'] = option_type
-                                        record['expiry_date'] = expiry_date.strftime("%Y-%m-%dT00:00:00.000Z")
-                                        record['trading_symbol'] = option_symbol  # Add the constructed trading symbol
-                                        
-                                        options_data = OptionsHistoricalData.from_breeze_data(record)
-                                        if options_data is None:
-                                            continue
-                                        
-                                        # Check if exists
-                                        exists = session.query(OptionsHistoricalData).filter(
-                                            OptionsHistoricalData.trading_symbol == option_symbol,
-                                            OptionsHistoricalData.timestamp == options_data.timestamp
-                                        ).first()
-                                        
-                                        if not exists:
-                                            session.add(options_data)
-                                            day_added += 1
-                                    except Exception as e:
-                                        logger.error(f"Error processing record: {e}")
-                                
-                                session.commit()
-                            
-                            if len(records) > 0:
-                                strikes_processed.append(f"{strike}{option_type}")
-                        
-                        # Small delay to avoid rate limiting
-                        time.sleep(0.1)
-                        
-                    except Exception as e:
-                        error_msg = f"{strike}{option_type}: {str(e)}"
-                        day_errors.append(error_msg)
-                        logger.error(f"Error fetching {option_symbol}: {e}")
+            tasks = plan.tasks
+            expiry_str = expiry_date.strftime("%y%b%d").upper()
+            expiry_iso = f"{expiry_date.isoformat()}T00:00:00.000Z"
+            expiry = parse_breeze_timestamp(expiry_iso)
+            day_iso = current_date.isoformat()
+            from_iso = f"{day_iso}T00:00:00.000Z"
+            to_iso = f"{day_iso}T23:59:59.000Z"
+            
+            # Fetch all strikes concurrently; records are filtered and collected on this thread
+            if BREEZE_ASYNC_FETCH:
+                fetched = asyncio.run(fetch_option_day_async(breeze, request.symbol, tasks, from_iso, to_iso, expiry_iso))
+            else:
+                fetched = fetch_option_day(breeze, request.symbol, tasks, from_iso, to_iso, expiry_iso)
+            
+            for (strike, option_type), records in fetched:
+                option_symbol = f"{request.symbol}{expiry_str}{strike}{option_type}"
+                if isinstance(records, Exception):
+                    error_msg = f"{strike}{option_type}: {str(records)}"
+                    day_errors.append(error_msg)
+                    logger.error(f"Error fetching {option_symbol}: {records}")
+                    continue
+                
+                # Keep records not already stored
+                for row in build_option_rows(records, request.symbol, option_symbol, strike, option_type, expiry):
+                    key = (option_symbol, row['timestamp'])
+                    if key not in existing_keys:
+                        existing_keys.add(key)
+                        day_rows.append(row)
+                
+                if len(records) > 0:
+                    strikes_processed.append(f"{strike}{option_type}")
+            
+            # One transaction per day; a failed insert rolls back the whole day and is reported with what was fetched
+            try:
+                with db_manager.get_session() as session:
+                    bulk_insert(session, OptionsHistoricalData, day_rows)
+            except Exception as e:
+                logger.error(f"{current_date}: Insert of {len(day_rows)} rows rolled back: {e}")
+                errors.append(f"{current_date}: {str(e)}")
+                daily_results.append({
+                    "date": current_date.isoformat(),
+                    "status": "error",
+                    "error": str(e),
+                    "strikes_processed": len(strikes_processed),
+                    "records_rolled_back": len(day_rows)
+                })
+                current_date += timedelta(days=1)
+                continue
+            day_added = len(day_rows)
             
             # Update totals
             total_added += day_added
@@ -729,159 +1155,178 @@ def collect_options_data_sync(request: CollectOptionsRequest) -> dict:
         "errors": errors if errors else None
     }
 
-def collect_options_data_optimized(request: CollectOptionsRequest, job_id: str) -> dict:
-    """Optimized options collection with parallel processing and progress tracking"""
-    # Initialize database
-    db_manager = get_db_manager()
+def collect_options_optimized_day(current_date: date, request: CollectOptionsRequest,
+                                  plan: Optional[WeekPlan], skip_reason: Optional[str] = None) -> dict:
+    """Collect one day's options for the optimized collector; returns that day's result entry"""
+    # Skip weekends and exchange holidays
+    if skip_reason:
+        return {
+            "date": current_date.isoformat(),
+            "status": "skipped",
+            "reason": skip_reason
+        }
+    
+    # The week's plan is built from its first trading day's open price
+    if plan is None:
+        logger.warning(f"Skipping {current_date}: No trading day found this week")
+        return {
+            "date": current_date.isoformat(),
+            "status": "skipped",
+            "reason": "no_trading_day_this_week"
+        }
     
-    # Initialize Breeze once
-    breeze = BreezeConnect(api_key=os.getenv('BREEZE_API_KEY'))
     try:
-        breeze.generate_session(
-            api_secret=os.getenv('BREEZE_API_SECRET'),
-            session_token=os.getenv('BREEZE_API_SESSION')
+        db_manager = get_db_manager()
+        
+        first_day_open = plan.first_day_open
+        min_strike = plan.min_strike
+        max_strike = plan.max_strike
+        
+        # Get weekly expiry
+        expiry_date = get_weekly_expiry(current_date)
+        
+        logger.info(f"Processing {current_date}: First day open={first_day_open:.2f}, Strikes={min_strike}-{max_strike}, Expiry={expiry_date}")
+        
+        # Check existing data
+        from_datetime = datetime(current_date.year, current_date.month, current_date.day)
+        to_datetime = from_datetime + ONE_DAY_INCLUSIVE
+        
+        # Enhanced check: verify if all expected strikes are present
+        expected_combinations = len(plan.tasks)  # CE and PE per strike
+        
+        # Per-combination row counts give both totals in one round-trip
+        with db_manager.get_session() as session:
+            existing_strikes = session.query(
+                OptionsHistoricalData.strike,
+                OptionsHistoricalData.option_type,
+                func.count()
+            ).filter(
+                OptionsHistoricalData.underlying == request.symbol,
+                OptionsHistoricalData.timestamp >= from_datetime,
+                OptionsHistoricalData.timestamp <= to_datetime,
+                OptionsHistoricalData.strike >= min_strike,
+                OptionsHistoricalData.strike <= max_strike
+            ).group_by(
+                OptionsHistoricalData.strike,
+                OptionsHistoricalData.option_type
+            ).all()
+        
+        existing_combinations_count = len(existing_strikes)
+        existing_count = sum(row[2] for row in existing_strikes)
+        
+        # Skip only if ALL expected strikes are present
+        if existing_combinations_count >= expected_combinations and not request.force_refresh:
+            logger.info(f"{current_date}: All {expected_combinations} strike combinations exist, skipping")
+            return {
+                "date": current_date.isoformat(),
+                "status": "skipped",
+                "reason": "data_complete",
+                "existing_count": existing_count,
+                "strike_combinations": existing_combinations_count
+            }
+        elif existing_count > 0 and not request.force_refresh:
+            logger.warning(f"{current_date}: Partial data exists ({existing_combinations_count}/{expected_combinations} strikes), continuing to fill gaps")
+        
+        # Collect data with parallel processing
+        day_result = collect_options_for_day_parallel(
+            get_breeze(), db_manager, current_date, request.symbol,
+            min_strike, max_strike, expiry_date,
+            has_existing=existing_count > 0
         )
+        
+        logger.info(f"{current_date}: Added {day_result['records_added']} records for {day_result['strikes_processed']} strikes")
+        
+        return {
+            "date": current_date.isoformat(),
+            "status": "processed",
+            "first_day_open": first_day_open,
+            "strike_range": f"{min_strike}-{max_strike}",
+            "strikes_processed": day_result["strikes_processed"],
+            "records_added": day_result["records_added"],
+            "errors": day_result.get("errors") if day_result.get("errors") else None
+        }
+        
     except Exception as e:
-        logger.info(f"Session notice: {e}")
+        logger.error(f"{current_date}: {str(e)}")
+        return {
+            "date": current_date.isoformat(),
+            "status": "error",
+            "error": str(e)
+        }
+
+def collect_options_data_optimized(request: CollectOptionsRequest, job_id: str,
+                                   use_process_pool: bool = False) -> dict:
+    """
+    Optimized options collection with parallel processing and progress tracking
+    
+    Days are independent, so long ranges can be spread over a process pool
+    when use_process_pool is set.
+    """
+    db_manager = get_db_manager()
+    
+    # First trading day's open and strike range for every week, looked up once up front
+    week_plans = build_week_plans(
+        load_week_open_prices(request.from_date, request.to_date, request.symbol, db_manager)
+    )
+    
+    # Non-trading days in the range, resolved once instead of re-checked inside the loop
+    holidays = load_trading_holidays(request.from_date, request.to_date)
+    
+    total_days = (request.to_date - request.from_date).days + 1
+    days = [request.from_date + timedelta(days=offset) for offset in range(total_days)]
+    plans = [week_plans.get(day - timedelta(days=day.weekday())) for day in days]
+    skip_reasons = [
+        "weekend" if day.weekday() >= 5 else "holiday" if day in holidays else None
+        for day in days
+    ]
+    
+    # SQLite serializes writers, so extra processes would only contend for its lock
+    database_url = db_manager.settings.database.connection_string
+    if use_process_pool and total_days > PROCESS_POOL_MIN_DAYS and not database_url.startswith("sqlite"):
+        workers = min(4, os.cpu_count() or 1)
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_collection_worker,
+            initargs=(workers,)
+        )
+        day_results = executor.map(collect_options_optimized_day, days, repeat(request), plans, skip_reasons)
+    else:
+        executor = None
+        day_results = map(collect_options_optimized_day, days, repeat(request), plans, skip_reasons)
     
-    # Process date range
-    current_date = request.from_date
     total_added = 0
-    total_skipped = 0
     total_processed = 0
     errors = []
     daily_results = []
-    
-    # Calculate total days for progress tracking
-    total_days = (request.to_date - request.from_date).days + 1
     processed_days = 0
     
-    while current_date <= request.to_date:
-        try:
-            # Update progress
-            job_status[job_id]["current_date"] = current_date.isoformat()
-            job_status[job_id]["processed_days"] = processed_days
-            job_status[job_id]["progress"] = round((processed_days / total_days) * 100, 1)
-            
-            # Skip weekends
-            if current_date.weekday() >= 5:
-                daily_results.append({
-                    "date": current_date.isoformat(),
-                    "status": "skipped",
-                    "reason": "weekend"
-                })
-                current_date += timedelta(days=1)
-                processed_days += 1
-                continue
-            
-            # Get first trading day's open price for this week
-            first_day_open = get_first_trading_day_open_price(current_date, request.symbol, db_manager)
-            if not first_day_open:
-                logger.warning(f"Skipping {current_date}: No trading day found this week")
-                daily_results.append({
-                    "date": current_date.isoformat(),
-                    "status": "skipped",
-                    "reason": "no_trading_day_this_week"
-                })
-                current_date += timedelta(days=1)
-                processed_days += 1
-                continue
-            
-            # Calculate strike range
-            base_strike = int(round(first_day_open / 50) * 50)
-            min_strike = base_strike - 500
-            max_strike = base_strike + 500
-            
-            # Get weekly expiry
-            expiry_date = get_weekly_expiry(current_date)
-            
-            logger.info(f"Processing {current_date}: First day open={first_day_open:.2f}, Strikes={min_strike}-{max_strike}, Expiry={expiry_date}")
-            
-            # Check existing data
-            from_datetime = datetime.combine(current_date, datetime.min.time())
-            to_datetime = datetime.combine(current_date, datetime.max.time())
-            
-            with db_manager.get_session() as session:
-                existing_count = session.query(OptionsHistoricalData).filter(
-                    OptionsHistoricalData.underlying == request.symbol,
-                    OptionsHistoricalData.timestamp >= from_datetime,
-                    OptionsHistoricalData.timestamp <= to_datetime,
-                    OptionsHistoricalData.strike >= min_strike,
-                    OptionsHistoricalData.strike <= max_strike
-                ).count()
-            
-            # Enhanced check: verify if all expected strikes are present
-            expected_strikes = list(range(min_strike, max_strike + 50, 50))
-            expected_combinations = len(expected_strikes) * 2  # CE and PE
-            
-            # Check which strikes actually exist
-            with db_manager.get_session() as session:
-                existing_strikes = session.query(
-                    OptionsHistoricalData.strike,
-                    OptionsHistoricalData.option_type
-                ).filter(
-                    OptionsHistoricalData.underlying == request.symbol,
-                    OptionsHistoricalData.timestamp >= from_datetime,
-                    OptionsHistoricalData.timestamp <= to_datetime,
-                    OptionsHistoricalData.strike >= min_strike,
-                    OptionsHistoricalData.strike <= max_strike
-                ).distinct().all()
-                
-                existing_combinations_count = len(existing_strikes)
+    # Progress is buffered and written to the job store every couple of seconds, not once per day
+    progress = ProgressReporter(job_store, job_id)
+    try:
+        for day_result in day_results:
+            daily_results.append(day_result)
+            processed_days += 1
             
-            # Skip only if ALL expected strikes are present
-            if existing_combinations_count >= expected_combinations and not request.force_refresh:
-                logger.info(f"{current_date}: All {expected_combinations} strike combinations exist, skipping")
-                daily_results.append({
-                    "date": current_date.isoformat(),
-                    "status": "skipped",
-                    "reason": "data_complete",
-                    "existing_count": existing_count,
-                    "strike_combinations": existing_combinations_count
-                })
-                current_date += timedelta(days=1)
-                processed_days += 1
-                continue
-            elif existing_count > 0 and not request.force_refresh:
-                logger.warning(f"{current_date}: Partial data exists ({existing_combinations_count}/{expected_combinations} strikes), continuing to fill gaps")
+            if day_result["status"] == "processed":
+                total_added += day_result["records_added"]
+                total_processed += 1
+            elif day_result["status"] == "error":
+                errors.append(f"{day_result['date']}: {day_result['error']}")
             
-            # Collect data with parallel processing
-            day_result = collect_options_for_day_parallel(
-                breeze, db_manager, current_date, request.symbol,
-                min_strike, max_strike, expiry_date
+            # Update progress
+            progress.update(
+                current_date=day_result["date"],
+                processed_days=processed_days,
+                progress=round((processed_days / total_days) * 100, 1)
             )
-            
-            # Update totals
-            total_added += day_result["records_added"]
-            total_processed += 1
-            
-            daily_results.append({
-                "date": current_date.isoformat(),
-                "status": "processed",
-                "first_day_open": first_day_open,
-                "strike_range": f"{min_strike}-{max_strike}",
-                "strikes_processed": day_result["strikes_processed"],
-                "records_added": day_result["records_added"],
-                "errors": day_result.get("errors") if day_result.get("errors") else None
-            })
-            
-            logger.info(f"{current_date}: Added {day_result['records_added']} records for {day_result['strikes_processed']} strikes")
-            
-        except Exception as e:
-            logger.error(f"{current_date}: {str(e)}")
-            errors.append(f"{current_date}: {str(e)}")
-            daily_results.append({
-                "date": current_date.isoformat(),
-                "status": "error",
-                "error": str(e)
-            })
         
-        current_date += timedelta(days=1)
-        processed_days += 1
+        # Final progress update
+        progress.update(progress=100, processed_days=processed_days)
+    finally:
+        progress.close()
+        if executor is not None:
+            executor.shutdown()
     
-    # Final progress update
-    job_status[job_id]["progress"] = 100
-    job_status[job_id]["processed_days"] = processed_days
     
     return {
         "status": "success",
@@ -895,10 +1340,19 @@ def collect_options_data_optimized(request: CollectOptionsRequest, job_id: str)
     }
 
 def collect_options_for_day_parallel(breeze, db_manager, request_date: date, symbol: str,
-                                    min_strike: int, max_strike: int, expiry_date: date) -> dict:
-    """Collect options data for a single day using parallel processing"""
-    from_datetime = datetime.combine(request_date, datetime.min.time())
-    to_datetime = datetime.combine(request_date, datetime.max.time())
+                                    min_strike: int, max_strike: int, expiry_date: date,
+                                    has_existing: bool = True) -> dict:
+    """Collect options data for a single day, fetching every strike concurrently on one event loop"""
+    from_datetime = datetime(request_date.year, request_date.month, request_date.day)
+    to_datetime = from_datetime + ONE_DAY_INCLUSIVE
+    
+    # Request strings are identical for every strike, so format them once for the day
+    expiry_str = expiry_date.strftime("%y%b%d").upper()
+    expiry_iso = f"{expiry_date.isoformat()}T00:00:00.000Z"
+    expiry = parse_breeze_timestamp(expiry_iso)
+    day_iso = request_date.isoformat()
+    from_iso = f"{day_iso}T00:00:00.000Z"
+    to_iso = f"{day_iso}T23:59:59.000Z"
     
     # Prepare all tasks
     tasks = []
@@ -912,98 +1366,47 @@ def collect_options_for_day_parallel(breeze, db_manager, request_date: date, sym
         "errors": []
     }
     
-    # Process in parallel with ThreadPoolExecutor
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        # Submit all tasks
-        future_to_strike = {
-            executor.submit(
-                fetch_and_store_single_option,
-                breeze, db_manager, from_datetime, to_datetime,
-                symbol, strike, option_type, expiry_date
-            ): (strike, option_type)
-            for strike, option_type in tasks
-        }
-        
-        # Process completed tasks
-        for future in as_completed(future_to_strike):
-            strike, option_type = future_to_strike[future]
-            try:
-                records_added = future.result()
-                if records_added > 0:
-                    results["records_added"] += records_added
-                    results["strikes_processed"] += 1
-            except Exception as e:
-                error_msg = f"{strike}{option_type}: {str(e)}"
-                results["errors"].append(error_msg)
-                logger.error(f"Failed to collect {strike}{option_type}: {e}")
+    # All 42 requests share one aiohttp session; rows are gathered here and written once
+    fetched = asyncio.run(fetch_option_day_async(breeze, symbol, tasks, from_iso, to_iso, expiry_iso))
+    
+    series = []
+    for (strike, option_type), records in fetched:
+        if isinstance(records, Exception):
+            error_msg = f"{strike}{option_type}: {str(records)}"
+            results["errors"].append(error_msg)
+            logger.error(f"Failed to collect {strike}{option_type}: {records}")
+            continue
+        series.append(((strike, option_type), records))
+    
+    # Every strike's candles are parsed together in one DataFrame
+    day_rows = build_option_day_rows(series, symbol, expiry_str, expiry)
+    results["strikes_processed"] = len({(row['strike'], row['option_type']) for row in day_rows})
+    
+    if not day_rows:
+        return results
+    
+    # One lookup of the day's stored keys across the strike range, one insert, one commit
+    with db_manager.get_session() as session:
+        # A day the caller found empty needs no key lookup; the unique index still drops any racing duplicates
+        if has_existing:
+            existing = set(session.query(
+                OptionsHistoricalData.trading_symbol,
+                OptionsHistoricalData.timestamp
+            ).filter(
+                OptionsHistoricalData.underlying == symbol,
+                OptionsHistoricalData.timestamp >= from_datetime,
+                OptionsHistoricalData.timestamp <= to_datetime,
+                OptionsHistoricalData.strike >= min_strike,
+                OptionsHistoricalData.strike <= max_strike
+            ).all())
+            new_rows = [row for row in day_rows if (row['trading_symbol'], row['timestamp']) not in existing]
+        else:
+            new_rows = day_rows
+        bulk_insert(session, OptionsHistoricalData, new_rows)
     
+    results["records_added"] = len(new_rows)
     return results
 
-def fetch_and_store_single_option(breeze, db_manager, from_datetime: datetime, to_datetime: datetime,
-                                 symbol: str, strike: int, option_type: str, expiry_date: date) -> int:
-    """Fetch and store data for a single option (called in parallel)"""
-    try:
-        # Construct option symbol
-        expiry_str = expiry_date.strftime("%y%b%d").upper()
-        option_symbol = f"{symbol}{expiry_str}{strike}{option_type}"
-        
-        # Convert CE/PE to call/put for Breeze API
-        right_type = "call" if option_type == "CE" else "put"
-        
-        # Fetch data
-        result = breeze.get_historical_data_v2(
-            interval="5minute",
-            from_date=from_datetime.strftime("%Y-%m-%dT00:00:00.000Z"),
-            to_date=to_datetime.strftime("%Y-%m-%dT23:59:59.000Z"),
-            stock_code=symbol,
-            exchange_code="NFO",
-            product_type="options",
-            expiry_date=expiry_date.strftime("%Y-%m-%dT00:00:00.000Z"),
-            right=right_type,
-            strike_price=str(strike)
-        )
-        
-        if result and 'Success' in result:
-            records = result['Success']
-            
-            # Store data in batch
-            records_added = 0
-            with db_manager.get_session() as session:
-                for record in records:
-                    try:
-                        # Add required fields
-                        record['underlying'] = symbol
-                        record['strike_price'] = strike
-                        record['right'] = option_type
-                        record['expiry_date'] = expiry_date.strftime("%Y-%m-%dT00:00:00.000Z")
-                        record['trading_symbol'] = option_symbol
-                        
-                        options_data = OptionsHistoricalData.from_breeze_data(record)
-                        if options_data is None:
-                            continue
-                        
-                        # Check if exists
-                        exists = session.query(OptionsHistoricalData).filter(
-                            OptionsHistoricalData.trading_symbol == option_symbol,
-                            OptionsHistoricalData.timestamp == options_data.timestamp
-                        ).first()
-                        
-                        if not exists:
-                            session.add(options_data)
-                            records_added += 1
-                    except Exception as e:
-                        logger.error(f"Error processing record: {e}")
-                
-                session.commit()
-            
-            return records_added
-        
-        return 0
-        
-    except Exception as e:
-        logger.error(f"Error in fetch_and_store_single_option: {e}")
-        raise
-
 @app.post("/api/v1/collect/options-direct", tags=["Options Collection"])
 def collect_options_direct(request: CollectOptionsRequest):
     """
@@ -1018,14 +1421,16 @@ def collect_options_direct(request: CollectOptionsRequest):
 def run_options_bulk_collection(request: CollectOptionsRequest, job_id: str):
     """Background task for options bulk collection with progress tracking"""
     try:
-        job_status[job_id]["status"] = "running"
-        job_status[job_id]["start_time"] = datetime.now().isoformat()
-        
-        # Add progress tracking fields
-        job_status[job_id]["progress"] = 0
-        job_status[job_id]["current_date"] = None
-        job_status[job_id]["total_days"] = (request.to_date - request.from_date).days + 1
-        job_status[job_id]["processed_days"] = 0
+        job_store.update(
+            job_id,
+            status="running",
+            start_time=datetime.now().isoformat(),
+            # Progress tracking fields
+            progress=0,
+            current_date=None,
+            total_days=(request.to_date - request.from_date).days + 1,
+            processed_days=0
+        )
         
         # Choose optimization level
         if OPTIMIZATION_LEVEL == 2 and ULTRA_OPTIMIZED_AVAILABLE:
@@ -1033,18 +1438,20 @@ def run_options_bulk_collection(request: CollectOptionsRequest, job_id: str):
             result = collect_options_data_ultra_optimized(request, job_id)
         elif OPTIMIZATION_LEVEL == 1:
             logger.info(f"Using optimized collection for job {job_id}")
-            result = collect_options_data_optimized(request, job_id)
+            result = collect_options_data_optimized(request, job_id, use_process_pool=True)
         else:
             logger.info(f"Using original collection for job {job_id}")
             result = collect_options_data_sync(request)
         
-        job_status[job_id]["status"] = "completed"
-        job_status[job_id]["end_time"] = datetime.now().isoformat()
-        job_status[job_id]["result"] = result
+        job_store.update(
+            job_id,
+            status="completed",
+            end_time=datetime.now().isoformat(),
+            result=result
+        )
         
     except Exception as e:
-        job_status[job_id]["status"] = "failed"
-        job_status[job_id]["error"] = str(e)
+        job_store.update(job_id, status="failed", error=str(e))
         logger.error(f"Options bulk collection failed: {e}")
 
 @app.post("/api/v1/collect/options-bulk", tags=["Options Collection"])
@@ -1059,11 +1466,11 @@ async def collect_options_bulk(request: CollectOptionsRequest, background_tasks:
     job_id = f"job_{int(time.time())}_{request.symbol}_options"
     
     # Initialize job status
-    job_status[job_id] = {
+    await anyio.to_thread.run_sync(job_store.create, job_id, {
         "status": "queued",
         "request": request.dict(),
         "created_at": datetime.now().isoformat()
-    }
+    })
     
     # Start background task
     background_tasks.add_task(run_options_bulk_collection, request, job_id)
@@ -1091,36 +1498,37 @@ def check_options_data_availability(
     """
     db_manager = get_db_manager()
     
+    # Bucket the whole range by day in one query
+    with db_manager.get_session() as session:
+        day = cast(OptionsHistoricalData.timestamp, Date)
+        rows = session.execute(
+            select(
+                day,
+                func.count(),
+                func.count(OptionsHistoricalData.strike.distinct())
+            ).where(
+                OptionsHistoricalData.underlying == symbol,
+                OptionsHistoricalData.timestamp >= datetime.combine(from_date, datetime.min.time()),
+                OptionsHistoricalData.timestamp <= datetime.combine(to_date, datetime.max.time())
+            ).group_by(day)
+        ).all()
+    
+    counts = {row_date: (count, unique_strikes) for row_date, count, unique_strikes in rows}
+    
     current_date = from_date
     data_summary = []
     
-    with db_manager.get_session() as session:
-        while current_date <= to_date:
-            if current_date.weekday() < 5:  # Weekday
-                from_datetime = datetime.combine(current_date, datetime.min.time())
-                to_datetime = datetime.combine(current_date, datetime.max.time())
-                
-                # Count options records for this date
-                count = session.query(OptionsHistoricalData).filter(
-                    OptionsHistoricalData.underlying == symbol,
-                    OptionsHistoricalData.timestamp >= from_datetime,
-                    OptionsHistoricalData.timestamp <= to_datetime
-                ).count()
-                
-                # Get unique strikes
-                unique_strikes = session.query(OptionsHistoricalData.strike).filter(
-                    OptionsHistoricalData.underlying == symbol,
-                    OptionsHistoricalData.timestamp >= from_datetime,
-                    OptionsHistoricalData.timestamp <= to_datetime
-                ).distinct().count()
-                
-                data_summary.append({
-                    "date": current_date.isoformat(),
-                    "records": count,
-                    "unique_strikes": unique_strikes
-                })
+    while current_date <= to_date:
+        if current_date.weekday() < 5:  # Weekday
+            count, unique_strikes = counts.get(current_date, (0, 0))
             
-            current_date += timedelta(days=1)
+            data_summary.append({
+                "date": current_date.isoformat(),
+                "records": count,
+                "unique_strikes": unique_strikes
+            })
+        
+        current_date += timedelta(days=1)
     
     total_days = (to_date - from_date).days + 1
     trading_days = sum(1 for d in data_summary)
@@ -1151,40 +1559,29 @@ def delete_nifty_data(request: DeleteDataRequest):
     from_datetime = datetime.combine(request.from_date, datetime.min.time())
     to_datetime = datetime.combine(request.to_date, datetime.max.time())
     
+    range_filter = (
+        NiftyIndexData.symbol == request.symbol,
+        NiftyIndexData.interval.in_(("5minute", "hourly")),
+        NiftyIndexData.timestamp >= from_datetime,
+        NiftyIndexData.timestamp <= to_datetime
+    )
+    
     with db_manager.get_session() as session:
-        # Count records before deletion
-        count_5min = session.query(NiftyIndexData).filter(
-            NiftyIndexData.symbol == request.symbol,
-            NiftyIndexData.interval == "5minute",
-            NiftyIndexData.timestamp >= from_datetime,
-            NiftyIndexData.timestamp <= to_datetime
-        ).count()
-        
-        count_hourly = session.query(NiftyIndexData).filter(
-            NiftyIndexData.symbol == request.symbol,
-            NiftyIndexData.interval == "hourly",
-            NiftyIndexData.timestamp >= from_datetime,
-            NiftyIndexData.timestamp <= to_datetime
-        ).count()
-        
-        # Delete 5-minute data
-        session.query(NiftyIndexData).filter(
-            NiftyIndexData.symbol == request.symbol,
-            NiftyIndexData.interval == "5minute",
-            NiftyIndexData.timestamp >= from_datetime,
-            NiftyIndexData.timestamp <= to_datetime
-        ).delete(synchronize_session=False)
+        # Per-interval counts for the response, then both intervals go in one statement
+        counts = dict(
+            session.query(NiftyIndexData.interval, func.count())
+            .filter(*range_filter)
+            .group_by(NiftyIndexData.interval)
+            .all()
+        )
         
-        # Delete hourly data
-        session.query(NiftyIndexData).filter(
-            NiftyIndexData.symbol == request.symbol,
-            NiftyIndexData.interval == "hourly",
-            NiftyIndexData.timestamp >= from_datetime,
-            NiftyIndexData.timestamp <= to_datetime
-        ).delete(synchronize_session=False)
+        session.execute(delete(NiftyIndexData).where(*range_filter))
         
         session.commit()
     
+    count_5min = counts.get("5minute", 0)
+    count_hourly = counts.get("hourly", 0)
+    
     return {
         "status": "success",
         "message": f"Deleted NIFTY data from {request.from_date} to {request.to_date}",
@@ -1209,19 +1606,13 @@ def delete_options_data(request: DeleteDataRequest):
     to_datetime = datetime.combine(request.to_date, datetime.max.time())
     
     with db_manager.get_session() as session:
-        # Count records before deletion
-        count = session.query(OptionsHistoricalData).filter(
-            OptionsHistoricalData.underlying == request.symbol,
-            OptionsHistoricalData.timestamp >= from_datetime,
-            OptionsHistoricalData.timestamp <= to_datetime
-        ).count()
-        
-        # Delete options data
-        session.query(OptionsHistoricalData).filter(
-            OptionsHistoricalData.underlying == request.symbol,
-            OptionsHistoricalData.timestamp >= from_datetime,
-            OptionsHistoricalData.timestamp <= to_datetime
-        ).delete(synchronize_session=False)
+        count = session.execute(
+            delete(OptionsHistoricalData).where(
+                OptionsHistoricalData.underlying == request.symbol,
+                OptionsHistoricalData.timestamp >= from_datetime,
+                OptionsHistoricalData.timestamp <= to_datetime
+            )
+        ).rowcount
         
         session.commit()
     
@@ -1249,15 +1640,8 @@ def delete_all_data(confirm: bool = Query(False, description="Set to true to con
     db_manager = get_db_manager()
     
     with db_manager.get_session() as session:
-        # Count all records
-        nifty_count = session.query(NiftyIndexData).count()
-        options_count = session.query(OptionsHistoricalData).count()
-        
-        # Delete all NIFTY data
-        session.query(NiftyIndexData).delete(synchronize_session=False)
-        
-        # Delete all options data
-        session.query(OptionsHistoricalData).delete(synchronize_session=False)
+        nifty_count = session.execute(delete(NiftyIndexData)).rowcount
+        options_count = session.execute(delete(OptionsHistoricalData)).rowcount
         
         session.commit()
     
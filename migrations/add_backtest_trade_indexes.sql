@@ -0,0 +1,19 @@
+-- Indexes for reading a backtest run's trades
+-- Trade listings filter on BacktestRunId (and optionally SignalType) and order by EntryTime;
+-- positions are loaded for a batch of trades by TradeId
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_BacktestTrades_Run_Signal_Entry'
+    AND object_id = OBJECT_ID('BacktestTrades')
+)
+CREATE NONCLUSTERED INDEX IX_BacktestTrades_Run_Signal_Entry
+ON BacktestTrades (BacktestRunId, SignalType, EntryTime);
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_BacktestPositions_TradeId'
+    AND object_id = OBJECT_ID('BacktestPositions')
+)
+CREATE NONCLUSTERED INDEX IX_BacktestPositions_TradeId
+ON BacktestPositions (TradeId);
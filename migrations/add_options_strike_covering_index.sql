@@ -0,0 +1,20 @@
+-- Covering index for the options collectors' per-day probes
+-- Filters on Underlying/Timestamp/Strike and reads OptionType/TradingSymbol, so both the
+-- grouped strike counts and the (TradingSymbol, Timestamp) dedup lookup stay in the index
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_OptionsData_Underlying_Timestamp_Strike'
+    AND object_id = OBJECT_ID('OptionsHistoricalData')
+)
+CREATE NONCLUSTERED INDEX IX_OptionsData_Underlying_Timestamp_Strike
+ON OptionsHistoricalData (Underlying, Timestamp, Strike, OptionType)
+INCLUDE (TradingSymbol);
+
+-- The new index leads with (Underlying, Timestamp), so the narrower one is redundant
+IF EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_OptionsData_Underlying_Timestamp'
+    AND object_id = OBJECT_ID('OptionsHistoricalData')
+)
+DROP INDEX IX_OptionsData_Underlying_Timestamp ON OptionsHistoricalData;
@@ -0,0 +1,19 @@
+-- Add composite index for NIFTY availability probes
+-- Covers the Symbol/Interval/Timestamp range filter used by the data check endpoints
+
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_NiftyIndexData_Symbol_Interval_Timestamp'
+    AND object_id = OBJECT_ID('NiftyIndexData')
+)
+CREATE NONCLUSTERED INDEX IX_NiftyIndexData_Symbol_Interval_Timestamp
+ON NiftyIndexData (Symbol, Interval, Timestamp);
+
+-- Options probes filter on Underlying/Timestamp
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_OptionsData_Underlying_Timestamp'
+    AND object_id = OBJECT_ID('OptionsHistoricalData')
+)
+CREATE NONCLUSTERED INDEX IX_OptionsData_Underlying_Timestamp
+ON OptionsHistoricalData (Underlying, Timestamp);
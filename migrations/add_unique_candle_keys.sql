@@ -0,0 +1,50 @@
+-- Enforce one row per candle at the database layer
+-- IGNORE_DUP_KEY makes SQL Server drop duplicate rows from an INSERT batch with a warning
+-- instead of failing it, so concurrent collectors can insert without racing on existence checks
+
+-- Remove existing duplicates, keeping the earliest stored row
+WITH Ranked AS (
+    SELECT ROW_NUMBER() OVER (PARTITION BY Symbol, Interval, Timestamp ORDER BY Id) AS RowNum
+    FROM NiftyIndexData
+)
+DELETE FROM Ranked WHERE RowNum > 1;
+
+WITH Ranked AS (
+    SELECT ROW_NUMBER() OVER (PARTITION BY TradingSymbol, Timestamp ORDER BY CreatedAt, Id) AS RowNum
+    FROM OptionsHistoricalData
+)
+DELETE FROM Ranked WHERE RowNum > 1;
+
+-- NIFTY: (Symbol, Interval, Timestamp) replaces the non-unique availability index
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'UX_NiftyIndexData_Symbol_Interval_Timestamp'
+    AND object_id = OBJECT_ID('NiftyIndexData')
+)
+CREATE UNIQUE NONCLUSTERED INDEX UX_NiftyIndexData_Symbol_Interval_Timestamp
+ON NiftyIndexData (Symbol, Interval, Timestamp)
+WITH (IGNORE_DUP_KEY = ON);
+
+IF EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_NiftyIndexData_Symbol_Interval_Timestamp'
+    AND object_id = OBJECT_ID('NiftyIndexData')
+)
+DROP INDEX IX_NiftyIndexData_Symbol_Interval_Timestamp ON NiftyIndexData;
+
+-- Options: (TradingSymbol, Timestamp) replaces the non-unique symbol/time index
+IF NOT EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'UX_OptionsData_Symbol_Timestamp'
+    AND object_id = OBJECT_ID('OptionsHistoricalData')
+)
+CREATE UNIQUE NONCLUSTERED INDEX UX_OptionsData_Symbol_Timestamp
+ON OptionsHistoricalData (TradingSymbol, Timestamp)
+WITH (IGNORE_DUP_KEY = ON);
+
+IF EXISTS (
+    SELECT 1 FROM sys.indexes
+    WHERE name = 'IX_OptionsData_Symbol_Timestamp'
+    AND object_id = OBJECT_ID('OptionsHistoricalData')
+)
+DROP INDEX IX_OptionsData_Symbol_Timestamp ON OptionsHistoricalData;
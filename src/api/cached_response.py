@@ -0,0 +1,32 @@
+"""
+Cached Responses
+Pre-serialized JSON bodies with strong ETags for endpoints whose payload never changes
+"""
+import hashlib
+import json
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+class CachedJSONResponse:
+    """Serializes content once and answers conditional requests with 304"""
+
+    def __init__(self, content: Any, max_age: int = 3600):
+        self.body = json.dumps(content, separators=(",", ":")).encode("utf-8")
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+        self.headers = {
+            "ETag": self.etag,
+            "Cache-Control": f"public, max-age={max_age}"
+        }
+
+    def respond(self, request: Request) -> Response:
+        """Return the cached body, or 304 when the client already holds it"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            client_etags = {tag.strip() for tag in if_none_match.split(",")}
+            if self.etag in client_etags or "*" in client_etags:
+                return Response(status_code=304, headers=self.headers)
+
+        return Response(content=self.body, media_type="application/json", headers=self.headers)
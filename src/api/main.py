@@ -2,16 +2,20 @@
 Main API Application
 FastAPI application with clean architecture
 """
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 import uvicorn
 
 from ..config.settings import get_settings
 from ..infrastructure.di.container import get_container, get_service
 from ..infrastructure.database import get_db_manager
+from .cached_response import CachedJSONResponse
 
 # Import routers
 from .routers import backtest_router, signals_router, test_router
@@ -60,7 +64,8 @@ app = FastAPI(
     title="KiteApp Python API",
     description="Clean Architecture Trading Platform API",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -73,6 +78,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads such as backtest trade listings
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # Include routers
 # Removed unused routers - only backtest and signals are used
@@ -82,15 +90,23 @@ app.include_router(test_router.router, prefix="/api/v2/test", tags=["Testing"])
 app.include_router(working_backtest_router, prefix="/api/v2/working", tags=["Working Backtest"])
 
 
+_ROOT_RESPONSE = CachedJSONResponse({
+    "message": "KiteApp Python API - Clean Architecture",
+    "version": "2.0.0",
+    "status": "running"
+})
+
+
 # Root endpoint
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint"""
-    return {
-        "message": "KiteApp Python API - Clean Architecture",
-        "version": "2.0.0",
-        "status": "running"
-    }
+    return _ROOT_RESPONSE.respond(request)
+
+
+# Database probe result reused between health checks
+HEALTH_CHECK_TTL_SECONDS = 2.0
+_health_state = {"ok": True, "ts": 0.0}
 
 
 # Health check endpoint
@@ -98,9 +114,12 @@ async def root():
 async def health_check():
     """Health check endpoint"""
     try:
-        # Check database
+        # Check database at most once per TTL, off the event loop
         db_manager = get_db_manager()
-        db_healthy = db_manager.test_connection()
+        if time.monotonic() - _health_state["ts"] > HEALTH_CHECK_TTL_SECONDS:
+            _health_state["ok"] = await asyncio.to_thread(db_manager.test_connection)
+            _health_state["ts"] = time.monotonic()
+        db_healthy = _health_state["ok"]
         
         # Overall health
         healthy = db_healthy
@@ -108,7 +127,8 @@ async def health_check():
         return {
             "status": "healthy" if healthy else "degraded",
             "checks": {
-                "database": "healthy" if db_healthy else "unhealthy"
+                "database": "healthy" if db_healthy else "unhealthy",
+                "database_pool": db_manager.pool_status()
             }
         }
     except Exception as e:
@@ -139,11 +159,13 @@ async def global_exception_handler(request, exc):
 def run():
     """Run the application"""
     settings = get_settings()
+    reload = settings.app.environment == "development"
     uvicorn.run(
         "src.api.main:app",
         host=settings.app.host,
         port=settings.app.port,
-        reload=settings.app.environment == "development"
+        reload=reload,
+        workers=None if reload else settings.app.workers
     )
 
 
@@ -155,7 +155,7 @@ async def get_data_availability(
     """
     from ...infrastructure.database.database_manager import get_db_manager
     from ...infrastructure.database.models import NiftyIndexData
-    from sqlalchemy import and_, func
+    from sqlalchemy import Date, cast, func
     from datetime import datetime, timedelta
     
     db_manager = get_db_manager()
@@ -165,60 +165,35 @@ async def get_data_availability(
         from_datetime = datetime.combine(from_date, datetime.min.time())
         to_datetime = datetime.combine(to_date, datetime.max.time())
         
-        # Get counts
-        five_min_count = session.query(NiftyIndexData).filter(
-            and_(
-                NiftyIndexData.symbol == symbol,
-                NiftyIndexData.interval == "5minute",
-                NiftyIndexData.timestamp >= from_datetime,
-                NiftyIndexData.timestamp <= to_datetime
-            )
-        ).count()
-        
-        hourly_count = session.query(NiftyIndexData).filter(
-            and_(
-                NiftyIndexData.symbol == symbol,
-                NiftyIndexData.interval == "hourly",
-                NiftyIndexData.timestamp >= from_datetime,
-                NiftyIndexData.timestamp <= to_datetime
-            )
-        ).count()
-        
-        # Get daily breakdown
-        daily_breakdown = []
-        current_date = from_date
-        
-        while current_date <= to_date:
-            day_start = datetime.combine(current_date, datetime.min.time())
-            day_end = datetime.combine(current_date, datetime.max.time())
-            
-            day_5min = session.query(NiftyIndexData).filter(
-                and_(
-                    NiftyIndexData.symbol == symbol,
-                    NiftyIndexData.interval == "5minute",
-                    NiftyIndexData.timestamp >= day_start,
-                    NiftyIndexData.timestamp <= day_end
-                )
-            ).count()
-            
-            day_hourly = session.query(NiftyIndexData).filter(
-                and_(
-                    NiftyIndexData.symbol == symbol,
-                    NiftyIndexData.interval == "hourly",
-                    NiftyIndexData.timestamp >= day_start,
-                    NiftyIndexData.timestamp <= day_end
-                )
-            ).count()
-            
-            if day_5min > 0 or day_hourly > 0:
-                daily_breakdown.append({
-                    "date": current_date.isoformat(),
-                    "five_minute_count": day_5min,
-                    "hourly_count": day_hourly,
-                    "is_complete": day_5min == 74 and day_hourly == 7
-                })
-            
-            current_date += timedelta(days=1)
+        # One histogram of rows per day and interval replaces the per-day counts
+        day = cast(NiftyIndexData.timestamp, Date)
+        rows = session.query(
+            day, NiftyIndexData.interval, func.count()
+        ).filter(
+            NiftyIndexData.symbol == symbol,
+            NiftyIndexData.interval.in_(("5minute", "hourly")),
+            NiftyIndexData.timestamp >= from_datetime,
+            NiftyIndexData.timestamp <= to_datetime
+        ).group_by(day, NiftyIndexData.interval).all()
+    
+    counts = {}
+    for row_date, interval, count in rows:
+        counts.setdefault(row_date, {})[interval] = count
+    
+    five_min_count = sum(day_counts.get("5minute", 0) for day_counts in counts.values())
+    hourly_count = sum(day_counts.get("hourly", 0) for day_counts in counts.values())
+    
+    # Get daily breakdown
+    daily_breakdown = []
+    for row_date in sorted(counts):
+        day_5min = counts[row_date].get("5minute", 0)
+        day_hourly = counts[row_date].get("hourly", 0)
+        daily_breakdown.append({
+            "date": row_date.isoformat(),
+            "five_minute_count": day_5min,
+            "hourly_count": day_hourly,
+            "is_complete": day_5min == 74 and day_hourly == 7
+        })
     
     # Calculate expected counts
     total_days = (to_date - from_date).days + 1
@@ -254,7 +229,7 @@ async def get_hourly_candles(
     """
     from ...infrastructure.database.database_manager import get_db_manager
     from ...infrastructure.database.models import NiftyIndexData
-    from sqlalchemy import and_
+    from sqlalchemy import and_, func
     from datetime import datetime
     
     db_manager = get_db_manager()
@@ -264,8 +239,15 @@ async def get_hourly_candles(
         day_start = datetime.combine(date, datetime.min.time())
         day_end = datetime.combine(date, datetime.max.time())
         
-        # Get hourly candles
-        hourly_candles = session.query(NiftyIndexData).filter(
+        # Get hourly candles as plain rows
+        hourly_candles = session.query(
+            NiftyIndexData.timestamp,
+            NiftyIndexData.open,
+            NiftyIndexData.high,
+            NiftyIndexData.low,
+            NiftyIndexData.close,
+            NiftyIndexData.volume
+        ).filter(
             and_(
                 NiftyIndexData.symbol == symbol,
                 NiftyIndexData.interval == "hourly",
@@ -287,14 +269,14 @@ async def get_hourly_candles(
             })
         
         # Get 5-minute data count for verification
-        five_min_count = session.query(NiftyIndexData).filter(
+        five_min_count = session.query(func.count(NiftyIndexData.id)).filter(
             and_(
                 NiftyIndexData.symbol == symbol,
                 NiftyIndexData.interval == "5minute",
                 NiftyIndexData.timestamp >= day_start,
                 NiftyIndexData.timestamp <= day_end
             )
-        ).count()
+        ).scalar()
         
     return {
         "date": date.isoformat(),
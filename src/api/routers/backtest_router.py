@@ -6,13 +6,15 @@ import logging
 from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import Optional, List
 from datetime import datetime, date, timedelta
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ...application.use_cases.run_backtest import RunBacktestUseCase, BacktestParameters
 from ...infrastructure.di.container import get_service
-from ...infrastructure.database.models import BacktestRun, BacktestTrade, BacktestStatus
+from ...infrastructure.database.models import BacktestRun, BacktestTrade, BacktestStatus, TradeOutcome
 from ...infrastructure.database.database_manager import get_db_manager
-from sqlalchemy import and_
+from ...utils.market_hours import MARKET_OPEN, MARKET_CLOSE
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.orm import selectinload
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +39,21 @@ class RunBacktestRequest(BaseModel):
     slippage_percent: float = Field(default=0.001, description="Slippage percentage")
 
 
+class RunBacktestResponse(BaseModel):
+    """Response model for a started backtest"""
+    model_config = ConfigDict(frozen=True)
+    
+    success: bool
+    backtest_id: str
+    message: str
+    status_url: str
+    results_url: str
+
+
 class BacktestResultResponse(BaseModel):
     """Response model for backtest results"""
+    model_config = ConfigDict(frozen=True)
+    
     backtest_id: str
     status: str
     from_date: datetime
@@ -123,6 +138,8 @@ class TradeDetailResponse(BaseModel):
 
 class SignalPerformanceResponse(BaseModel):
     """Response model for signal performance"""
+    model_config = ConfigDict(frozen=True)
+    
     signal_type: str
     total_trades: int
     winning_trades: int
@@ -134,7 +151,7 @@ class SignalPerformanceResponse(BaseModel):
     worst_trade_pnl: float
 
 
-@router.post("/run")
+@router.post("/run", response_model=RunBacktestResponse)
 async def run_backtest(
     request: RunBacktestRequest,
     backtest_service: RunBacktestUseCase = Depends(lambda: get_service(RunBacktestUseCase))
@@ -154,9 +171,9 @@ async def run_backtest(
     try:
         # Convert dates to datetime with market hours
         # Start at 9:15 AM IST (market open)
-        from_date = datetime.combine(request.from_date, datetime.strptime("09:15", "%H:%M").time())
+        from_date = datetime.combine(request.from_date, MARKET_OPEN)
         # End at 3:30 PM IST (market close)
-        to_date = datetime.combine(request.to_date, datetime.strptime("15:30", "%H:%M").time())
+        to_date = datetime.combine(request.to_date, MARKET_CLOSE)
         
         # Create backtest parameters
         params = BacktestParameters(
@@ -180,13 +197,13 @@ async def run_backtest(
             run = session.query(BacktestRun).filter_by(id=backtest_id).first()
             logger.info(f"[DEBUG] Backtest {backtest_id} completed with {run.total_trades} trades")
         
-        return {
-            "success": True,
-            "backtest_id": backtest_id,
-            "message": "Backtest started successfully",
-            "status_url": f"/api/v2/backtest/status/{backtest_id}",
-            "results_url": f"/api/v2/backtest/results/{backtest_id}"
-        }
+        return RunBacktestResponse.model_construct(
+            success=True,
+            backtest_id=backtest_id,
+            message="Backtest started successfully",
+            status_url=f"/api/v2/backtest/status/{backtest_id}",
+            results_url=f"/api/v2/backtest/results/{backtest_id}"
+        )
         
     except Exception as e:
         logger.error(f"Error starting backtest: {e}")
@@ -218,7 +235,7 @@ async def get_backtest_status(backtest_id: str):
         }
 
 
-@router.get("/latest")
+@router.get("/latest", response_model=BacktestResultResponse)
 async def get_latest_backtest():
     """Get the most recent backtest results"""
     db_manager = get_db_manager()
@@ -231,7 +248,8 @@ async def get_latest_backtest():
         if not latest_backtest:
             raise HTTPException(status_code=404, detail="No completed backtests found")
         
-        return BacktestResultResponse(
+        # Trusted ORM values: skip construction-time validation
+        return BacktestResultResponse.model_construct(
             backtest_id=latest_backtest.id,
             status=latest_backtest.status.value,
             from_date=latest_backtest.from_date,
@@ -294,7 +312,7 @@ async def get_backtest_results(
             if not backtest:
                 raise HTTPException(status_code=404, detail="Backtest not found")
             
-            return BacktestResultResponse(
+            return BacktestResultResponse.model_construct(
                 backtest_id=backtest.id,
                 status=backtest.status.value,
                 from_date=backtest.from_date,
@@ -319,35 +337,45 @@ async def get_backtest_results(
             from_dt = datetime.combine(from_date, datetime.min.time())
             to_dt = datetime.combine(to_date, datetime.max.time())
             
-            backtests = session.query(BacktestRun).filter(
-                and_(
-                    BacktestRun.from_date <= to_dt,
-                    BacktestRun.to_date >= from_dt,
-                    BacktestRun.status == BacktestStatus.COMPLETED
-                )
-            ).all()
+            run_filter = and_(
+                BacktestRun.from_date <= to_dt,
+                BacktestRun.to_date >= from_dt,
+                BacktestRun.status == BacktestStatus.COMPLETED
+            )
             
-            if not backtests:
+            # Aggregate results in the database
+            backtest_count, total_trades, winning_trades, losing_trades, total_pnl = session.query(
+                func.count(BacktestRun.id),
+                func.coalesce(func.sum(BacktestRun.total_trades), 0),
+                func.coalesce(func.sum(BacktestRun.winning_trades), 0),
+                func.coalesce(func.sum(BacktestRun.losing_trades), 0),
+                func.coalesce(func.sum(BacktestRun.total_pnl), 0)
+            ).filter(run_filter).one()
+            
+            if not backtest_count:
                 raise HTTPException(status_code=404, detail="No backtests found for the specified date range")
             
-            # Aggregate results
-            total_trades = sum(bt.total_trades for bt in backtests)
-            winning_trades = sum(bt.winning_trades for bt in backtests)
-            losing_trades = sum(bt.losing_trades for bt in backtests)
-            total_pnl = sum(float(bt.total_pnl) for bt in backtests if bt.total_pnl)
+            backtests = session.query(
+                BacktestRun.id,
+                BacktestRun.from_date,
+                BacktestRun.to_date,
+                BacktestRun.total_trades,
+                BacktestRun.win_rate,
+                BacktestRun.total_pnl
+            ).filter(run_filter).all()
             
             return {
                 "query": {
                     "from_date": from_date,
                     "to_date": to_date,
-                    "backtest_count": len(backtests)
+                    "backtest_count": backtest_count
                 },
                 "aggregated_results": {
                     "total_trades": total_trades,
                     "winning_trades": winning_trades,
                     "losing_trades": losing_trades,
                     "win_rate": (winning_trades / total_trades * 100) if total_trades > 0 else 0,
-                    "total_pnl": total_pnl
+                    "total_pnl": float(total_pnl)
                 },
                 "backtests": [{
                     "backtest_id": bt.id,
@@ -412,7 +440,9 @@ async def get_backtest_trades(
         total_count = query.count()
         
         # Get trades with pagination
-        trades = query.order_by(BacktestTrade.entry_time).limit(limit).offset(offset).all()
+        trades = query.options(
+            selectinload(BacktestTrade.positions)
+        ).order_by(BacktestTrade.entry_time).limit(limit).offset(offset).all()
         
         trade_details = []
         for trade in trades:
@@ -520,7 +550,8 @@ async def get_backtest_trades(
 async def get_signal_performance(
     backtest_id: Optional[str] = Query(None, description="Specific backtest ID"),
     from_date: Optional[date] = Query(None, description="Start date for filtering"),
-    to_date: Optional[date] = Query(None, description="End date for filtering")
+    to_date: Optional[date] = Query(None, description="End date for filtering"),
+    include_trades: bool = Query(False, description="Also return the individual trades")
 ):
     """
     Get performance breakdown by signal type
@@ -531,72 +562,73 @@ async def get_signal_performance(
     
     with db_manager.get_session() as session:
         if backtest_id:
-            trades = session.query(BacktestTrade).filter_by(backtest_run_id=backtest_id).all()
+            trade_filter = BacktestTrade.backtest_run_id == backtest_id
         elif from_date and to_date:
             from_dt = datetime.combine(from_date, datetime.min.time())
             to_dt = datetime.combine(to_date, datetime.max.time())
-            trades = session.query(BacktestTrade).filter(
-                and_(
-                    BacktestTrade.entry_time >= from_dt,
-                    BacktestTrade.entry_time <= to_dt
-                )
-            ).all()
+            trade_filter = and_(
+                BacktestTrade.entry_time >= from_dt,
+                BacktestTrade.entry_time <= to_dt
+            )
         else:
             raise HTTPException(status_code=400, detail="Either backtest_id or both from_date and to_date are required")
         
-        if not trades:
+        # Aggregate per signal in the database instead of loading every trade
+        rows = session.query(
+            BacktestTrade.signal_type,
+            func.count(BacktestTrade.id),
+            func.sum(case((BacktestTrade.outcome == TradeOutcome.WIN, 1), else_=0)),
+            func.sum(case((BacktestTrade.outcome.in_([TradeOutcome.LOSS, TradeOutcome.STOPPED]), 1), else_=0)),
+            # Trades with no or zero P&L are left out of the P&L figures
+            func.sum(func.nullif(BacktestTrade.total_pnl, 0)),
+            func.max(func.nullif(BacktestTrade.total_pnl, 0)),
+            func.min(func.nullif(BacktestTrade.total_pnl, 0))
+        ).filter(trade_filter).group_by(BacktestTrade.signal_type).all()
+        
+        if not rows:
             raise HTTPException(status_code=404, detail="No trades found for this backtest")
         
-        # Group by signal type
-        signal_performance = {}
-        
-        for trade in trades:
-            signal = trade.signal_type
-            if signal not in signal_performance:
-                signal_performance[signal] = {
-                    "total_trades": 0,
-                    "winning_trades": 0,
-                    "losing_trades": 0,
-                    "total_pnl": 0,
-                    "pnl_list": []
-                }
-            
-            stats = signal_performance[signal]
-            stats["total_trades"] += 1
-            
-            if trade.outcome.value == "WIN":
-                stats["winning_trades"] += 1
-            elif trade.outcome.value in ["LOSS", "STOPPED"]:
-                stats["losing_trades"] += 1
-            
-            if trade.total_pnl:
-                pnl = float(trade.total_pnl)
-                stats["total_pnl"] += pnl
-                stats["pnl_list"].append(pnl)
-        
-        # Calculate final stats
         results = []
-        for signal, stats in signal_performance.items():
-            pnl_list = stats["pnl_list"]
-            results.append(SignalPerformanceResponse(
+        for signal, total, wins, losses, pnl_sum, pnl_max, pnl_min in rows:
+            total_pnl = float(pnl_sum or 0)
+            results.append(SignalPerformanceResponse.model_construct(
                 signal_type=signal,
-                total_trades=stats["total_trades"],
-                winning_trades=stats["winning_trades"],
-                losing_trades=stats["losing_trades"],
-                win_rate=(stats["winning_trades"] / stats["total_trades"] * 100) if stats["total_trades"] > 0 else 0,
-                total_pnl=stats["total_pnl"],
-                avg_pnl_per_trade=stats["total_pnl"] / stats["total_trades"] if stats["total_trades"] > 0 else 0,
-                best_trade_pnl=max(pnl_list) if pnl_list else 0,
-                worst_trade_pnl=min(pnl_list) if pnl_list else 0
+                total_trades=total,
+                winning_trades=wins or 0,
+                losing_trades=losses or 0,
+                win_rate=((wins or 0) / total * 100) if total > 0 else 0,
+                total_pnl=total_pnl,
+                avg_pnl_per_trade=total_pnl / total if total > 0 else 0,
+                best_trade_pnl=float(pnl_max or 0),
+                worst_trade_pnl=float(pnl_min or 0)
             ))
         
         # Sort by total P&L
         results.sort(key=lambda x: x.total_pnl, reverse=True)
         
-        return {
+        response = {
             "backtest_id": backtest_id,
             "signal_performance": results
         }
+        
+        if include_trades:
+            trades = session.query(
+                BacktestTrade.signal_type,
+                BacktestTrade.entry_time,
+                BacktestTrade.outcome,
+                BacktestTrade.total_pnl
+            ).filter(trade_filter).order_by(BacktestTrade.entry_time).all()
+            response["trades"] = [
+                {
+                    "signal_type": signal,
+                    "entry_time": entry_time.isoformat(),
+                    "outcome": outcome.value,
+                    "total_pnl": float(pnl) if pnl else 0
+                }
+                for signal, entry_time, outcome, pnl in trades
+            ]
+        
+        return response
 
 
 @router.get("/daily-pnl")
@@ -615,22 +647,32 @@ async def get_daily_pnl(
     with db_manager.get_session() as session:
         from ...infrastructure.database.models import BacktestDailyResult
         
+        # Read-only listing: plain rows, no ORM instances
+        query = select(
+            BacktestDailyResult.date,
+            BacktestDailyResult.starting_capital,
+            BacktestDailyResult.ending_capital,
+            BacktestDailyResult.daily_pnl,
+            BacktestDailyResult.daily_return_percent,
+            BacktestDailyResult.trades_opened,
+            BacktestDailyResult.trades_closed,
+            BacktestDailyResult.open_positions
+        ).order_by(BacktestDailyResult.date)
+        
         if backtest_id:
-            daily_results = session.query(BacktestDailyResult).filter_by(
-                backtest_run_id=backtest_id
-            ).order_by(BacktestDailyResult.date).all()
+            query = query.where(BacktestDailyResult.backtest_run_id == backtest_id)
         elif from_date and to_date:
             from_dt = datetime.combine(from_date, datetime.min.time())
             to_dt = datetime.combine(to_date, datetime.max.time())
-            daily_results = session.query(BacktestDailyResult).filter(
-                and_(
-                    BacktestDailyResult.date >= from_dt,
-                    BacktestDailyResult.date <= to_dt
-                )
-            ).order_by(BacktestDailyResult.date).all()
+            query = query.where(
+                BacktestDailyResult.date >= from_dt,
+                BacktestDailyResult.date <= to_dt
+            )
         else:
             raise HTTPException(status_code=400, detail="Either backtest_id or both from_date and to_date are required")
         
+        daily_results = session.execute(query).all()
+        
         if not daily_results:
             raise HTTPException(status_code=404, detail="No daily results found")
         
@@ -716,14 +758,30 @@ async def list_backtests(
     db_manager = get_db_manager()
     
     with db_manager.get_session() as session:
-        query = session.query(BacktestRun)
-        
-        if status:
-            query = query.filter_by(status=status)
+        status_filter = [BacktestRun.status == status] if status else []
         
-        total_count = query.count()
+        total_count = session.scalar(
+            select(func.count(BacktestRun.id)).where(*status_filter)
+        )
         
-        backtests = query.order_by(BacktestRun.created_at.desc()).limit(limit).offset(offset).all()
+        # Read-only listing: plain rows, no ORM instances
+        backtests = session.execute(
+            select(
+                BacktestRun.id,
+                BacktestRun.name,
+                BacktestRun.status,
+                BacktestRun.from_date,
+                BacktestRun.to_date,
+                BacktestRun.initial_capital,
+                BacktestRun.total_trades,
+                BacktestRun.win_rate,
+                BacktestRun.total_pnl,
+                BacktestRun.created_at,
+                BacktestRun.completed_at
+            ).where(*status_filter)
+            .order_by(BacktestRun.created_at.desc())
+            .limit(limit).offset(offset)
+        ).all()
         
         return {
             "total_count": total_count,
@@ -16,6 +16,7 @@ from ...application.dto.requests import (
 from ...application.dto.responses import BaseResponse
 from ...application.use_cases import CollectWeeklyDataUseCase, FetchOptionChainUseCase
 from ...infrastructure.di.container import get_service
+from ...infrastructure.services.data_collection_service import DataCollectionService
 
 logger = logging.getLogger(__name__)
 
@@ -118,7 +119,8 @@ async def get_available_expiries(
 
 @router.post("/collect/nifty", response_model=BaseResponse)
 async def collect_nifty_data(
-    request: CollectNiftyDataRequest
+    request: CollectNiftyDataRequest,
+    data_service: DataCollectionService = Depends(lambda: get_service(DataCollectionService))
 ):
     """
     Collect historical NIFTY index data
@@ -134,16 +136,10 @@ async def collect_nifty_data(
     - 9:15 candle uses 9:20-10:20 data, 10:15 uses 10:20-11:20, etc.
     """
     try:
-        from ...infrastructure.services.data_collection_service import DataCollectionService
-        from ...infrastructure.services.breeze_service import BreezeService
         from ...infrastructure.database import get_db_manager
         
         logger.info(f"Collecting NIFTY data from {request.from_date} to {request.to_date}")
         
-        # Initialize services
-        breeze_service = BreezeService()
-        data_service = DataCollectionService(breeze_service)
-        
         # Convert dates to datetime
         from_datetime = datetime.combine(request.from_date, datetime.min.time())
         to_datetime = datetime.combine(request.to_date, datetime.max.time())
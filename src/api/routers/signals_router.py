@@ -2,7 +2,7 @@
 Signals Router
 API endpoints for testing and monitoring trading signals
 """
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException, Request
 from typing import List, Dict, Optional, Any
 from datetime import datetime, date
 from pydantic import BaseModel, Field
@@ -10,6 +10,7 @@ import asyncio
 import json
 
 from ...infrastructure.di.container import get_service
+from ..cached_response import CachedJSONResponse
 
 
 # Request/Response Models
@@ -189,91 +190,96 @@ async def backtest_signals(request: BacktestSignalsRequest):
     return summary
 
 
+SIGNAL_EXAMPLES = {
+    "S1": {
+        "description": "Bear Trap - Fake breakdown below support that recovers",
+        "required_bias": "Any",
+        "triggers_on": "2nd hourly candle",
+        "test_data": {
+            "weekly_zones": {
+                "upper_zone_top": 23600,
+                "upper_zone_bottom": 23550,
+                "lower_zone_top": 23250,
+                "lower_zone_bottom": 23200,
+                "prev_week_high": 23600,
+                "prev_week_low": 23200,
+                "prev_week_close": 23400
+            },
+            "weekly_bias": "NEUTRAL",
+            "candles": [
+                {
+                    "timestamp": "2024-01-22T09:15:00",
+                    "open": 23220,
+                    "high": 23280,
+                    "low": 23150,
+                    "close": 23180,
+                    "volume": 1000
+                },
+                {
+                    "timestamp": "2024-01-22T10:15:00",
+                    "open": 23185,
+                    "high": 23220,
+                    "low": 23170,
+                    "close": 23200,
+                    "volume": 1200
+                }
+            ]
+        }
+    },
+    "S2": {
+        "description": "Support Hold - Price respects support with bullish bias",
+        "required_bias": "BULLISH",
+        "triggers_on": "2nd hourly candle",
+        "test_data": {
+            "weekly_zones": {
+                "upper_zone_top": 23600,
+                "upper_zone_bottom": 23550,
+                "lower_zone_top": 23250,
+                "lower_zone_bottom": 23200,
+                "prev_week_high": 23600,
+                "prev_week_low": 23200,
+                "prev_week_close": 23220
+            },
+            "weekly_bias": "BULLISH",
+            "candles": [
+                {
+                    "timestamp": "2024-01-22T09:15:00",
+                    "open": 23210,
+                    "high": 23250,
+                    "low": 23195,
+                    "close": 23230,
+                    "volume": 1000
+                },
+                {
+                    "timestamp": "2024-01-22T10:15:00",
+                    "open": 23235,
+                    "high": 23260,
+                    "low": 23220,
+                    "close": 23250,
+                    "volume": 1200
+                }
+            ]
+        }
+    },
+    # Add more examples for S3-S8...
+}
+
+_EXAMPLE_RESPONSES = {
+    signal: CachedJSONResponse(example) for signal, example in SIGNAL_EXAMPLES.items()
+}
+
+
 @router.get("/examples/{signal_type}")
-async def get_signal_example(signal_type: str):
+async def get_signal_example(signal_type: str, request: Request):
     """
     Get example test data for a specific signal type
     
     This helps understand what conditions trigger each signal
     """
-    examples = {
-        "S1": {
-            "description": "Bear Trap - Fake breakdown below support that recovers",
-            "required_bias": "Any",
-            "triggers_on": "2nd hourly candle",
-            "test_data": {
-                "weekly_zones": {
-                    "upper_zone_top": 23600,
-                    "upper_zone_bottom": 23550,
-                    "lower_zone_top": 23250,
-                    "lower_zone_bottom": 23200,
-                    "prev_week_high": 23600,
-                    "prev_week_low": 23200,
-                    "prev_week_close": 23400
-                },
-                "weekly_bias": "NEUTRAL",
-                "candles": [
-                    {
-                        "timestamp": "2024-01-22T09:15:00",
-                        "open": 23220,
-                        "high": 23280,
-                        "low": 23150,
-                        "close": 23180,
-                        "volume": 1000
-                    },
-                    {
-                        "timestamp": "2024-01-22T10:15:00",
-                        "open": 23185,
-                        "high": 23220,
-                        "low": 23170,
-                        "close": 23200,
-                        "volume": 1200
-                    }
-                ]
-            }
-        },
-        "S2": {
-            "description": "Support Hold - Price respects support with bullish bias",
-            "required_bias": "BULLISH",
-            "triggers_on": "2nd hourly candle",
-            "test_data": {
-                "weekly_zones": {
-                    "upper_zone_top": 23600,
-                    "upper_zone_bottom": 23550,
-                    "lower_zone_top": 23250,
-                    "lower_zone_bottom": 23200,
-                    "prev_week_high": 23600,
-                    "prev_week_low": 23200,
-                    "prev_week_close": 23220
-                },
-                "weekly_bias": "BULLISH",
-                "candles": [
-                    {
-                        "timestamp": "2024-01-22T09:15:00",
-                        "open": 23210,
-                        "high": 23250,
-                        "low": 23195,
-                        "close": 23230,
-                        "volume": 1000
-                    },
-                    {
-                        "timestamp": "2024-01-22T10:15:00",
-                        "open": 23235,
-                        "high": 23260,
-                        "low": 23220,
-                        "close": 23250,
-                        "volume": 1200
-                    }
-                ]
-            }
-        },
-        # Add more examples for S3-S8...
-    }
-    
-    if signal_type not in examples:
+    if signal_type not in _EXAMPLE_RESPONSES:
         raise HTTPException(status_code=404, detail=f"No example found for signal {signal_type}")
     
-    return examples[signal_type]
+    return _EXAMPLE_RESPONSES[signal_type].respond(request)
 
 
 @router.websocket("/ws")
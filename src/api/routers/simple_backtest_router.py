@@ -1,29 +1,27 @@
 """Simple backtest router that works"""
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from datetime import datetime
 from typing import Dict
 import asyncio
+from sqlalchemy.orm import selectinload
+
+from ...application.use_cases.run_backtest import RunBacktestUseCase
+from ...infrastructure.di.container import get_service
 
 router = APIRouter()
 
 @router.get("/run")
-async def run_simple_backtest() -> Dict:
+async def run_simple_backtest(
+    backtest: RunBacktestUseCase = Depends(lambda: get_service(RunBacktestUseCase))
+) -> Dict:
     """Run backtest for July 14, 2025 with 10 lots"""
     
     # Import everything we need
     from ...infrastructure.database.database_manager import get_db_manager
-    from ...infrastructure.services.data_collection_service import DataCollectionService
-    from ...infrastructure.services.breeze_service import BreezeService
-    from ...infrastructure.services.option_pricing_service import OptionPricingService
-    from ...application.use_cases.run_backtest import RunBacktestUseCase, BacktestParameters
-    from ...infrastructure.database.models import BacktestRun, BacktestTrade, BacktestPosition
+    from ...application.use_cases.run_backtest import BacktestParameters
+    from ...infrastructure.database.models import BacktestRun, BacktestTrade
     
-    # Setup services
     db = get_db_manager()
-    breeze = BreezeService()
-    data_svc = DataCollectionService(breeze, db)
-    option_svc = OptionPricingService(data_svc, db)
-    backtest = RunBacktestUseCase(data_svc, option_svc)
     
     # Parameters for July 14, 2025 with 10 lots
     params = BacktestParameters(
@@ -45,18 +43,17 @@ async def run_simple_backtest() -> Dict:
     # Get results
     with db.get_session() as session:
         run = session.query(BacktestRun).filter_by(id=backtest_id).first()
-        trades = session.query(BacktestTrade).filter_by(
+        # Load the run's trades with their positions fetched in one extra query
+        trades = session.query(BacktestTrade).options(
+            selectinload(BacktestTrade.positions)
+        ).filter_by(
             backtest_run_id=backtest_id
         ).all()
         
         trade_details = []
         for trade in trades:
-            positions = session.query(BacktestPosition).filter_by(
-                trade_id=trade.id
-            ).all()
-            
             position_info = []
-            for pos in positions:
+            for pos in trade.positions:
                 action = "SELL" if pos.quantity < 0 else "BUY"
                 position_info.append({
                     "type": pos.position_type,
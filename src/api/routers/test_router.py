@@ -1,9 +1,14 @@
 """Test router - working backtest implementation"""
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 from datetime import datetime, date
 from pydantic import BaseModel
 from typing import List, Optional, Dict
 import asyncio
+from sqlalchemy.orm import selectinload
+
+from ...application.use_cases.run_backtest import RunBacktestUseCase
+from ...infrastructure.di.container import get_service
+from ...utils.market_hours import MARKET_OPEN, MARKET_CLOSE
 
 router = APIRouter()
 
@@ -42,27 +47,21 @@ class BacktestResult(BaseModel):
     hedge_offset: int
 
 @router.post("/run-backtest")
-async def run_backtest_direct(request: BacktestRequest):
-    """Run backtest using direct implementation (bypassing DI container)"""
+async def run_backtest_direct(
+    request: BacktestRequest,
+    backtest: RunBacktestUseCase = Depends(lambda: get_service(RunBacktestUseCase))
+):
+    """Run backtest using direct implementation"""
     
-    # Import everything we need directly
     from ...infrastructure.database.database_manager import get_db_manager
-    from ...infrastructure.services.data_collection_service import DataCollectionService
-    from ...infrastructure.services.breeze_service import BreezeService
-    from ...infrastructure.services.option_pricing_service import OptionPricingService
-    from ...application.use_cases.run_backtest import RunBacktestUseCase, BacktestParameters
-    from ...infrastructure.database.models import BacktestRun, BacktestTrade, BacktestPosition
+    from ...application.use_cases.run_backtest import BacktestParameters
+    from ...infrastructure.database.models import BacktestRun, BacktestTrade
     
-    # Setup services directly (no DI container)
     db = get_db_manager()
-    breeze = BreezeService()
-    data_svc = DataCollectionService(breeze, db)
-    option_svc = OptionPricingService(data_svc, db)
-    backtest = RunBacktestUseCase(data_svc, option_svc)
     
     # Convert dates to datetime
-    from_datetime = datetime.combine(request.from_date, datetime.strptime("09:15", "%H:%M").time())
-    to_datetime = datetime.combine(request.to_date, datetime.strptime("15:30", "%H:%M").time())
+    from_datetime = datetime.combine(request.from_date, MARKET_OPEN)
+    to_datetime = datetime.combine(request.to_date, MARKET_CLOSE)
     
     # Create parameters
     params = BacktestParameters(
@@ -85,20 +84,17 @@ async def run_backtest_direct(request: BacktestRequest):
     with db.get_session() as session:
         run = session.query(BacktestRun).filter_by(id=backtest_id).first()
         
-        # Get trades
-        trades = session.query(BacktestTrade).filter_by(
+        # Load the run's trades with their positions fetched in one extra query
+        trades = session.query(BacktestTrade).options(
+            selectinload(BacktestTrade.positions)
+        ).filter_by(
             backtest_run_id=backtest_id
         ).all()
         
         trade_results = []
         for trade in trades:
-            # Get positions
-            positions = session.query(BacktestPosition).filter_by(
-                trade_id=trade.id
-            ).all()
-            
             position_data = []
-            for pos in positions:
+            for pos in trade.positions:
                 action = "SELL" if pos.quantity < 0 else "BUY"
                 position_data.append({
                     "type": pos.position_type,
@@ -154,12 +150,12 @@ async def run_backtest_with_params(
     signal_s5: bool = Query(default=True, description="Test signal S5"),
     signal_s6: bool = Query(default=True, description="Test signal S6"),
     signal_s7: bool = Query(default=True, description="Test signal S7"),
-    signal_s8: bool = Query(default=True, description="Test signal S8")
+    signal_s8: bool = Query(default=True, description="Test signal S8"),
+    backtest: RunBacktestUseCase = Depends(lambda: get_service(RunBacktestUseCase))
 ) -> Dict:
     """
     Run backtest with custom parameters - accepts user input in Swagger
     
-    This endpoint bypasses the DI container to avoid caching issues.
     All parameters can be customized in Swagger UI.
     """
     
@@ -189,4 +185,4 @@ async def run_backtest_with_params(
     )
     
     # Use the direct implementation
-    return await run_backtest_direct(request)
\ No newline at end of file
+    return await run_backtest_direct(request, backtest)
\ No newline at end of file
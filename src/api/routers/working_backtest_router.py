@@ -1,28 +1,25 @@
-"""Working backtest router - completely bypasses DI container"""
-from fastapi import APIRouter
+"""Working backtest router - direct implementation on shared services"""
+from fastapi import APIRouter, Depends
 from datetime import datetime
 import asyncio
 
+from src.application.use_cases.run_backtest import RunBacktestUseCase
+from src.infrastructure.di.container import get_service
+
 router = APIRouter()
 
 @router.get("/july14")
-async def backtest_july14():
+async def backtest_july14(
+    backtest: RunBacktestUseCase = Depends(lambda: get_service(RunBacktestUseCase))
+):
     """Run backtest for July 14, 2025 - Direct implementation"""
     
-    # Import at runtime to avoid caching
     from src.infrastructure.database.database_manager import get_db_manager
-    from src.infrastructure.services.data_collection_service import DataCollectionService
-    from src.infrastructure.services.breeze_service import BreezeService
-    from src.infrastructure.services.option_pricing_service import OptionPricingService
-    from src.application.use_cases.run_backtest import RunBacktestUseCase, BacktestParameters
-    from src.infrastructure.database.models import BacktestRun, BacktestTrade, BacktestPosition
+    from src.application.use_cases.run_backtest import BacktestParameters
+    from src.infrastructure.database.models import BacktestRun, BacktestTrade
+    from sqlalchemy.orm import selectinload
     
-    # Create fresh instances
     db = get_db_manager()
-    breeze = BreezeService()
-    data_svc = DataCollectionService(breeze, db)
-    option_svc = OptionPricingService(data_svc, db)
-    backtest = RunBacktestUseCase(data_svc, option_svc)
     
     # Fixed parameters
     params = BacktestParameters(
@@ -43,15 +40,14 @@ async def backtest_july14():
     
     # Get results
     with db.get_session() as session:
-        run = session.query(BacktestRun).filter_by(id=backtest_id).first()
-        trades = session.query(BacktestTrade).filter_by(backtest_run_id=backtest_id).all()
+        run = session.query(BacktestRun).options(
+            selectinload(BacktestRun.trades).selectinload(BacktestTrade.positions)
+        ).filter_by(id=backtest_id).first()
         
         trade_details = []
-        for trade in trades:
-            positions = session.query(BacktestPosition).filter_by(trade_id=trade.id).all()
-            
+        for trade in run.trades:
             pos_details = []
-            for pos in positions:
+            for pos in trade.positions:
                 pos_details.append({
                     "type": pos.position_type,
                     "action": "SELL" if pos.quantity < 0 else "BUY",
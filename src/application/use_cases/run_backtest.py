@@ -3,8 +3,10 @@ Run Backtest Use Case
 Main backtesting logic that orchestrates the entire backtest process
 """
 import logging
+from bisect import bisect_left
+from contextlib import aclosing
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from decimal import Decimal
 import asyncio
 
@@ -27,6 +29,9 @@ from ...infrastructure.database.database_manager import get_db_manager
 
 logger = logging.getLogger(__name__)
 
+# Bars loaded ahead of the backtest window so the first week has a previous week for its zones
+PREVIOUS_WEEK_BUFFER = timedelta(days=7)
+
 
 class BacktestParameters:
     """Parameters for running a backtest"""
@@ -115,21 +120,19 @@ class RunBacktestUseCase:
             await self._update_backtest_status(backtest_run.id, BacktestStatus.RUNNING)
             
             # Ensure data is available
-            await self._ensure_data_available(params.from_date, params.to_date)
-            
-            # Get NIFTY data for the period (including buffer for previous week)
-            buffer_start = params.from_date - timedelta(days=7)
-            nifty_data = await self.data_collection.get_nifty_data(
-                buffer_start, params.to_date
-            )
+            last_bar = await self._ensure_data_available(params.from_date, params.to_date)
             
-            if not nifty_data:
+            if not last_bar:
                 raise ValueError("No NIFTY data available for the specified period")
             
-            # Run backtest
-            results = await self._run_backtest_logic(
-                backtest_run, nifty_data, params
-            )
+            # Run backtest, streaming NIFTY bars (including buffer for previous week);
+            # aclosing releases the stream's session even if the backtest stops early
+            async with aclosing(self.data_collection.iter_nifty_data(
+                params.from_date - PREVIOUS_WEEK_BUFFER, params.to_date
+            )) as nifty_data:
+                results = await self._run_backtest_logic(
+                    backtest_run, nifty_data, params
+                )
             
             # Update backtest run with results
             await self._update_backtest_results(backtest_run.id, results)
@@ -171,10 +174,10 @@ class RunBacktestUseCase:
         
         return backtest_run
     
-    async def _ensure_data_available(self, from_date: datetime, to_date: datetime):
-        """Ensure all required data is available"""
+    async def _ensure_data_available(self, from_date: datetime, to_date: datetime) -> Optional[NiftyIndexDataHourly]:
+        """Ensure all required data is available and return the last hourly NIFTY bar"""
         # Add buffer for previous week data needed for zone calculation
-        buffer_start = from_date - timedelta(days=7)
+        buffer_start = from_date - PREVIOUS_WEEK_BUFFER
         
         # Ensure NIFTY data - don't fetch from API during backtesting
         added = await self.data_collection.ensure_nifty_data_available(
@@ -187,15 +190,13 @@ class RunBacktestUseCase:
         # Get all potential expiry dates in the period
         expiry_dates = self._get_expiry_dates(from_date, to_date)
         
+        last_bar = await self.data_collection.get_last_nifty_bar(buffer_start, to_date)
+        
         # Get required strikes (only fetch around current NIFTY level)
-        # Get current NIFTY level from recent data
+        # Current NIFTY level is the last close in the period
         current_nifty = 25000  # Default fallback
-        with self.db_manager.get_session() as session:
-            recent_data = session.query(NiftyIndexDataHourly).filter(
-                NiftyIndexDataHourly.timestamp <= to_date
-            ).order_by(NiftyIndexDataHourly.timestamp.desc()).first()
-            if recent_data:
-                current_nifty = int(recent_data.close)
+        if last_bar:
+            current_nifty = int(last_bar.close)
         
         # Only fetch strikes within reasonable range (±1000 points from current level)
         # This covers main positions and hedges
@@ -213,6 +214,8 @@ class RunBacktestUseCase:
             
             if added > 0:
                 logger.info(f"Added {added} options data records for expiry {expiry.date()}")
+        
+        return last_bar
     
     def _get_expiry_dates(self, from_date: datetime, to_date: datetime) -> List[datetime]:
         """Get all Thursday expiry dates in the period"""
@@ -230,7 +233,7 @@ class RunBacktestUseCase:
     async def _run_backtest_logic(
         self,
         backtest_run: BacktestRun,
-        nifty_data: List[NiftyIndexDataHourly],
+        nifty_data: AsyncIterator[NiftyIndexDataHourly],
         params: BacktestParameters
     ) -> Dict:
         """Main backtest logic"""
@@ -243,9 +246,30 @@ class RunBacktestUseCase:
         # Track daily P&L
         current_date = None
         daily_starting_capital = current_capital
-        
-        # Process each hourly bar
-        for i, data_point in enumerate(nifty_data):
+        # Trades open at some point during the current day; only these can open or close on it
+        day_trades: List[BacktestTrade] = []
+        
+        # Bars from the previous week's start onwards; older bars are dropped when the week changes
+        recent_bars: List[NiftyIndexDataHourly] = []
+        recent_week_start = None
+        prev_point = None
+        last_point = None
+        
+        # Process each hourly bar as it streams in
+        i = -1
+        async for data_point in nifty_data:
+            i += 1
+            prev_point, last_point = last_point, data_point
+            
+            week_start = self.context_manager.get_week_start(data_point.timestamp)
+            if week_start != recent_week_start:
+                keep_from = bisect_left(
+                    recent_bars, week_start - PREVIOUS_WEEK_BUFFER, key=lambda bar: bar.timestamp
+                )
+                del recent_bars[:keep_from]
+                recent_week_start = week_start
+            recent_bars.append(data_point)
+            
             current_bar = self.context_manager.create_bar_from_nifty_data(data_point)
             
             # Skip non-market hours
@@ -254,12 +278,12 @@ class RunBacktestUseCase:
                 
             # Skip holidays
             if self.holiday_service.is_trading_holiday(current_bar.timestamp.date(), "NSE"):
-                logger.debug(f"Skipping {current_bar.timestamp.date()} - Trading holiday")
+                logger.debug("Skipping %s - Trading holiday", current_bar.timestamp.date())
                 continue
                 
             # Validate NIFTY data if validator is enabled
             if self.data_validator:
-                prev_close = nifty_data[i-1].close if i > 0 else None
+                prev_close = prev_point.close if prev_point else None
                 validation_result = self.data_validator.validate_nifty_data(
                     timestamp=current_bar.timestamp,
                     open_price=current_bar.open,
@@ -287,14 +311,15 @@ class RunBacktestUseCase:
                         daily_return_percent=Decimal(str(
                             ((current_capital - daily_starting_capital) / daily_starting_capital) * 100
                         )),
-                        trades_opened=len([t for t in all_trades if t.entry_time.date() == current_date]),
-                        trades_closed=len([t for t in all_trades if t.exit_time and t.exit_time.date() == current_date]),
+                        trades_opened=sum(1 for t in day_trades if t.entry_time.date() == current_date),
+                        trades_closed=sum(1 for t in day_trades if t.exit_time and t.exit_time.date() == current_date),
                         open_positions=len(open_trades)
                     )
                     daily_results.append(daily_result)
                 
                 current_date = current_bar.timestamp.date()
                 daily_starting_capital = current_capital
+                day_trades = list(open_trades)
             
             # Get previous week data for context
             # We need at least previous week's data (5 days * 7 hours = 35 bars)
@@ -302,7 +327,7 @@ class RunBacktestUseCase:
                 continue
             
             prev_week_data = self.context_manager.get_previous_week_data(
-                current_bar.timestamp, nifty_data[:i]
+                current_bar.timestamp, recent_bars
             )
             
             if not prev_week_data:
@@ -366,6 +391,7 @@ class RunBacktestUseCase:
                         logger.info(f"Trade created successfully with ID: {trade.id}")
                         open_trades.append(trade)
                         all_trades.append(trade)
+                        day_trades.append(trade)
                         
                         # For option selling, capital doesn't change when entering trade
                         # Premium is not realized until trade is closed
@@ -378,8 +404,8 @@ class RunBacktestUseCase:
             if trade.outcome == TradeOutcome.OPEN:
                 await self._close_trade(
                     trade, 
-                    nifty_data[-1].timestamp,
-                    float(nifty_data[-1].close),
+                    last_point.timestamp,
+                    float(last_point.close),
                     TradeOutcome.EXPIRED,
                     "Backtest ended"
                 )
@@ -488,9 +514,14 @@ class RunBacktestUseCase:
             # Main position (sell)
             # Use current bar timestamp for price lookup (data availability)
             # but entry_time for trade record (candle close)
-            main_price = await self.option_pricing.get_option_price_at_time(
-                current_bar.timestamp, main_strike, option_type, expiry
+            # Main and hedge legs are priced with one query
+            legs = [(main_strike, option_type)]
+            if params.use_hedging:
+                legs.append((hedge_strike, option_type))
+            leg_prices = await self.option_pricing.get_option_prices_at_time(
+                current_bar.timestamp, legs, expiry
             )
+            main_price = leg_prices[(main_strike, option_type)]
             
             if not main_price:
                 logger.warning(f"No option price found for main position {main_strike} {option_type} at {current_bar.timestamp}")
@@ -499,9 +530,7 @@ class RunBacktestUseCase:
             # Hedge position (buy) if enabled
             hedge_price = None
             if params.use_hedging:
-                hedge_price = await self.option_pricing.get_option_price_at_time(
-                    current_bar.timestamp, hedge_strike, option_type, expiry
-                )
+                hedge_price = leg_prices[(hedge_strike, option_type)]
                 
                 if not hedge_price:
                     logger.warning(f"No option price found for hedge position {hedge_strike} {option_type} at {current_bar.timestamp}")
@@ -704,15 +733,25 @@ class RunBacktestUseCase:
         
         total_pnl = 0.0
         
+        # Price every position's exit with one query per expiry, issuing the queries concurrently
+        legs_by_expiry: Dict[datetime, List[Tuple[int, str]]] = {}
+        for position in trade.positions:
+            legs_by_expiry.setdefault(position.expiry_date, []).append((position.strike_price, position.option_type))
+        
+        prices_per_expiry = await asyncio.gather(*[
+            self.option_pricing.get_option_prices_at_time(exit_time, legs, expiry)
+            for expiry, legs in legs_by_expiry.items()
+        ])
+        
+        exit_prices = {}
+        for expiry, leg_prices in zip(legs_by_expiry, prices_per_expiry):
+            for leg, price in leg_prices.items():
+                exit_prices[(leg, expiry)] = price
+        
         # Close all positions
         for position in trade.positions:
             # Get exit price
-            exit_price = await self.option_pricing.get_option_price_at_time(
-                exit_time,
-                position.strike_price,
-                position.option_type,
-                position.expiry_date
-            )
+            exit_price = exit_prices[((position.strike_price, position.option_type), position.expiry_date)]
             
             if not exit_price:
                 # If at expiry, calculate intrinsic value
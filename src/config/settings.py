@@ -21,6 +21,7 @@ class AppSettings(BaseSettings):
     debug: bool = Field(default=True, env="APP_DEBUG")
     host: str = Field(default="0.0.0.0", env="APP_HOST")
     port: int = Field(default=8100, env="APP_PORT")
+    workers: int = Field(default_factory=lambda: os.cpu_count() or 1, env="WEB_CONCURRENCY")
     cors_origins: List[str] = Field(
         default=["http://localhost:3000", "http://localhost:8100"],
         env="CORS_ORIGINS"
@@ -41,6 +42,15 @@ class DatabaseSettings(BaseSettings):
     username: Optional[str] = Field(default=None, env="DB_USERNAME")
     password: Optional[str] = Field(default=None, env="DB_PASSWORD")
     echo_sql: bool = Field(default=False, env="DB_ECHO_SQL")
+    # Each uvicorn worker owns a sync pool and an async pool: size them for the sessions one worker holds concurrently.
+    # A worker opens at most pool_size + max_overflow + async_pool_size + async_max_overflow connections
+    # (60 by default), so the server-wide ceiling is that times WEB_CONCURRENCY.
+    pool_size: int = Field(default=25, env="DB_POOL_SIZE")
+    max_overflow: int = Field(default=25, env="DB_MAX_OVERFLOW")
+    async_pool_size: int = Field(default=5, env="DB_ASYNC_POOL_SIZE")
+    async_max_overflow: int = Field(default=5, env="DB_ASYNC_MAX_OVERFLOW")
+    pool_timeout: int = Field(default=30, env="DB_POOL_TIMEOUT")
+    pool_recycle: int = Field(default=1800, env="DB_POOL_RECYCLE")
     
     @property
     def connection_string(self) -> str:
@@ -58,6 +68,11 @@ class DatabaseSettings(BaseSettings):
                 f"?driver={self.driver.replace(' ', '+')}"
             )
     
+    @property
+    def async_connection_string(self) -> str:
+        """Same connection through the aioodbc driver for asyncio sessions"""
+        return self.connection_string.replace("mssql+pyodbc://", "mssql+aioodbc://", 1)
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
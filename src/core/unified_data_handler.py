@@ -3,6 +3,7 @@ Unified Data Handler - Single Source of Truth for All Data Operations
 Implements all standards from TECHNICAL_SPEC.md
 """
 import logging
+from bisect import bisect_left
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta, time
 from decimal import Decimal
@@ -409,9 +410,15 @@ class UnifiedDataHandler:
                 
                 # Group by date
                 current_date = from_date.date()
+                # Data is ordered by timestamp, so each day is one contiguous slice
+                timestamps = [d.timestamp for d in five_min_data]
+                
                 while current_date <= to_date.date():
                     # Get data for this day
-                    day_data = [d for d in five_min_data if d.timestamp.date() == current_date]
+                    day_start = datetime(current_date.year, current_date.month, current_date.day)
+                    start = bisect_left(timestamps, day_start)
+                    end = bisect_left(timestamps, day_start + timedelta(days=1), lo=start)
+                    day_data = five_min_data[start:end]
                     
                     if day_data:
                         # Create hourly candles using our service
@@ -45,11 +45,11 @@ class SignalEvaluator:
         if len(context.weekly_bars) == 1:
             self.s4_triggered_this_week = False
             self.s8_triggered_this_week = False
-            logger.debug(f"New week started - reset S4/S8 trigger states")
+            logger.debug("New week started - reset S4/S8 trigger states")
 
         # Do not evaluate if a signal has already been confirmed for this week.
         if context.signal_triggered_this_week:
-            logger.debug(f"Signal already triggered this week: {context.triggered_signal}")
+            logger.debug("Signal already triggered this week: %s", context.triggered_signal)
             return SignalResult.no_signal()
 
         weekly_bars = context.weekly_bars
@@ -59,7 +59,7 @@ class SignalEvaluator:
         first_bar = weekly_bars[0]
         is_second_bar = len(weekly_bars) == 2
         
-        logger.debug(f"Evaluating signals at {bar_close_time}: Bar #{len(weekly_bars)}, Bias={context.bias.bias.name}")
+        logger.debug("Evaluating signals at %s: Bar #%d, Bias=%s", bar_close_time, len(weekly_bars), context.bias.bias.name)
 
         # A list of evaluator methods to be called in order of signal priority (S1 > S2 > ...).
         # Note: S5 is evaluated before S7 to match SP behavior
@@ -100,11 +100,11 @@ class SignalEvaluator:
         cond2 = first_bar.close < zones.lower_zone_bottom
         cond3 = current_bar.close > first_bar.low
 
-        logger.debug(f"S1 Check at {bar_close_time}: is_second_bar={is_second_bar}")
-        logger.debug(f"  FirstBar: O={first_bar.open} C={first_bar.close} L={first_bar.low}")
-        logger.debug(f"  CurrentBar: C={current_bar.close}")
-        logger.debug(f"  Zones: SupportBottom={zones.lower_zone_bottom}")
-        logger.debug(f"  Conditions: cond1={cond1}, cond2={cond2}, cond3={cond3}")
+        logger.debug("S1 Check at %s: is_second_bar=%s", bar_close_time, is_second_bar)
+        logger.debug("  FirstBar: O=%s C=%s L=%s", first_bar.open, first_bar.close, first_bar.low)
+        logger.debug("  CurrentBar: C=%s", current_bar.close)
+        logger.debug("  Zones: SupportBottom=%s", zones.lower_zone_bottom)
+        logger.debug("  Conditions: cond1=%s, cond2=%s, cond3=%s", cond1, cond2, cond3)
 
         if cond1 and cond2 and cond3:
             stop_loss = first_bar.low - abs(first_bar.open - first_bar.close)
@@ -176,9 +176,8 @@ class SignalEvaluator:
 
         # Scenario B: Breakdown below weekly lows
         if len(weekly_bars) > 1:
-            prev_bars = weekly_bars[:-1]
-            weekly_min_low = min(bar.low for bar in prev_bars)
-            weekly_min_close = min(bar.close for bar in prev_bars)
+            weekly_min_low = context.prior_min_low
+            weekly_min_close = context.prior_min_close
             
             if (current_bar.close < first_bar.low and
                 current_bar.close < zones.upper_zone_bottom and
@@ -219,17 +218,17 @@ class SignalEvaluator:
         zones = context.zones
         bias = context.bias
 
-        logger.debug(f"S5 Check at {bar_close_time}:")
-        logger.debug(f"  Bias: {bias.bias}")
-        logger.debug(f"  FirstBar: O={first_bar.open}")
-        logger.debug(f"  Zones: SupportBottom={zones.lower_zone_bottom}, PrevWeekLow={zones.prev_week_low}")
+        logger.debug("S5 Check at %s:", bar_close_time)
+        logger.debug("  Bias: %s", bias.bias)
+        logger.debug("  FirstBar: O=%s", first_bar.open)
+        logger.debug("  Zones: SupportBottom=%s, PrevWeekLow=%s", zones.lower_zone_bottom, zones.prev_week_low)
         
         if not context.first_hour_bar:
             logger.debug("  No first hour bar available")
             return SignalResult.no_signal()
         
-        logger.debug(f"  FirstHourBar: C={context.first_hour_bar.close} L={context.first_hour_bar.low} H={context.first_hour_bar.high}")
-        logger.debug(f"  CurrentBar: C={current_bar.close}")
+        logger.debug("  FirstHourBar: C=%s L=%s H=%s", context.first_hour_bar.close, context.first_hour_bar.low, context.first_hour_bar.high)
+        logger.debug("  CurrentBar: C=%s", current_bar.close)
         
         cond1 = bias.bias == TradeDirection.BULLISH
         cond2 = first_bar.open < zones.lower_zone_bottom
@@ -237,7 +236,7 @@ class SignalEvaluator:
         cond4 = context.first_hour_bar.close < zones.prev_week_low
         cond5 = current_bar.close < context.first_hour_bar.low
         
-        logger.debug(f"  Conditions: bias_bullish={cond1}, gap_down={cond2}, fh_below_support={cond3}, fh_below_prev_low={cond4}, breakdown={cond5}")
+        logger.debug("  Conditions: bias_bullish=%s, gap_down=%s, fh_below_support=%s, fh_below_prev_low=%s, breakdown=%s", cond1, cond2, cond3, cond4, cond5)
             
         if cond1 and cond2 and cond3 and cond4 and cond5:
             logger.info(f"S5 TRIGGERED at {bar_close_time}! Stop loss: {context.first_hour_bar.high}")
@@ -274,9 +273,8 @@ class SignalEvaluator:
 
         # Scenario B: Breakdown
         if len(weekly_bars) > 1:
-            prev_bars = weekly_bars[:-1]
-            weekly_min_low = min(bar.low for bar in prev_bars)
-            weekly_min_close = min(bar.close for bar in prev_bars)
+            weekly_min_low = context.prior_min_low
+            weekly_min_close = context.prior_min_close
             
             if (current_bar.close < first_bar.low and
                 current_bar.close < zones.upper_zone_bottom and
@@ -307,9 +305,8 @@ class SignalEvaluator:
 
         # Strongest breakout check
         if len(weekly_bars) > 1:
-            prev_bars = weekly_bars[:-1]
-            weekly_max_high = max(bar.high for bar in prev_bars)
-            weekly_max_close = max(bar.close for bar in prev_bars)
+            weekly_max_high = context.prior_max_high
+            weekly_max_close = context.prior_max_close
             
             if current_bar.close > weekly_max_high and current_bar.close > weekly_max_close and context.first_hour_bar:
                 return SignalResult.from_signal(
@@ -332,15 +329,13 @@ class SignalEvaluator:
             return SignalResult.no_signal()
 
         # Check if upper zone was touched and price closed below it
-        has_touched_upper = any(bar.high >= zones.upper_zone_bottom for bar in weekly_bars)
-        if not (has_touched_upper and current_bar.close < zones.upper_zone_bottom):
+        if not (context.has_touched_upper_zone_this_week and current_bar.close < zones.upper_zone_bottom):
             return SignalResult.no_signal()
 
         # Weakest breakdown check
         if len(weekly_bars) > 1:
-            prev_bars = weekly_bars[:-1]
-            weekly_min_low = min(bar.low for bar in prev_bars)
-            weekly_min_close = min(bar.close for bar in prev_bars)
+            weekly_min_low = context.prior_min_low
+            weekly_min_close = context.prior_min_close
             
             if current_bar.close < weekly_min_low and current_bar.close < weekly_min_close and context.first_hour_bar:
                 return SignalResult.from_signal(
@@ -361,9 +356,7 @@ class SignalEvaluator:
         breakout_candle_high = context.s4_breakout_candle_high
         current_bar = weekly_bars[-1]
         
-        highest_high_before = 0.0
-        if len(weekly_bars) > 1:
-            highest_high_before = max(b.high for b in weekly_bars[:-1])
+        highest_high_before = context.prior_max_high
 
         if current_bar.timestamp.date() == first_hour_day:
             if current_bar.close > first_hour_high:
@@ -390,9 +383,7 @@ class SignalEvaluator:
         breakdown_candle_low = context.s8_breakdown_candle_low
         current_bar = weekly_bars[-1]
 
-        lowest_low_before = float('inf')
-        if len(weekly_bars) > 1:
-            lowest_low_before = min(b.low for b in weekly_bars[:-1])
+        lowest_low_before = context.prior_min_low
 
         if current_bar.timestamp.date() == first_hour_day:
             if current_bar.close < first_hour_low:
@@ -3,9 +3,11 @@ Weekly Context Manager
 Manages weekly zones, bias calculation, and context for signal evaluation
 """
 import logging
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import List, Optional, Tuple
-import pandas as pd
+import numpy as np
 import pytz
 
 from ..value_objects.signal_types import (
@@ -16,10 +18,33 @@ from ...utils.timezone_utils import (
     utc_to_ist, ist_to_utc, get_market_open_utc, 
     is_market_hours_utc, format_ist_time
 )
+from ...utils.market_hours import MARKET_OPEN, MARKET_CLOSE
 
 
 logger = logging.getLogger(__name__)
 
+WEEK_START_TIME = time(9, 15)
+
+
+@lru_cache(maxsize=4096)
+def _week_start_for(day: date, tzinfo) -> datetime:
+    """Sunday 9:15 AM for the week containing the day; depends only on the calendar date"""
+    # Days back to the previous Sunday (Monday=0 ... Sunday=6, so Sunday subtracts 0)
+    days_to_subtract = (day.weekday() + 1) % 7
+    sunday = day - timedelta(days=days_to_subtract)
+    return datetime.combine(sunday, WEEK_START_TIME, tzinfo=tzinfo)
+
+
+@lru_cache(maxsize=512)
+def _expiry_for_week(week_start: datetime) -> datetime:
+    """Thursday 3:30 PM of the week starting on the given Sunday"""
+    expiry = week_start + timedelta(days=4)  # Sunday + 4 = Thursday
+    return expiry.replace(hour=15, minute=30, second=0, microsecond=0)
+
+
+def _timestamp_of(data: NiftyIndexData) -> datetime:
+    return data.timestamp
+
 
 class WeeklyContextManager:
     """Manages weekly context for signal evaluation"""
@@ -27,23 +52,12 @@ class WeeklyContextManager:
     def __init__(self):
         self.current_context: Optional[WeeklyContext] = None
         self.current_week_start: Optional[datetime] = None
+        # Last previous-week lookup as (week start, dataset, bars); every bar of a week reuses it
+        self._prev_week_cache: Optional[Tuple[datetime, List[NiftyIndexData], List[NiftyIndexData]]] = None
     
     def get_week_start(self, date: datetime) -> datetime:
         """Get Sunday 9:15 AM IST for the week containing the date (matching TradingView/SP logic)"""
-        # Get current day of week (Monday=0, Sunday=6)
-        current_weekday = date.weekday()
-        
-        # Calculate days to subtract to get to previous Sunday
-        # If Sunday (6), days_to_subtract = 0
-        # If Monday (0), days_to_subtract = 1
-        # If Tuesday (1), days_to_subtract = 2, etc.
-        days_to_subtract = (current_weekday + 1) % 7
-        
-        # Get Sunday of current week
-        sunday = date - timedelta(days=days_to_subtract)
-        
-        # Return Sunday 9:15 AM IST
-        return sunday.replace(hour=9, minute=15, second=0, microsecond=0)
+        return _week_start_for(date.date(), date.tzinfo)
     
     def is_new_week(self, timestamp: datetime) -> bool:
         """Check if timestamp is in a new week"""
@@ -63,56 +77,37 @@ class WeeklyContextManager:
         if not prev_week_data:
             raise ValueError("No previous week data available")
         
-        # Convert to pandas for easier calculation
-        df = pd.DataFrame([{
-            'timestamp': d.timestamp,
-            'open': float(d.open),
-            'high': float(d.high),
-            'low': float(d.low),
-            'close': float(d.close)
-        } for d in prev_week_data])
+        # Pull OHLC into arrays once
+        count = len(prev_week_data)
+        opens = np.fromiter((d.open for d in prev_week_data), dtype=np.float64, count=count)
+        highs = np.fromiter((d.high for d in prev_week_data), dtype=np.float64, count=count)
+        lows = np.fromiter((d.low for d in prev_week_data), dtype=np.float64, count=count)
+        closes = np.fromiter((d.close for d in prev_week_data), dtype=np.float64, count=count)
         
         # Previous week high/low/close
-        prev_week_high = df['high'].max()
-        prev_week_low = df['low'].min()
-        prev_week_close = df['close'].iloc[-1]
+        prev_week_high = float(highs.max())
+        prev_week_low = float(lows.min())
+        prev_week_close = float(closes[-1])
         
         # Calculate 4-hour body extremes
         # Since we have hourly data from 5-min aggregation, 
         # we need to group into 4-hour blocks
         
-        # Create 4-hour groups (0-3, 4-7, 8-11, 12-15, 16-19, 20-23)
-        df['4h_group'] = (df['timestamp'].dt.hour // 4) * 4
-        df['date'] = df['timestamp'].dt.date
-        df['4h_key'] = df['date'].astype(str) + '_' + df['4h_group'].astype(str)
+        # 4-hour block key per bar: day ordinal and block (0-3, 4-7, 8-11, 12-15, 16-19, 20-23)
+        block_keys = np.fromiter(
+            (d.timestamp.toordinal() * 6 + d.timestamp.hour // 4 for d in prev_week_data),
+            dtype=np.int64, count=count
+        )
         
-        # For each 4-hour group, find the body extremes
-        four_hour_bodies = []
-        for group_key, group_df in df.groupby('4h_key'):
-            if len(group_df) > 0:
-                # Get OHLC for this 4-hour period
-                group_open = group_df.iloc[0]['open']
-                group_close = group_df.iloc[-1]['close']
-                
-                # Body top and bottom for this 4-hour candle
-                body_top = max(group_open, group_close)
-                body_bottom = min(group_open, group_close)
-                
-                four_hour_bodies.append({
-                    'body_top': body_top,
-                    'body_bottom': body_bottom
-                })
+        # Each block opens at its first bar and closes at its last
+        _, first_index = np.unique(block_keys, return_index=True)
+        _, last_index_reversed = np.unique(block_keys[::-1], return_index=True)
+        block_opens = opens[first_index]
+        block_closes = closes[count - 1 - last_index_reversed]
         
         # Get max/min body levels across all 4-hour candles
-        if four_hour_bodies:
-            prev_max_4h_body = max(b['body_top'] for b in four_hour_bodies)
-            prev_min_4h_body = min(b['body_bottom'] for b in four_hour_bodies)
-        else:
-            # Fallback to hourly data if grouping fails
-            df['body_top'] = df[['open', 'close']].max(axis=1)
-            df['body_bottom'] = df[['open', 'close']].min(axis=1)
-            prev_max_4h_body = df['body_top'].max()
-            prev_min_4h_body = df['body_bottom'].min()
+        prev_max_4h_body = float(np.maximum(block_opens, block_closes).max())
+        prev_min_4h_body = float(np.minimum(block_opens, block_closes).min())
         
         # Calculate zones
         zones = WeeklyZones(
@@ -228,7 +223,7 @@ class WeeklyContextManager:
         
         Args:
             current_date: Current date
-            nifty_data: Full dataset of NIFTY data
+            nifty_data: Full dataset of NIFTY data, ordered by timestamp
             
         Returns:
             List of previous week's data
@@ -236,6 +231,10 @@ class WeeklyContextManager:
         # Get current week start
         current_week_start = self.get_week_start(current_date)
         
+        cached = self._prev_week_cache
+        if cached is not None and cached[0] == current_week_start and cached[1] is nifty_data:
+            return cached[2]
+        
         # Previous week is 7 days before
         prev_week_start = current_week_start - timedelta(days=7)
         # Previous week ends on Friday 15:30
@@ -243,12 +242,12 @@ class WeeklyContextManager:
         friday = prev_week_start + timedelta(days=5)  # Sunday + 5 = Friday
         prev_week_end = friday.replace(hour=15, minute=30, second=0)
         
-        # Filter data for previous week
-        prev_week_data = [
-            d for d in nifty_data
-            if prev_week_start <= d.timestamp <= prev_week_end
-        ]
+        # Data is ordered by timestamp, so the week is one contiguous slice
+        start = bisect_left(nifty_data, prev_week_start, key=_timestamp_of)
+        end = bisect_right(nifty_data, prev_week_end, lo=start, key=_timestamp_of)
         
+        prev_week_data = nifty_data[start:end]
+        self._prev_week_cache = (current_week_start, nifty_data, prev_week_data)
         return prev_week_data
     
     def create_bar_from_nifty_data(self, data: NiftyIndexData) -> BarData:
@@ -268,11 +267,7 @@ class WeeklyContextManager:
         if timestamp.weekday() >= 5:  # Saturday or Sunday
             return False
         
-        time = timestamp.time()
-        market_open = datetime.strptime("09:15", "%H:%M").time()
-        market_close = datetime.strptime("15:30", "%H:%M").time()
-        
-        return market_open <= time <= market_close
+        return MARKET_OPEN <= timestamp.time() <= MARKET_CLOSE
     
     def get_next_expiry(self, date: datetime) -> datetime:
         """Get next Thursday expiry from given date"""
@@ -287,5 +282,4 @@ class WeeklyContextManager:
     def get_expiry_for_week(self, week_start: datetime) -> datetime:
         """Get expiry date for a given week (Thursday 3:30 PM)"""
         # Week starts on Sunday, expiry is on Thursday
-        expiry = week_start + timedelta(days=4)  # Sunday + 4 = Thursday
-        return expiry.replace(hour=15, minute=30, second=0, microsecond=0)
\ No newline at end of file
+        return _expiry_for_week(week_start)
\ No newline at end of file
@@ -172,6 +172,12 @@ class WeeklyContext:
     weekly_max_close: float = 0.0
     weekly_min_close: float = float('inf')
     
+    # The same statistics over every bar before the latest one
+    prior_max_high: float = 0.0
+    prior_min_low: float = float('inf')
+    prior_max_close: float = 0.0
+    prior_min_close: float = float('inf')
+    
     def __post_init__(self):
         if self.weekly_bars is None:
             self.weekly_bars = []
@@ -179,6 +185,10 @@ class WeeklyContext:
     def update_weekly_stats(self, bar: BarData):
         """Update running statistics with new bar"""
         self.weekly_bars.append(bar)
+        self.prior_max_high = self.weekly_max_high
+        self.prior_min_low = self.weekly_min_low
+        self.prior_max_close = self.weekly_max_close
+        self.prior_min_close = self.weekly_min_close
         self.weekly_max_high = max(self.weekly_max_high, bar.high)
         self.weekly_min_low = min(self.weekly_min_low, bar.low)
         self.weekly_max_close = max(self.weekly_max_close, bar.close)
@@ -207,6 +217,10 @@ class WeeklyContext:
         self.weekly_min_low = float('inf')
         self.weekly_max_close = 0.0
         self.weekly_min_close = float('inf')
+        self.prior_max_high = 0.0
+        self.prior_min_low = float('inf')
+        self.prior_max_close = 0.0
+        self.prior_min_close = float('inf')
 
 
 @dataclass
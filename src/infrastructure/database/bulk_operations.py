@@ -0,0 +1,26 @@
+"""
+Bulk Operations
+Set-based insert helpers shared by the data collection paths
+"""
+from typing import Dict, List
+
+from sqlalchemy import insert, inspect
+from sqlalchemy.orm import Session
+
+BULK_INSERT_CHUNK_SIZE = 1000
+
+
+def column_values(instance) -> Dict:
+    """Column values of a transient model, leaving unset ones to column defaults"""
+    values = {}
+    for attr in inspect(instance).mapper.column_attrs:
+        value = getattr(instance, attr.key)
+        if value is not None:
+            values[attr.key] = value
+    return values
+
+
+def bulk_insert(session: Session, model, rows: List[Dict]) -> None:
+    """Insert rows as executemany batches instead of one unit-of-work flush per object"""
+    for i in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        session.execute(insert(model), rows[i:i + BULK_INSERT_CHUNK_SIZE])
@@ -3,9 +3,10 @@ Database Manager
 Handles database connections and session management
 """
 import logging
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 
@@ -21,6 +22,8 @@ class DatabaseManager:
         self.settings = get_settings()
         self._engine = None
         self._session_factory = None
+        self._async_engine = None
+        self._async_session_factory = None
     
     @property
     def engine(self):
@@ -29,11 +32,12 @@ class DatabaseManager:
             self._engine = create_engine(
                 self.settings.database.connection_string,
                 poolclass=QueuePool,  # Enable connection pooling
-                pool_size=20,         # Number of persistent connections
-                max_overflow=10,      # Maximum overflow connections
-                pool_timeout=30,      # Timeout for getting connection
-                pool_recycle=3600,    # Recycle connections after 1 hour
+                pool_size=self.settings.database.pool_size,
+                max_overflow=self.settings.database.max_overflow,
+                pool_timeout=self.settings.database.pool_timeout,
+                pool_recycle=self.settings.database.pool_recycle,
                 pool_pre_ping=True,   # Test connections before use
+                fast_executemany=True,  # Send bulk inserts as one parameter array per round trip
                 echo=self.settings.database.echo_sql,
                 connect_args={
                     "timeout": 30,
@@ -65,6 +69,52 @@ class DatabaseManager:
         
         return self._session_factory
     
+    @property
+    def async_engine(self):
+        """Get or create the asyncio engine used by async request handlers"""
+        if self._async_engine is None:
+            # AsyncAdaptedQueuePool is the asyncio counterpart of QueuePool
+            self._async_engine = create_async_engine(
+                self.settings.database.async_connection_string,
+                pool_size=self.settings.database.async_pool_size,
+                max_overflow=self.settings.database.async_max_overflow,
+                pool_timeout=self.settings.database.pool_timeout,
+                pool_recycle=self.settings.database.pool_recycle,
+                pool_pre_ping=True,
+                echo=self.settings.database.echo_sql,
+                connect_args={
+                    "timeout": 30,
+                    "autocommit": False
+                }
+            )
+            logger.info("Async database engine created")
+        
+        return self._async_engine
+    
+    @property
+    def async_session_factory(self):
+        """Get or create async session factory"""
+        if self._async_session_factory is None:
+            self._async_session_factory = async_sessionmaker(
+                bind=self.async_engine,
+                autoflush=False,
+                expire_on_commit=False
+            )
+            logger.info("Async session factory created")
+        
+        return self._async_session_factory
+    
+    @asynccontextmanager
+    async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """Get an async database session with automatic cleanup"""
+        async with self.async_session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+    
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
         """Get a database session with automatic cleanup"""
@@ -117,6 +167,10 @@ class DatabaseManager:
             logger.error(f"Database connection test failed: {e}")
             return False
     
+    def pool_status(self) -> str:
+        """Describe connection pool usage"""
+        return self.engine.pool.status()
+    
     def close(self):
         """Close database connections"""
         if self._engine:
@@ -124,6 +178,14 @@ class DatabaseManager:
             self._engine = None
             self._session_factory = None
             logger.info("Database connections closed")
+    
+    async def close_async(self):
+        """Close async database connections"""
+        if self._async_engine:
+            await self._async_engine.dispose()
+            self._async_engine = None
+            self._async_session_factory = None
+            logger.info("Async database connections closed")
 
 
 # Global database manager instance
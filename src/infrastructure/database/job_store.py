@@ -0,0 +1,101 @@
+"""
+Job Store
+Background job status persisted in SQLite so every worker process sees the same jobs
+"""
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+JOB_STORE_PATH = os.getenv('JOB_STORE_PATH', 'job_status.db')
+
+
+class JobStore:
+    """Job status documents keyed by job id, stored as JSON in a WAL-mode SQLite table"""
+
+    def __init__(self, path: str = JOB_STORE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, data TEXT NOT NULL)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def create(self, job_id: str, data: Dict) -> None:
+        """Insert or replace a job's status document"""
+        with self.lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, data) VALUES (?, ?)",
+                (job_id, json.dumps(data, default=str))
+            )
+
+    def update(self, job_id: str, **fields) -> None:
+        """Merge fields into a job's status document"""
+        with self.lock, self._connect() as conn:
+            # Take the write lock up front so concurrent workers cannot interleave read-modify-write
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            data = json.loads(row[0]) if row else {}
+            data.update(fields)
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, data) VALUES (?, ?)",
+                (job_id, json.dumps(data, default=str))
+            )
+            conn.execute("COMMIT")
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return a job's status document, or None if unknown"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+
+class ProgressReporter:
+    """Buffers a job's progress fields and writes them to a JobStore from a background thread"""
+
+    def __init__(self, store: JobStore, job_id: str, interval: float = 2.0):
+        self.store = store
+        self.job_id = job_id
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.pending: Dict = {}
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=f"progress-{job_id}", daemon=True)
+        self.thread.start()
+
+    def update(self, **fields) -> None:
+        """Record fields for the next flush; later values for a field replace earlier ones"""
+        with self.lock:
+            self.pending.update(fields)
+
+    def flush(self) -> None:
+        """Write any buffered fields now"""
+        with self.lock:
+            fields, self.pending = self.pending, {}
+        if fields:
+            self.store.update(self.job_id, **fields)
+
+    def close(self) -> None:
+        """Stop the flush thread and write whatever is still buffered"""
+        self.stopped.set()
+        self.thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.flush()
+
+    def __enter__(self) -> "ProgressReporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -2,7 +2,7 @@
 Backtest Models
 SQLAlchemy models for backtesting data
 """
-from sqlalchemy import Column, String, DateTime, DECIMAL, Integer, ForeignKey, Boolean, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, DECIMAL, Integer, ForeignKey, Boolean, Text, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -147,6 +147,11 @@ class BacktestTrade(Base):
     backtest_run = relationship("BacktestRun", back_populates="trades")
     positions = relationship("BacktestPosition", back_populates="trade", cascade="all, delete-orphan")
     
+    # Trades of a run, optionally by signal, in entry order (see migrations/add_backtest_trade_indexes.sql)
+    __table_args__ = (
+        Index('IX_BacktestTrades_Run_Signal_Entry', 'BacktestRunId', 'SignalType', 'EntryTime'),
+    )
+    
     def __repr__(self):
         return f"<BacktestTrade({self.signal_type} @ {self.entry_time} - {self.outcome.value})>"
 
@@ -193,6 +198,11 @@ class BacktestPosition(Base):
     # Relationships
     trade = relationship("BacktestTrade", back_populates="positions")
     
+    # selectinload of trade.positions filters on TradeId
+    __table_args__ = (
+        Index('IX_BacktestPositions_TradeId', 'TradeId'),
+    )
+    
     def __repr__(self):
         return f"<BacktestPosition({self.position_type} {self.option_type} @ {self.strike_price})>"
 
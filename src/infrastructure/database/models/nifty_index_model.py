@@ -51,6 +51,8 @@ class NiftyIndexData(Base):
     # Indexes
     __table_args__ = (
         Index('IX_NiftyIndexData_Symbol_Timestamp', 'Symbol', 'Timestamp'),
+        # Unique with IGNORE_DUP_KEY (see migrations/add_unique_candle_keys.sql): re-inserted candles are dropped by the server
+        Index('UX_NiftyIndexData_Symbol_Interval_Timestamp', 'Symbol', 'Interval', 'Timestamp', unique=True),
     )
     
     def __repr__(self):
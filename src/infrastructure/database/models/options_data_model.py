@@ -10,6 +10,21 @@ import uuid
 from ..base import Base
 
 
+def parse_breeze_timestamp(datetime_str: str) -> datetime:
+    """Parse a Breeze candle datetime into naive IST - handles multiple formats"""
+    if 'T' in datetime_str or 'Z' in datetime_str:
+        # ISO format with timezone
+        import pytz
+        utc_timestamp = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+        return utc_timestamp.astimezone(pytz.timezone('Asia/Kolkata')).replace(tzinfo=None)
+    elif ' ' in datetime_str:
+        # YYYY-MM-DD HH:MM:SS format from Breeze (already in IST)
+        return datetime.strptime(datetime_str, '%Y-%m-%d %H:%M:%S')
+    else:
+        # DD-MON-YYYY format from Breeze
+        return datetime.strptime(datetime_str, '%d-%b-%Y')
+
+
 class OptionsHistoricalData(Base):
     """
     Model for options historical data
@@ -59,9 +74,12 @@ class OptionsHistoricalData(Base):
     
     # Indexes
     __table_args__ = (
-        Index('IX_OptionsData_Symbol_Timestamp', 'TradingSymbol', 'Timestamp'),
+        # Unique with IGNORE_DUP_KEY (see migrations/add_unique_candle_keys.sql): re-inserted candles are dropped by the server
+        Index('UX_OptionsData_Symbol_Timestamp', 'TradingSymbol', 'Timestamp', unique=True),
         Index('IX_OptionsData_Expiry_Strike', 'ExpiryDate', 'Strike', 'OptionType'),
-        Index('IX_OptionsData_Underlying_Timestamp', 'Underlying', 'Timestamp'),
+        # Covers the collectors' per-day strike probes (see migrations/add_options_strike_covering_index.sql)
+        Index('IX_OptionsData_Underlying_Timestamp_Strike', 'Underlying', 'Timestamp', 'Strike', 'OptionType',
+              mssql_include=['TradingSymbol']),
     )
     
     def __repr__(self):
@@ -96,22 +114,9 @@ class OptionsHistoricalData(Base):
     @classmethod
     def from_breeze_data(cls, breeze_data: dict):
         """Create instance from Breeze API response"""
-        import pytz
         from ....utils.market_hours import is_within_market_hours
-        IST = pytz.timezone('Asia/Kolkata')
         
-        # Parse datetime - handle multiple formats
-        datetime_str = breeze_data['datetime']
-        if 'T' in datetime_str or 'Z' in datetime_str:
-            # ISO format with timezone
-            utc_timestamp = datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-            timestamp = utc_timestamp.astimezone(IST).replace(tzinfo=None)
-        elif ' ' in datetime_str:
-            # YYYY-MM-DD HH:MM:SS format from Breeze (already in IST)
-            timestamp = datetime.strptime(datetime_str, '%Y-%m-%d %H:%M:%S')
-        else:
-            # DD-MON-YYYY format from Breeze
-            timestamp = datetime.strptime(datetime_str, '%d-%b-%Y')
+        timestamp = parse_breeze_timestamp(breeze_data['datetime'])
         
         # Filter out data outside market hours (9:15 AM - 3:30 PM IST)
         # For Breeze 5-minute data, use is_breeze_data=True (regular hours 9:15-15:30)
@@ -119,14 +124,7 @@ class OptionsHistoricalData(Base):
             return None  # This record will be skipped
         
         # Parse expiry date - handle both ISO format and DD-MON-YYYY format
-        expiry_str = breeze_data['expiry_date']
-        if 'T' in expiry_str or 'Z' in expiry_str:
-            # ISO format
-            utc_expiry = datetime.fromisoformat(expiry_str.replace('Z', '+00:00'))
-            expiry = utc_expiry.astimezone(IST).replace(tzinfo=None)
-        else:
-            # DD-MON-YYYY format from Breeze
-            expiry = datetime.strptime(expiry_str, '%d-%b-%Y')
+        expiry = parse_breeze_timestamp(breeze_data['expiry_date'])
         
         # Calculate bid-ask spread if both are available
         bid_ask_spread = None
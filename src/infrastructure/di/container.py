@@ -62,12 +62,12 @@ class ServiceContainer:
         
         # Register new services
         self.register_singleton(BreezeService, BreezeService)
-        # Changed to factory to avoid caching issues
-        self.register_factory(DataCollectionService, lambda: DataCollectionService(
+        # Both services are stateless apart from their collaborators, so one instance serves every request
+        self.register_singleton(DataCollectionService, lambda: DataCollectionService(
             breeze_service=self.resolve(BreezeService),
             db_manager=None  # Will use get_db_manager() internally
         ))
-        self.register_factory(OptionPricingService, lambda: OptionPricingService(
+        self.register_singleton(OptionPricingService, lambda: OptionPricingService(
             data_collection_service=self.resolve(DataCollectionService),
             db_manager=None  # Will use get_db_manager() internally
         ))
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import asyncio
+import threading
 from datetime import timedelta
 # from breeze_connect import BreezeConnect  # Commented out for testing
 
@@ -21,10 +22,16 @@ class BreezeService:
         self.settings = get_settings()
         self._breeze = None
         self._initialized = False
+        # The service is shared across requests; only one caller may open the session
+        self._init_lock = threading.Lock()
     
     def _initialize(self):
         """Initialize Breeze connection"""
-        if not self._initialized:
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
             try:
                 # Import here to avoid issues if breeze_connect is not installed
                 try:
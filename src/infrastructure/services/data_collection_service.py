@@ -2,17 +2,20 @@
 Data Collection Service
 Service for fetching and storing historical NIFTY and options data
 """
+import asyncio
 import logging
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Tuple
+from typing import AsyncIterator, List, Optional, Dict, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import Float, and_, cast, func, or_
 
 from ..database.models import (
     NiftyIndexData, OptionsHistoricalData, NiftyIndexDataHourly, 
     NiftyIndexData5Minute, get_nifty_model_for_timeframe
 )
 from ..database.database_manager import get_db_manager
+from ..database.bulk_operations import bulk_insert, column_values
 from .breeze_service import BreezeService
 from .hourly_aggregation_service import HourlyAggregationService
 
@@ -216,38 +219,38 @@ class DataCollectionService:
     
     async def _store_nifty_data(self, records: List[Dict], symbol: str) -> int:
         """Store NIFTY data records in database"""
-        added = 0
+        candidates = {}
+        for record in records:
+            try:
+                # from_breeze_data handles timezone and returns None outside market hours
+                nifty_data = NiftyIndexData.from_breeze_data(record, symbol)
+            except Exception as e:
+                logger.error(f"Error parsing NIFTY record: {e}")
+                continue
+            
+            if nifty_data is not None:
+                candidates.setdefault((nifty_data.timestamp, nifty_data.interval), nifty_data)
+        
+        if not candidates:
+            return 0
         
         with self.db_manager.get_session() as session:
-            for record in records:
-                try:
-                    # Create NiftyIndexData object using from_breeze_data which handles timezone correctly
-                    nifty_data = NiftyIndexData.from_breeze_data(record, symbol)
-                    
-                    # Skip if None (outside market hours)
-                    if nifty_data is None:
-                        continue
-                    
-                    # Check if already exists
-                    exists = session.query(NiftyIndexData).filter(
-                        and_(
-                            NiftyIndexData.symbol == symbol,
-                            NiftyIndexData.timestamp == nifty_data.timestamp,
-                            NiftyIndexData.interval == nifty_data.interval
-                        )
-                    ).first()
-                    
-                    if not exists:
-                        session.add(nifty_data)
-                        added += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error storing NIFTY record: {e}")
-                    continue
+            timestamps = [key[0] for key in candidates]
+            existing = session.query(NiftyIndexData.timestamp, NiftyIndexData.interval).filter(
+                and_(
+                    NiftyIndexData.symbol == symbol,
+                    NiftyIndexData.timestamp >= min(timestamps),
+                    NiftyIndexData.timestamp <= max(timestamps)
+                )
+            ).all()
+            for row in existing:
+                candidates.pop((row[0], row[1]), None)
             
+            rows = [column_values(item) for item in candidates.values()]
+            bulk_insert(session, NiftyIndexData, rows)
             session.commit()
         
-        return added
+        return len(rows)
     
     async def _check_option_data_exists(
         self,
@@ -330,36 +333,41 @@ class DataCollectionService:
     
     async def _store_option_data(self, records: List[Dict]) -> int:
         """Store option data records in database"""
-        added = 0
+        candidates = {}
+        for record in records:
+            try:
+                option_data = OptionsHistoricalData.from_breeze_data(record)
+            except Exception as e:
+                logger.error(f"Error parsing option record: {e}")
+                continue
+            
+            # Skip if None (outside market hours)
+            if option_data is not None:
+                candidates.setdefault((option_data.trading_symbol, option_data.timestamp), option_data)
+        
+        if not candidates:
+            return 0
         
         with self.db_manager.get_session() as session:
-            for record in records:
-                try:
-                    option_data = OptionsHistoricalData.from_breeze_data(record)
-                    
-                    # Skip if None (outside market hours)
-                    if option_data is None:
-                        continue
-                    
-                    # Check if exists
-                    exists = session.query(OptionsHistoricalData).filter(
-                        and_(
-                            OptionsHistoricalData.trading_symbol == option_data.trading_symbol,
-                            OptionsHistoricalData.timestamp == option_data.timestamp
-                        )
-                    ).first()
-                    
-                    if not exists:
-                        session.add(option_data)
-                        added += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error storing option record: {e}")
-                    continue
+            symbols = {key[0] for key in candidates}
+            timestamps = [key[1] for key in candidates]
+            existing = session.query(
+                OptionsHistoricalData.trading_symbol, OptionsHistoricalData.timestamp
+            ).filter(
+                and_(
+                    OptionsHistoricalData.trading_symbol.in_(symbols),
+                    OptionsHistoricalData.timestamp >= min(timestamps),
+                    OptionsHistoricalData.timestamp <= max(timestamps)
+                )
+            ).all()
+            for row in existing:
+                candidates.pop((row[0], row[1]), None)
             
+            rows = [column_values(item) for item in candidates.values()]
+            bulk_insert(session, OptionsHistoricalData, rows)
             session.commit()
         
-        return added
+        return len(rows)
     
     async def get_nifty_data(
         self,
@@ -381,6 +389,60 @@ class DataCollectionService:
                 )
             ).order_by(model_class.timestamp).all()
     
+    async def iter_nifty_data(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        symbol: str = "NIFTY",
+        timeframe: str = "hourly",
+        batch_size: int = 512
+    ) -> AsyncIterator:
+        """
+        Stream NIFTY bars for specified timeframe in timestamp order, fetching batch_size rows at a time
+        
+        Yields lightweight rows with timestamp, open, high, low, close and volume attributes;
+        prices come back as floats rather than Decimals on tracked ORM objects.
+        """
+        model_class = get_nifty_model_for_timeframe(timeframe)
+        
+        with self.db_manager.get_session() as session:
+            query = session.query(
+                model_class.timestamp,
+                cast(model_class.open, Float).label("open"),
+                cast(model_class.high, Float).label("high"),
+                cast(model_class.low, Float).label("low"),
+                cast(model_class.close, Float).label("close"),
+                model_class.volume
+            ).filter(
+                and_(
+                    model_class.symbol == symbol,
+                    model_class.timestamp >= from_date,
+                    model_class.timestamp <= to_date
+                )
+            ).order_by(model_class.timestamp).yield_per(batch_size)
+            
+            for row in query:
+                yield row
+    
+    async def get_last_nifty_bar(
+        self,
+        from_date: datetime,
+        to_date: datetime,
+        symbol: str = "NIFTY",
+        timeframe: str = "hourly"
+    ):
+        """Get the latest NIFTY bar in the range, or None if there is none"""
+        model_class = get_nifty_model_for_timeframe(timeframe)
+        
+        with self.db_manager.get_session() as session:
+            return session.query(model_class).filter(
+                and_(
+                    model_class.symbol == symbol,
+                    model_class.timestamp >= from_date,
+                    model_class.timestamp <= to_date
+                )
+            ).order_by(model_class.timestamp.desc()).first()
+    
     async def get_option_data(
         self,
         timestamp: datetime,
@@ -432,6 +494,53 @@ class DataCollectionService:
             
             return result
     
+    async def get_options_data_batch(
+        self,
+        timestamp: datetime,
+        legs: List[Tuple[int, str]],
+        expiry: datetime
+    ) -> Dict[Tuple[int, str], Optional[OptionsHistoricalData]]:
+        """
+        Get option data at a timestamp for several (strike, option_type) legs in one query
+        
+        Resolves each leg exactly like get_option_data: the earliest row within 1 hour,
+        preferring the given expiry, then 05:30 and 00:00 when the expiry is at 15:30.
+        """
+        expiry_candidates = [expiry]
+        if expiry.hour == 15 and expiry.minute == 30:
+            expiry_candidates += [expiry.replace(hour=5, minute=30), expiry.replace(hour=0, minute=0)]
+        
+        def load_rows() -> List[OptionsHistoricalData]:
+            with self.db_manager.get_session() as session:
+                return session.query(OptionsHistoricalData).filter(
+                    and_(
+                        or_(*[
+                            and_(OptionsHistoricalData.strike == strike, OptionsHistoricalData.option_type == option_type)
+                            for strike, option_type in legs
+                        ]),
+                        OptionsHistoricalData.expiry_date.in_(expiry_candidates),
+                        OptionsHistoricalData.timestamp >= timestamp - timedelta(hours=1),
+                        OptionsHistoricalData.timestamp <= timestamp + timedelta(hours=1)
+                    )
+                ).order_by(OptionsHistoricalData.timestamp).all()
+        
+        # Run the blocking query off the event loop so concurrent lookups overlap on the wire
+        rows = await asyncio.to_thread(load_rows)
+        
+        # First (earliest) row per leg and expiry, then the first expiry in preference order
+        earliest = {}
+        for row in rows:
+            earliest.setdefault((int(row.strike), row.option_type, row.expiry_date), row)
+        
+        return {
+            (strike, option_type): next(
+                (earliest[(strike, option_type, candidate)]
+                 for candidate in expiry_candidates if (strike, option_type, candidate) in earliest),
+                None
+            )
+            for strike, option_type in legs
+        }
+    
     async def get_available_strikes(
         self,
         expiry: datetime,
@@ -488,9 +597,15 @@ class DataCollectionService:
         current_date = from_date.date()
         hourly_count = 0
         
+        # Data is ordered by timestamp, so each day is one contiguous slice
+        timestamps = [d.timestamp for d in five_min_data]
+        
         while current_date <= to_date.date():
             # Get 5-minute data for this day
-            day_data = [d for d in five_min_data if d.timestamp.date() == current_date]
+            day_start = datetime(current_date.year, current_date.month, current_date.day)
+            start = bisect_left(timestamps, day_start)
+            end = bisect_left(timestamps, day_start + timedelta(days=1), lo=start)
+            day_data = five_min_data[start:end]
             
             if day_data:
                 # Create hourly candles
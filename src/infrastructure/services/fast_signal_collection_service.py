@@ -13,6 +13,8 @@ from .data_collection_service import DataCollectionService
 
 logger = logging.getLogger(__name__)
 
+SIGNAL_INSIGHTS_QUERY = text("EXEC sp_GetWeeklySignalInsights @from_date = :start_date, @to_date = :end_date")
+
 
 class FastSignalCollectionService:
     """Fast version that uses sp_GetWeeklySignalInsights to get actual missing strikes"""
@@ -84,9 +86,7 @@ class FastSignalCollectionService:
         with self.db_manager.get_session() as session:
             try:
                 # Execute the stored procedure to get actual missing strikes
-                query = text("EXEC sp_GetWeeklySignalInsights @from_date = :start_date, @to_date = :end_date")
-                
-                result = session.execute(query, {"start_date": from_date, "end_date": to_date})
+                result = session.execute(SIGNAL_INSIGHTS_QUERY, {"start_date": from_date, "end_date": to_date})
                 rows = result.fetchall()
                 
                 # Convert to list of dicts
@@ -1,7 +1,7 @@
 """Trading Holiday Service"""
 import logging
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 import aiohttp
 from sqlalchemy import select, and_
 from sqlalchemy.orm import Session
@@ -203,12 +203,8 @@ class HolidayService:
                 
             current_date = current_date + timedelta(days=1)
     
-    def get_trading_days_in_range(self, start_date: date, end_date: date, exchange: str = "NSE") -> List[date]:
-        """Get all trading days in a date range"""
-        trading_days = []
-        current_date = start_date
-        
-        # Get all holidays in the range
+    def get_holiday_dates_in_range(self, start_date: date, end_date: date, exchange: str = "NSE") -> Set[date]:
+        """Get the trading holiday dates in a date range with one query"""
         with self.db_manager.get_session() as session:
             holidays = session.query(TradingHoliday.HolidayDate).filter(
                 and_(
@@ -219,7 +215,15 @@ class HolidayService:
                 )
             ).all()
             
-            holiday_dates = {h.HolidayDate for h in holidays}
+            return {h.HolidayDate for h in holidays}
+    
+    def get_trading_days_in_range(self, start_date: date, end_date: date, exchange: str = "NSE") -> List[date]:
+        """Get all trading days in a date range"""
+        trading_days = []
+        current_date = start_date
+        
+        # Get all holidays in the range
+        holiday_dates = self.get_holiday_dates_in_range(start_date, end_date, exchange)
         
         while current_date <= end_date:
             # Skip weekends
@@ -10,6 +10,7 @@ from decimal import Decimal
 
 from ..database.models import NiftyIndexData, NiftyIndexDataHourly, NiftyIndexData5Minute
 from ..database.database_manager import get_db_manager
+from ..database.bulk_operations import bulk_insert
 
 logger = logging.getLogger(__name__)
 
@@ -275,4 +276,49 @@ class HourlyAggregationService:
             session.commit()
             
             logger.info(f"Stored hourly candle for {hourly_candle['timestamp']}")
-            return hourly_data
\ No newline at end of file
+            return hourly_data
+    
+    def store_hourly_candles(self, hourly_candles: List[Dict]) -> int:
+        """
+        Store hourly candles of one symbol, skipping ones already stored
+        
+        Args:
+            hourly_candles: Dictionaries with hourly OHLC data
+            
+        Returns:
+            Number of candles inserted
+        """
+        if not hourly_candles:
+            return 0
+        
+        timestamps = [candle['timestamp'] for candle in hourly_candles]
+        
+        with self.db_manager.get_session() as session:
+            existing = {
+                timestamp for (timestamp,) in session.query(NiftyIndexDataHourly.timestamp).filter(
+                    NiftyIndexDataHourly.symbol == hourly_candles[0]['symbol'],
+                    NiftyIndexDataHourly.timestamp.in_(timestamps)
+                )
+            }
+            
+            now = datetime.now()
+            rows = [
+                {
+                    'symbol': candle['symbol'],
+                    'timestamp': candle['timestamp'],
+                    'open': Decimal(str(candle['open'])),
+                    'high': Decimal(str(candle['high'])),
+                    'low': Decimal(str(candle['low'])),
+                    'close': Decimal(str(candle['close'])),
+                    'last_price': Decimal(str(candle['close'])),
+                    'volume': candle['volume'],
+                    'last_update_time': now
+                }
+                for candle in hourly_candles
+                if candle['timestamp'] not in existing
+            ]
+            
+            bulk_insert(session, NiftyIndexDataHourly, rows)
+        
+        logger.info(f"Stored {len(rows)} hourly candles")
+        return len(rows)
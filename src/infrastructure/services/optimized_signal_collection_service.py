@@ -13,6 +13,23 @@ from .data_collection_service import DataCollectionService
 
 logger = logging.getLogger(__name__)
 
+MISSING_STRIKES_QUERY = text("""
+    SELECT 
+        WeekStartDate,
+        SignalType,
+        WeeklyBias,
+        MainStrikePrice,
+        OptionType as MainOptionType,
+        MissingOptionStrikes,
+        WeeklyExpiryDate
+    FROM vw_SignalInsightsWithMissingStrikes
+    WHERE WeekStartDate >= :start_date
+      AND WeekStartDate <= :end_date
+      AND SignalType IS NOT NULL
+      AND MissingOptionStrikes IS NOT NULL
+    ORDER BY WeekStartDate
+""")
+
 
 class OptimizedSignalCollectionService:
     """Optimized version that reads pre-calculated missing strikes"""
@@ -87,24 +104,7 @@ class OptimizedSignalCollectionService:
         with self.db_manager.get_session() as session:
             try:
                 # First, try to use a materialized view if it exists
-                query = text("""
-                    SELECT 
-                        WeekStartDate,
-                        SignalType,
-                        WeeklyBias,
-                        MainStrikePrice,
-                        OptionType as MainOptionType,
-                        MissingOptionStrikes,
-                        WeeklyExpiryDate
-                    FROM vw_SignalInsightsWithMissingStrikes
-                    WHERE WeekStartDate >= :start_date
-                      AND WeekStartDate <= :end_date
-                      AND SignalType IS NOT NULL
-                      AND MissingOptionStrikes IS NOT NULL
-                    ORDER BY WeekStartDate
-                """)
-                
-                result = session.execute(query, {"start_date": from_date, "end_date": to_date})
+                result = session.execute(MISSING_STRIKES_QUERY, {"start_date": from_date, "end_date": to_date})
                 rows = result.fetchall()
                 
                 if not rows:
@@ -4,7 +4,7 @@ Service for calculating option prices and managing option data
 """
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
 
 from ..database.models import OptionsHistoricalData
 from .data_collection_service import DataCollectionService
@@ -86,6 +86,35 @@ class OptionPricingService:
             timestamp, strike, option_type, expiry
         )
         
+        return self._price_from(option_data, timestamp, strike, option_type)
+    
+    async def get_option_prices_at_time(
+        self,
+        timestamp: datetime,
+        legs: List[Tuple[int, str]],
+        expiry: datetime
+    ) -> Dict[Tuple[int, str], Optional[float]]:
+        """
+        Get prices for several (strike, option_type) legs of one expiry at a timestamp with a single query
+        
+        Returns:
+            Price (or None if not found) per leg
+        """
+        option_data = await self.data_collection.get_options_data_batch(timestamp, legs, expiry)
+        
+        return {
+            (strike, option_type): self._price_from(option_data[(strike, option_type)], timestamp, strike, option_type)
+            for strike, option_type in legs
+        }
+    
+    def _price_from(
+        self,
+        option_data: Optional[OptionsHistoricalData],
+        timestamp: datetime,
+        strike: int,
+        option_type: str
+    ) -> Optional[float]:
+        """Mid price when both quotes exist, else last price"""
         if option_data:
             # Use mid price between bid and ask if available
             if option_data.bid_price and option_data.ask_price:
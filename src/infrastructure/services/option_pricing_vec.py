@@ -0,0 +1,113 @@
+"""
+Vectorized Option Pricing
+Black-Scholes prices for whole arrays of contracts in a single call
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Abramowitz and Stegun formula 7.1.26, the same normal CDF as BlackScholesPriceCalculator._normal_cdf
+A1 = 0.254829592
+A2 = -0.284496736
+A3 = 1.421413741
+A4 = -1.453152027
+A5 = 1.061405429
+P = 0.3275911
+SQRT2 = math.sqrt(2.0)
+
+
+def _cnd(d: np.ndarray) -> np.ndarray:
+    """Standard normal CDF for an array"""
+    sign = np.where(d >= 0, 1.0, -1.0)
+    x = np.abs(d) / SQRT2
+    t = 1.0 / (1.0 + P * x)
+    y = 1.0 - (((((A5 * t + A4) * t) + A3) * t + A2) * t + A1) * t * np.exp(-x * x)
+    return 0.5 * (1.0 + sign * y)
+
+
+def _price_numpy(S, K, T, r, sigma, q, is_call, out):
+    """Black-Scholes over arrays; expired or zero-volatility contracts take intrinsic value"""
+    valid = (T > 0) & (sigma > 0)
+    safe_t = np.where(valid, T, 1.0)
+    safe_sigma = np.where(valid, sigma, 1.0)
+
+    sqrt_t = np.sqrt(safe_t)
+    d1 = (np.log(S / K) + (r - q + 0.5 * safe_sigma * safe_sigma) * safe_t) / (safe_sigma * sqrt_t)
+    d2 = d1 - safe_sigma * sqrt_t
+    discounted_spot = S * np.exp(-q * safe_t)
+    discounted_strike = K * np.exp(-r * safe_t)
+
+    call = discounted_spot * _cnd(d1) - discounted_strike * _cnd(d2)
+    put = discounted_strike * _cnd(-d2) - discounted_spot * _cnd(-d1)
+    intrinsic = np.where(is_call, S - K, K - S)
+
+    np.maximum(np.where(valid, np.where(is_call, call, put), intrinsic), 0.0, out=out)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _cnd_scalar(d):
+        sign = 1.0 if d >= 0 else -1.0
+        x = abs(d) / SQRT2
+        t = 1.0 / (1.0 + P * x)
+        y = 1.0 - (((((A5 * t + A4) * t) + A3) * t + A2) * t + A1) * t * math.exp(-x * x)
+        return 0.5 * (1.0 + sign * y)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _price_kernel(S, K, T, r, sigma, q, is_call, out):
+        for i in prange(S.shape[0]):
+            if T[i] <= 0.0 or sigma[i] <= 0.0:
+                price = S[i] - K[i] if is_call[i] else K[i] - S[i]
+            else:
+                sqrt_t = math.sqrt(T[i])
+                d1 = (math.log(S[i] / K[i]) + (r[i] - q[i] + 0.5 * sigma[i] * sigma[i]) * T[i]) / (sigma[i] * sqrt_t)
+                d2 = d1 - sigma[i] * sqrt_t
+                discounted_spot = S[i] * math.exp(-q[i] * T[i])
+                discounted_strike = K[i] * math.exp(-r[i] * T[i])
+                if is_call[i]:
+                    price = discounted_spot * _cnd_scalar(d1) - discounted_strike * _cnd_scalar(d2)
+                else:
+                    price = discounted_strike * _cnd_scalar(-d2) - discounted_spot * _cnd_scalar(-d1)
+            out[i] = price if price > 0.0 else 0.0
+
+
+def price_batch(S, K, T, r, sigma, is_call, q=0.0) -> np.ndarray:
+    """
+    Price many European options at once
+
+    Args:
+        S: Spot prices
+        K: Strike prices
+        T: Times to expiry in years
+        r: Risk-free rates
+        sigma: Annualized volatilities
+        is_call: True for calls, False for puts
+        q: Continuous dividend yields
+
+    Scalars broadcast against arrays. Returns a float64 array of prices.
+    """
+    S, K, T, r, sigma, q, is_call = np.broadcast_arrays(S, K, T, r, sigma, q, is_call)
+    shape = S.shape
+
+    S = np.ascontiguousarray(S, dtype=np.float64).ravel()
+    K = np.ascontiguousarray(K, dtype=np.float64).ravel()
+    T = np.ascontiguousarray(T, dtype=np.float64).ravel()
+    r = np.ascontiguousarray(r, dtype=np.float64).ravel()
+    sigma = np.ascontiguousarray(sigma, dtype=np.float64).ravel()
+    q = np.ascontiguousarray(q, dtype=np.float64).ravel()
+    is_call = np.ascontiguousarray(is_call, dtype=np.bool_).ravel()
+
+    out = np.empty(S.shape[0], dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        _price_kernel(S, K, T, r, sigma, q, is_call, out)
+    else:
+        _price_numpy(S, K, T, r, sigma, q, is_call, out)
+
+    return out.reshape(shape)
@@ -9,6 +9,7 @@ from typing import Optional, Dict, Any
 
 from ...domain.services.iprice_calculator import IPriceCalculator
 from ...domain.entities.option import Option, OptionType
+from .option_pricing_vec import price_batch
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +93,21 @@ class BlackScholesPriceCalculator(IPriceCalculator):
             intrinsic = self.calculate_intrinsic_value(spot_price, strike_price, is_call)
             return intrinsic
     
+    def calculate_option_prices(
+        self,
+        spot_prices,
+        strike_prices,
+        times_to_expiry,  # in years
+        volatilities,  # annualized
+        risk_free_rate,
+        is_call,
+        dividend_yields=0.0
+    ):
+        """Batch form of calculate_option_price over float arrays"""
+        return price_batch(
+            spot_prices, strike_prices, times_to_expiry, risk_free_rate, volatilities, is_call, dividend_yields
+        )
+    
     def calculate_implied_volatility(
         self,
         option_price: Decimal,
@@ -13,6 +13,12 @@ from .data_collection_service import DataCollectionService
 
 logger = logging.getLogger(__name__)
 
+SIGNAL_INSIGHTS_QUERY = text("""
+    EXEC sp_GetWeeklySignalInsights 
+    @StartDate = :start_date,
+    @EndDate = :end_date
+""")
+
 
 class SignalBasedCollectionService:
     """Service for collecting option data based on detected signals"""
@@ -93,11 +99,7 @@ class SignalBasedCollectionService:
             try:
                 # Execute stored procedure
                 result = session.execute(
-                    text("""
-                        EXEC sp_GetWeeklySignalInsights 
-                        @StartDate = :start_date,
-                        @EndDate = :end_date
-                    """),
+                    SIGNAL_INSIGHTS_QUERY,
                     {"start_date": from_date, "end_date": to_date}
                 )
                 
@@ -6,6 +6,8 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 import pytz
 
+from .market_hours import MARKET_OPEN, MARKET_CLOSE
+
 
 # Indian Standard Time
 IST = pytz.timezone('Asia/Kolkata')
@@ -33,7 +35,7 @@ def get_market_open_utc(date: datetime) -> datetime:
     # Create IST time for 9:15 AM
     market_open_ist = IST.localize(datetime.combine(
         date.date() if hasattr(date, 'date') else date,
-        datetime.strptime("09:15", "%H:%M").time()
+        MARKET_OPEN
     ))
     # Convert to UTC (will be 3:45 AM UTC)
     return market_open_ist.astimezone(UTC)
@@ -44,7 +46,7 @@ def get_market_close_utc(date: datetime) -> datetime:
     # Create IST time for 3:30 PM
     market_close_ist = IST.localize(datetime.combine(
         date.date() if hasattr(date, 'date') else date,
-        datetime.strptime("15:30", "%H:%M").time()
+        MARKET_CLOSE
     ))
     # Convert to UTC (will be 10:00 AM UTC)
     return market_close_ist.astimezone(UTC)
@@ -60,11 +62,7 @@ def is_market_hours_utc(timestamp: datetime) -> bool:
         return False
     
     # Check time
-    time_only = ist_time.time()
-    market_open = datetime.strptime("09:15", "%H:%M").time()
-    market_close = datetime.strptime("15:30", "%H:%M").time()
-    
-    return market_open <= time_only <= market_close
+    return MARKET_OPEN <= ist_time.time() <= MARKET_CLOSE
 
 
 def get_hourly_candles_utc(date: datetime) -> list[tuple[datetime, datetime]]:
@@ -0,0 +1,63 @@
+"""
+Tests for BlackScholesPriceCalculator batch pricing
+"""
+from decimal import Decimal
+from itertools import product
+
+import numpy as np
+import pytest
+
+from src.infrastructure.services.price_calculator_service import BlackScholesPriceCalculator
+
+
+SPOTS = [24500.0, 25000.0, 25500.0]
+STRIKES = [24800.0, 25000.0, 25200.0]
+TIMES = [0.0, -0.01, 1 / 365, 7 / 365, 0.25]
+VOLATILITIES = [0.0, 0.12, 0.35]
+DIVIDEND_YIELDS = [0.0, 0.015]
+RISK_FREE_RATE = 0.065
+
+
+@pytest.fixture
+def calculator():
+    return BlackScholesPriceCalculator()
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_batch_prices_match_scalar_prices(calculator, is_call):
+    grid = list(product(SPOTS, STRIKES, TIMES, VOLATILITIES, DIVIDEND_YIELDS))
+    spots, strikes, times, volatilities, dividend_yields = (np.array(column) for column in zip(*grid))
+
+    batch = calculator.calculate_option_prices(
+        spots, strikes, times, volatilities, RISK_FREE_RATE, is_call, dividend_yields
+    )
+
+    expected = [
+        float(calculator.calculate_option_price(
+            Decimal(str(spot)), Decimal(str(strike)), Decimal(str(time_to_expiry)),
+            Decimal(str(volatility)), Decimal(str(RISK_FREE_RATE)), is_call, Decimal(str(dividend_yield))
+        ))
+        for spot, strike, time_to_expiry, volatility, dividend_yield in grid
+    ]
+
+    assert batch.tolist() == pytest.approx(expected, rel=1e-9, abs=1e-8)
+
+
+def test_expired_and_zero_volatility_contracts_take_intrinsic_value(calculator):
+    prices = calculator.calculate_option_prices(
+        [25300.0, 25300.0, 24700.0, 24700.0],
+        [25000.0, 25000.0, 25000.0, 25000.0],
+        [0.0, 0.1, 0.0, 0.1],
+        [0.2, 0.0, 0.2, 0.0],
+        RISK_FREE_RATE,
+        [True, True, True, False]
+    )
+
+    assert prices.tolist() == [300.0, 300.0, 0.0, 300.0]
+
+
+def test_dividend_yield_defaults_to_zero(calculator):
+    without_yield = calculator.calculate_option_prices(25000.0, 25000.0, 0.1, 0.15, RISK_FREE_RATE, True)
+    zero_yield = calculator.calculate_option_prices(25000.0, 25000.0, 0.1, 0.15, RISK_FREE_RATE, True, 0.0)
+
+    assert float(without_yield) == float(zero_yield)